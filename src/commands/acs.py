@@ -2,7 +2,14 @@ from pathlib import Path
 import typer
 from typing import Annotated
 from src.core.algorithms.AntColonySystem import AntColonySystem
-from src.utils.tsp_parser import parse_tsp_file
+from src.utils.tsp_parser import read_tsplib
+from src.utils.instance_cache import load_tsp
+from src.core.termination import build_termination
+from src.commands.options import (TimeLimitOption, MaxEvaluationsOption, TargetOption,
+                                  ToleranceOption, StagnationOption, CheckpointOption,
+                                  CheckpointIntervalOption, ResumeOption, make_checkpointer,
+                                  ProfileOption, make_profiler, TraceOption)
+from src.core.trace import TraceRecorder
 
 app = typer.Typer()
 
@@ -11,7 +18,7 @@ def ant_colony_system(
     filename: Annotated[
         Path,
         typer.Argument(
-            help="Ruta al archivo con las coordenadas de las ciudades.",
+            help="Ruta al archivo TSPLIB con las coordenadas o distancias de las ciudades.",
             resolve_path=True,
             exists=True,
             file_okay=True,
@@ -46,13 +53,44 @@ def ant_colony_system(
         typer.Argument(
             help="Probabilidad de elegir el mejor camino (explotación).")
     ],
+    cache: Annotated[
+        bool,
+        typer.Option(
+            "--cache",
+            help="Usa la caché binaria de instancias (coordenadas y matriz de distancias).",
+            is_flag=True)
+    ] = False,
+    time_limit: TimeLimitOption = None,
+    max_evaluations: MaxEvaluationsOption = None,
+    target: TargetOption = None,
+    tolerance: ToleranceOption = 0.0,
+    stagnation: StagnationOption = None,
+    checkpoint: CheckpointOption = None,
+    checkpoint_interval: CheckpointIntervalOption = 60.0,
+    resume: ResumeOption = False,
+    profile: ProfileOption = False,
+    trace: TraceOption = None,
 ):
     """Solucionador del problema del agente viajero usando el sistema de colonia de hormigas.
     """
 
-    # Parsear el archivo TSP para obtener las coordenadas de las ciudades
-    path = parse_tsp_file(filename)
+    checkpointer = make_checkpointer(checkpoint, checkpoint_interval, resume)
 
+    # Parsear el archivo TSP para obtener las coordenadas de las ciudades y
+    # la matriz de distancias según su EDGE_WEIGHT_TYPE
+    if cache:
+        path, distances = load_tsp(filename)
+    else:
+        instance = read_tsplib(filename)
+        path, distances = instance["coordinates"], instance["distances"]
+
+    termination = build_termination(
+        time_limit, max_evaluations, target, tolerance, stagnation, minimize=True)
     acs = AntColonySystem(seed, ant_colony_size, alpha,
-                          beta, q0, iterations, path)
+                          beta, q0, iterations, path, distances=distances,
+                          termination=termination, checkpoint=checkpointer,
+                          profiler=make_profiler(profile),
+                          trace=TraceRecorder() if trace is not None else None)
     acs.start()
+    if trace is not None:
+        acs.trace.save(trace)
@@ -0,0 +1,90 @@
+import json
+import sys
+import typer
+from pathlib import Path
+from typing import Annotated, Any, Optional, TextIO
+
+app = typer.Typer()
+
+
+def read_jobs(path: Path) -> list[dict[str, Any]]:
+    """Lee un archivo JSONL (un conjunto de parámetros por línea) o un arreglo JSON."""
+    text = path.read_text()
+    if text.lstrip().startswith("["):
+        return json.loads(text)
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def write_line(output: TextIO, index: int, params: dict[str, Any], **fields: Any) -> None:
+    from src.core.sweep_tasks import json_default
+
+    output.write(json.dumps({"index": index, "params": params, **fields},
+                            default=json_default) + "\n")
+    output.flush()
+
+
+@app.command(name="batch")
+def batch(
+    jobs_file: Annotated[
+        Path,
+        typer.Argument(
+            help="Archivo JSONL con un trabajo por línea, p. ej. "
+                 '{"solver": "n-queen", "seed": 1, "n": 8, "population_size": 100, '
+                 '"crossover_rate": 0.8, "mutation_rate": 0.1, "iterations": 1000}. '
+                 "Los parámetros de cada solucionador son los de src/core/sweep_tasks.py.",
+            resolve_path=True,
+            exists=True,
+            file_okay=True,
+            dir_okay=False)
+    ],
+    output: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--output",
+            "-o",
+            help="Archivo JSONL de resultados (por defecto la salida estándar).",
+            resolve_path=True,
+            dir_okay=False)
+    ] = None,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            "-w",
+            help="Número de procesos. Con 1 todo se ejecuta en el proceso actual.",
+            min=1)
+    ] = 1,
+):
+    """Ejecuta muchos trabajos en un solo proceso para no pagar el arranque del intérprete en cada uno.
+    """
+    from src.core.sweep import run_sweep
+    from src.core.sweep_tasks import solver_task
+
+    jobs = read_jobs(jobs_file)
+    out = open(output, "w") if output is not None else sys.stdout
+    failed = 0
+    try:
+        if workers == 1:
+            for index, params in enumerate(jobs):
+                try:
+                    write_line(out, index, params, result=solver_task(params))
+                except Exception as exc:
+                    failed += 1
+                    write_line(out, index, params, error=repr(exc))
+        else:
+            def on_error(index, params, exc):
+                nonlocal failed
+                failed += 1
+                write_line(out, index, params, error=repr(exc))
+
+            run_sweep(solver_task, jobs,
+                      on_result=lambda index, params, result: write_line(
+                          out, index, params, result=result),
+                      on_error=on_error, workers=workers, chunksize=1)
+    finally:
+        if output is not None:
+            out.close()
+
+    if failed:
+        print(f"{failed} de {len(jobs)} trabajos fallaron.", file=sys.stderr)
+        raise typer.Exit(code=1)
@@ -0,0 +1,104 @@
+import typer
+from pathlib import Path
+from typing import Annotated, Any, Optional
+from src.core.benchmark import (compare_reports, default_cases, load_report,
+                                run_benchmark, save_report)
+
+app = typer.Typer()
+
+
+def _format(value: float | None, digits: int = 1, unit: str = "") -> str:
+    return "-" if value is None else f"{value:,.{digits}f}{unit}"
+
+
+def print_summary(row: dict[str, Any]) -> None:
+    print(f"{row['case']:<32} it/s {_format(row['iterations_per_sec']):>12}   "
+          f"evals/s {_format(row['evaluations_per_sec']):>12}   "
+          f"objetivo {_format(row['time_to_target'], 3, 's'):>9}   "
+          f"memoria {_format(row['peak_rss_mb'], 1, ' MB')}")
+
+
+@app.command(name="bench")
+def bench(
+    data: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--data",
+            "-d",
+            help="Carpeta con instancias TSPLIB (*.tsp) y de la mochila (knapPI_*).",
+            resolve_path=True,
+            exists=True,
+            file_okay=False,
+            dir_okay=True)
+    ] = None,
+    output: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--output",
+            "-o",
+            help="Archivo JSON donde se guardan los resultados.",
+            resolve_path=True,
+            dir_okay=False)
+    ] = None,
+    compare: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--compare",
+            help="Reporte JSON de referencia (p. ej. de otro commit) con el que comparar.",
+            resolve_path=True,
+            exists=True,
+            dir_okay=False)
+    ] = None,
+    repeat: Annotated[
+        int,
+        typer.Option(
+            "--repeat",
+            "-r",
+            help="Repeticiones por caso; se reporta la mediana.",
+            min=1)
+    ] = 3,
+    quick: Annotated[
+        bool,
+        typer.Option(
+            "--quick",
+            help="Usa tamaños y presupuestos reducidos.",
+            is_flag=True)
+    ] = False,
+    only: Annotated[
+        Optional[str],
+        typer.Option(
+            "--only",
+            help="Ejecuta solo los casos cuyo nombre contiene este texto (p. ej. 'acs/').")
+    ] = None,
+    threshold: Annotated[
+        float,
+        typer.Option(
+            "--threshold",
+            help="Empeoramiento relativo tolerado al comparar antes de reportar una regresión.",
+            min=0)
+    ] = 0.10,
+):
+    """Mide iteraciones/s, evaluaciones/s, tiempo al objetivo y memoria de cada solucionador.
+    """
+    cases = default_cases(data, quick=quick)
+    if only is not None:
+        cases = [case for case in cases if only in case.name]
+    if not cases:
+        raise typer.BadParameter("No hay casos para ejecutar.", param_hint="--only")
+
+    report = run_benchmark(cases, repeat=repeat, on_case=print_summary)
+    if output is not None:
+        save_report(report, output)
+
+    if compare is None:
+        return
+
+    rows = compare_reports(load_report(compare), report, threshold)
+    print("\n=== COMPARACIÓN ===")
+    for row in rows:
+        mark = "REGRESIÓN" if row["regression"] else ""
+        print(f"{row['case']:<32} {row['metric']:<20} {_format(row['baseline'], 3):>12} -> "
+              f"{_format(row['current'], 3):>12} ({row['change']:+.1%}) {mark}")
+
+    if any(row["regression"] for row in rows):
+        raise typer.Exit(code=1)
@@ -1,13 +1,233 @@
 import typer
 from pathlib import Path
 import numpy as np
-from typing import Annotated, Optional
-from src.utils.knapack_parser import knapack_parser
-from src.core.algorithms.ExtremeOptimization import ExtremeOptimization
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, replace
+from itertools import chain
+from typing import Annotated, Any, Iterable, Iterator, Optional, TextIO
+from src.utils.knapack_parser import iter_knapack_instances, KnapdackData
+from src.utils.instance_cache import load_knapsack
+from src.core.algorithms.ExtremeOptimization import ExtremeOptimization, INITIALIZERS
+from src.core.algorithms.BatchExtremeOptimization import BatchExtremeOptimization
+from src.core.algorithms.RestartManager import RestartManager
+from src.core.termination import Termination, build_termination
+from src.core.checkpoint import Checkpointer
+from src.core.profiling import Profiler, format_report
+from src.problems.knapsack.bounds import KnapsackBounds, knapsack_bounds
+from src.commands.options import (StagnationOption, CheckpointIntervalOption, ResumeOption,
+                                  make_checkpointer, ProfileOption)
 
 app = typer.Typer()
 
 
+def check_repair(value: str | None) -> str | None:
+    if value not in (None, "rank", "efficiency"):
+        raise typer.BadParameter("Debe ser 'rank' o 'efficiency'.")
+    return value
+
+
+def check_initializer(value: str) -> str:
+    if value not in INITIALIZERS:
+        raise typer.BadParameter(f"Debe ser uno de: {', '.join(INITIALIZERS)}.")
+    return value
+
+
+def bound_columns(bounds: KnapsackBounds | None, precio: int) -> dict[str, Any]:
+    if bounds is None:
+        return {"bound": None, "bound_exact": None, "gap": None}
+    return {"bound": bounds.upper, "bound_exact": bounds.exact, "gap": bounds.gap(precio)}
+
+
+@dataclass(frozen=True)
+class RunOptions:
+    """Opciones comunes a todas las ejecuciones de un llamado a `eo`.
+
+    Attributes:
+        iterations: Número máximo de iteraciones.
+        tau: Parámetro tau para la selección de componentes.
+        termination: Criterios de término adicionales.
+        checkpoint: Si se indica, su ruta es la carpeta donde se guarda un
+            archivo por cada par (instancia, semilla).
+        profile: Si es True, la fila incluye el reporte del perfilador.
+        gap: Con cotas, gap relativo respecto a la cota superior con el que
+            se detiene la ejecución.
+        repair: Método de reparación de soluciones infactibles (ver
+            `ExtremeOptimization.reparar_solucion`).
+        initializer: Método de la solución inicial.
+        chains: Con más de una, se avanzan esa cantidad de cadenas a la vez
+            con `BatchExtremeOptimization` y se reporta la mejor.
+    """
+    iterations: int
+    tau: float
+    termination: Termination | None = None
+    checkpoint: Checkpointer | None = None
+    profile: bool = False
+    gap: float = 0.0
+    repair: str | None = None
+    initializer: str = "random"
+    chains: int = 1
+
+
+def solver_params(instance: KnapdackData, seed: int, options: RunOptions,
+                  bounds: KnapsackBounds | None) -> dict[str, Any]:
+    """Argumentos de `ExtremeOptimization` comunes a todos los modos."""
+    return dict(
+        seed=seed,
+        n_items=instance["n"],
+        capacidad=instance["c"],
+        tau=options.tau,
+        precios=np.array(instance["precios"], dtype=np.int32),
+        pesos=np.array(instance["pesos"], dtype=np.int32),
+        max_iterations=options.iterations,
+        optimal_solution=instance["z"],
+        termination=options.termination,
+        upper_bound=bounds.upper if bounds is not None else None,
+        gap_tolerance=options.gap,
+        initializer=options.initializer,
+    )
+
+
+def solve_instance(instance: KnapdackData, seed: int, options: RunOptions,
+                   bounds: KnapsackBounds | None = None) -> dict[str, Any]:
+    """Resuelve una instancia y retorna la fila de resultados.
+
+    Se define a nivel de módulo para poder enviarla a los procesos del pool.
+    Con `bounds` (las cotas de la instancia, ver
+    `src.problems.knapsack.bounds`) la ejecución se detiene al quedar a lo
+    más a `options.gap` de la cota superior.
+    """
+    profiler = Profiler() if options.profile else None
+    params = dict(solver_params(instance, seed, options, bounds), profiler=profiler)
+    if options.chains > 1:
+        optimizer = BatchExtremeOptimization(chains=options.chains, **params)
+    else:
+        checkpoint = options.checkpoint
+        if checkpoint is not None:
+            checkpoint = replace(
+                checkpoint, path=checkpoint.path / f"{instance['title']}_s{seed}.npz")
+        optimizer = ExtremeOptimization(checkpoint=checkpoint, repair=options.repair, **params)
+
+    _, precio_mejor_sol = optimizer.start()
+    return {
+        "title": instance["title"],
+        "seed": seed,
+        "iterations": optimizer.iterations,
+        "n": instance["n"],
+        "c": instance["c"],
+        "precio": int(precio_mejor_sol),
+        "z": instance["z"],
+        **bound_columns(bounds, int(precio_mejor_sol)),
+        "profile": profiler.report() if profiler is not None else None,
+    }
+
+
+Job = tuple[KnapdackData, int, KnapsackBounds | None]
+
+
+def instance_bounds(instance: KnapdackData, bound: bool) -> KnapsackBounds | None:
+    if not bound:
+        return None
+    return knapsack_bounds(instance["precios"], instance["pesos"], instance["c"])
+
+
+def instance_jobs(instances: Iterable[KnapdackData], seeds: int, seed: int,
+                  bound: bool) -> Iterator[Job]:
+    """Trabajos (instancia, semilla, cotas); las cotas se calculan una vez por instancia."""
+    for instance in instances:
+        bounds = instance_bounds(instance, bound)
+        for k in range(seeds):
+            yield instance, seed + k, bounds
+
+
+def solve_parallel(jobs: Iterable[Job], options: RunOptions,
+                   workers: int) -> Iterator[dict[str, Any]]:
+    """Distribuye los trabajos (instancia, semilla) en un pool de procesos.
+
+    Los resultados se entregan en el mismo orden en que se enviaron los
+    trabajos, aunque terminen en otro orden. Se mantienen a lo más
+    `2 * workers` trabajos en vuelo para no materializar todo el archivo.
+    """
+    max_in_flight = 2 * workers
+    pending: dict = {}
+    done: dict[int, dict[str, Any]] = {}
+    next_to_yield = 0
+    submitted = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        jobs = iter(jobs)
+        exhausted = False
+        while not exhausted or pending:
+            while not exhausted and len(pending) < max_in_flight:
+                job = next(jobs, None)
+                if job is None:
+                    exhausted = True
+                    break
+                instance, seed, bounds = job
+                future = executor.submit(
+                    solve_instance, instance, seed, options, bounds=bounds)
+                pending[future] = submitted
+                submitted += 1
+
+            if not pending:
+                break
+
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                done[pending.pop(future)] = future.result()
+
+            while next_to_yield in done:
+                yield done.pop(next_to_yield)
+                next_to_yield += 1
+
+
+def solve_with_restarts(instance: KnapdackData, seed: int, options: RunOptions,
+                        manager: RestartManager, bound: bool = False) -> dict[str, Any]:
+    """Resuelve una instancia con reinicios en paralelo y retorna el mejor."""
+    bounds = instance_bounds(instance, bound)
+    params = solver_params(instance, seed, options, bounds)
+    result = manager.run(params.pop("seed"), repair=options.repair, **params)
+    return {
+        "title": instance["title"],
+        "seed": result.seed,
+        "iterations": result.iterations,
+        "n": instance["n"],
+        "c": instance["c"],
+        "precio": result.best_price,
+        "z": instance["z"],
+        **bound_columns(bounds, result.best_price),
+        "time_to_target": result.time_to_target,
+    }
+
+
+def report(row: dict[str, Any], output_file: TextIO | None, silent: bool, with_seed: bool, with_bound: bool = False) -> None:
+    if not silent:
+        print(f"Instancia: {row['title']}")
+        if with_seed:
+            print(f"Semilla: {row['seed']}")
+        print(f"Precio mejor solucion encontrada: {row['precio']}")
+        if row["z"] is not None:
+            print(f"Precio solucion optima: {row['z']}")
+            print(f"Diferencia: {row['precio'] - row['z']}")
+        else:
+            print("Precio solucion optima: desconocido")
+        if row.get("bound") is not None:
+            kind = "óptimo exacto" if row["bound_exact"] else "cota de Dantzig"
+            print(f"Cota superior: {row['bound']} ({kind})")
+            print(f"Gap respecto a la cota: {row['gap']:.2%}")
+        if row.get("time_to_target") is not None:
+            print(f"Tiempo hasta el óptimo: {row['time_to_target']:.3f}s")
+        print("--------------------------------------------------")
+    if output_file:
+        z, diff = ("", "") if row["z"] is None else (row["z"], row["precio"] - row["z"])
+        line = f"{row['title']},{row['iterations']},{row['n']},{row['c']},{row['precio']},{z},{diff}"
+        if with_bound:
+            line += f",{row['bound']},{int(row['bound_exact'])},{row['gap']:.6f}"
+        if with_seed:
+            line += f",{row['seed']}"
+        output_file.write(line + "\n")
+        output_file.flush()
+
+
 @app.command(name="eo")
 def extreme_optimization(
     filepath: Annotated[
@@ -52,41 +272,170 @@ def extreme_optimization(
             help="Si se activa, no se imprimen los resultados en consola.",
             is_flag=True
         )
-    ] = False
+    ] = False,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            "-w",
+            help="Número de procesos para resolver instancias en paralelo.",
+            min=1)
+    ] = 1,
+    seeds: Annotated[
+        int,
+        typer.Option(
+            "--seeds",
+            help="Número de semillas por instancia (seed, seed+1, ...). Si es mayor a 1 se agrega la columna Semilla al CSV.",
+            min=1)
+    ] = 1,
+    restarts: Annotated[
+        int,
+        typer.Option(
+            "--restarts",
+            "-r",
+            help="Número de reinicios por instancia ejecutados en paralelo con --workers procesos. Se detienen todos al alcanzar el óptimo.",
+            min=1)
+    ] = 1,
+    time_limit: Annotated[
+        Optional[float],
+        typer.Option(
+            "--time-limit",
+            help="Tiempo máximo en segundos por ejecución (por instancia al usar --restarts).",
+            min=0)
+    ] = None,
+    cache: Annotated[
+        bool,
+        typer.Option(
+            "--cache",
+            help="Usa la caché binaria de instancias en lugar de parsear el archivo.",
+            is_flag=True)
+    ] = False,
+    stagnation: StagnationOption = None,
+    checkpoint_dir: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--checkpoint",
+            help="Carpeta donde se guarda el estado de cada ejecución (instancia, semilla).",
+            resolve_path=True,
+            file_okay=False,
+            dir_okay=True)
+    ] = None,
+    checkpoint_interval: CheckpointIntervalOption = 60.0,
+    resume: ResumeOption = False,
+    profile: ProfileOption = False,
+    bound: Annotated[
+        bool,
+        typer.Option(
+            "--bound",
+            help="Calcula la cota superior de cada instancia (Dantzig, o el óptimo exacto por "
+                 "programación dinámica si la instancia es pequeña), reporta el gap y se detiene "
+                 "al alcanzarla.",
+            is_flag=True)
+    ] = False,
+    gap: Annotated[
+        float,
+        typer.Option(
+            "--gap",
+            help="Con --bound, gap relativo respecto a la cota superior con el que se detiene (p. ej. 0.01).",
+            min=0,
+            max=1)
+    ] = 0.0,
+    repair: Annotated[
+        Optional[str],
+        typer.Option(
+            "--repair",
+            help="Repara una solución infactible en una sola pasada en vez de quitar un ítem por "
+                 "iteración: 'rank' sortea los ítems con la distribución de rangos de tau "
+                 "(recomendado) y 'efficiency' los quita por eficiencia ascendente.",
+            callback=check_repair)
+    ] = None,
+    initializer: Annotated[
+        str,
+        typer.Option(
+            "--init",
+            help="Solución inicial: 'random' (un ítem al azar), 'greedy' (por eficiencia mientras "
+                 "quepan), 'randomized_greedy' (greedy con eficiencias perturbadas) o 'empty'.",
+            callback=check_initializer)
+    ] = "random",
+    chains: Annotated[
+        int,
+        typer.Option(
+            "--chains",
+            "-k",
+            help="Número de cadenas independientes que avanzan a la vez en un mismo proceso "
+                 "(vectorizadas); se reporta la mejor.",
+            min=1)
+    ] = 1,
 ):
     """Solucionador del problema de la mochila usando optimización extrema.
     """
 
-    instances = knapack_parser(filepath)
-    filename = f"result_eo_n{instances[0]['n']}_i{iterations}_c{instances[0]['c']}_tau{tau}_seed{seed}.csv"
+    if restarts > 1 and seeds > 1:
+        raise typer.BadParameter(
+            "--restarts y --seeds no se pueden combinar.")
+    if restarts > 1 and checkpoint_dir is not None:
+        raise typer.BadParameter(
+            "--restarts y --checkpoint no se pueden combinar.")
+    if restarts > 1 and profile:
+        raise typer.BadParameter(
+            "--restarts y --profile no se pueden combinar.")
+    if chains > 1 and (restarts > 1 or checkpoint_dir is not None or repair is not None):
+        raise typer.BadParameter(
+            "--chains no se puede combinar con --restarts, --checkpoint ni --repair.")
+    checkpointer = make_checkpointer(checkpoint_dir, checkpoint_interval, resume)
+
+    # Las instancias se leen a medida que se resuelven; la primera se
+    # adelanta solo para construir el nombre del archivo de salida.
+    instances = iter(load_knapsack(filepath)) if cache else iter_knapack_instances(filepath)
+    first = next(instances, None)
+    if first is None:
+        raise typer.BadParameter(
+            "El archivo no contiene instancias.", param_hint="FILEPATH")
+    instances = chain([first], instances)
+
+    with_seed = seeds > 1
+    filename = f"result_eo_n{first['n']}_i{iterations}_c{first['c']}_tau{tau}_seed{seed}.csv"
     output_file = open(folder_output / filename,
                        "w") if folder_output is not None else None
     if output_file:
-        output_file.write(
-            "Instancia,Iteraciones,Items,Capacidad,Precio Mejor Solucion,Precio Solucion Optima,Diferencia\n")
+        header = "Instancia,Iteraciones,Items,Capacidad,Precio Mejor Solucion,Precio Solucion Optima,Diferencia"
+        if bound:
+            header += ",Cota Superior,Cota Exacta,Gap"
+        output_file.write(header + (",Semilla\n" if with_seed else "\n"))
 
-    for instance in instances:
-        optimizer = ExtremeOptimization(
-            seed=seed,
-            n_items=instance["n"],
-            capacidad=instance["c"],
-            tau=tau,
-            precios=np.array(instance["precios"], dtype=np.int32),
-            pesos=np.array(instance["pesos"], dtype=np.int32),
-            max_iterations=iterations,
-            optimal_solution=instance["z"]
-        )
+    manager = None
+    if restarts > 1:
+        # El tiempo límite lo controla el RestartManager para todos los reinicios;
+        # su pool de procesos se reutiliza en todas las instancias
+        manager = RestartManager(restarts, workers, time_limit)
+        options = RunOptions(
+            iterations, tau, build_termination(stagnation=stagnation, minimize=False),
+            gap=gap, repair=repair, initializer=initializer)
+        rows = (solve_with_restarts(instance, seed, options, manager, bound)
+                for instance in instances)
+    else:
+        options = RunOptions(
+            iterations, tau, build_termination(time_limit, stagnation=stagnation, minimize=False),
+            checkpointer, profile, gap, repair, initializer, chains)
+        jobs = instance_jobs(instances, seeds, seed, bound)
+        if workers > 1:
+            rows = solve_parallel(jobs, options, workers)
+        else:
+            rows = (solve_instance(instance, s, options, bounds) for instance, s, bounds in jobs)
+
+    # Los reportes de cada ejecución (posiblemente de otros procesos) se suman
+    profiler = Profiler() if profile else None
+    try:
+        for row in rows:
+            report(row, output_file, silent, with_seed, bound)
+            if profiler is not None:
+                profiler.merge(row["profile"])
+    finally:
+        if manager is not None:
+            manager.close()
 
-        _, precio_mejor_sol = optimizer.start()
-        if not silent:
-            print(f"Instancia: {instance['title']}")
-            print(f"Precio mejor solucion encontrada: {precio_mejor_sol}")
-            print(f"Precio solucion optima: {instance['z']}")
-            print(f"Diferencia: {precio_mejor_sol - instance['z']}")
-            print("--------------------------------------------------")
-        if output_file:
-            output_file.write(
-                f"{instance['title']},{optimizer.iterations},{instance['n']},{instance['c']},{precio_mejor_sol},{instance['z']},{precio_mejor_sol - instance['z']}\n")
+    if profiler is not None:
+        print(format_report(profiler.report()))
 
     if output_file:
         output_file.close()
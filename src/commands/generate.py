@@ -0,0 +1,176 @@
+import typer
+from pathlib import Path
+from typing import Annotated
+from src.utils.generators import (KNAPSACK_KINDS, TSP_KINDS, nqueen_ladder, write_knapsack,
+                                  write_nqueen_ladder, write_tsp)
+
+app = typer.Typer(help="Genera instancias sintéticas reproducibles para medir escalamiento.")
+
+OutputArgument = Annotated[
+    Path,
+    typer.Argument(
+        help="Archivo de salida.",
+        resolve_path=True,
+        dir_okay=False)
+]
+SeedOption = Annotated[
+    int,
+    typer.Option(
+        "--seed",
+        help="Semilla; la misma semilla genera el mismo archivo.")
+]
+
+
+def check_choice(choices):
+    def callback(value: str) -> str:
+        if value not in choices:
+            raise typer.BadParameter(f"Debe ser uno de: {', '.join(choices)}.")
+        return value
+    return callback
+
+
+@app.command(name="tsp")
+def generate_tsp(
+    output: OutputArgument,
+    n: Annotated[
+        int,
+        typer.Argument(
+            help="Número de ciudades.",
+            min=3)
+    ],
+    kind: Annotated[
+        str,
+        typer.Option(
+            "--kind",
+            help="Distribución de las ciudades: 'uniform' o 'clustered' (n/100 centros).",
+            callback=check_choice(TSP_KINDS))
+    ] = "uniform",
+    size: Annotated[
+        int,
+        typer.Option(
+            "--size",
+            help="Lado del cuadrado donde se ubican las ciudades.",
+            min=1)
+    ] = 1_000_000,
+    seed: SeedOption = 1,
+):
+    """Instancia TSPLIB (EUC_2D) de ciudades uniformes o agrupadas."""
+    write_tsp(output, n, seed, kind, size)
+    print(f"{output}: {n} ciudades ({kind})")
+
+
+@app.command(name="knapsack")
+def generate_knapsack(
+    output: OutputArgument,
+    n: Annotated[
+        int,
+        typer.Argument(
+            help="Número de ítems por instancia.",
+            min=1)
+    ],
+    kind: Annotated[
+        str,
+        typer.Option(
+            "--kind",
+            help="Clase de Pisinger: 'uncorrelated', 'weakly_correlated' o 'strongly_correlated'.",
+            callback=check_choice(tuple(KNAPSACK_KINDS)))
+    ] = "uncorrelated",
+    r: Annotated[
+        int,
+        typer.Option(
+            "--range",
+            "-r",
+            help="Rango de los coeficientes: pesos y precios en [1, R].",
+            min=10)
+    ] = 1000,
+    count: Annotated[
+        int,
+        typer.Option(
+            "--count",
+            "-c",
+            help="Instancias en el archivo; la i-ésima usa capacidad i/(count+1) de la suma de pesos.",
+            min=1)
+    ] = 1,
+    exact: Annotated[
+        bool,
+        typer.Option(
+            "--exact/--no-exact",
+            help="Calcula el óptimo z por programación dinámica cuando la instancia es pequeña; "
+                 "si no, z queda desconocido y se anota la cota de Dantzig.")
+    ] = True,
+    seed: SeedOption = 1,
+):
+    """Instancias de la mochila de Pisinger en el formato de `eo`."""
+    for row in write_knapsack(output, n, seed, kind, r, count, exact):
+        z = f"z={row['z']}" if row["z"] is not None else f"z desconocido (cota de Dantzig {row['bound']})"
+        print(f"{row['title']}: n={row['n']} c={row['c']} {z}")
+
+
+@app.command(name="n-queen")
+def generate_nqueen(
+    output: OutputArgument,
+    max_n: Annotated[
+        int,
+        typer.Argument(
+            help="Tamaño máximo del tablero.",
+            min=4)
+    ],
+    min_n: Annotated[
+        int,
+        typer.Option(
+            "--min-n",
+            help="Tamaño mínimo del tablero.",
+            min=4)
+    ] = 8,
+    factor: Annotated[
+        float,
+        typer.Option(
+            "--factor",
+            help="Razón entre tamaños consecutivos.",
+            min=1.01)
+    ] = 2.0,
+    seeds: Annotated[
+        int,
+        typer.Option(
+            "--seeds",
+            help="Semillas por tamaño (seed, seed+1, ...).",
+            min=1)
+    ] = 1,
+    population_size: Annotated[
+        int,
+        typer.Option(
+            "--population-size",
+            help="Tamaño de la población de cada trabajo.",
+            min=2)
+    ] = 100,
+    crossover_rate: Annotated[
+        float,
+        typer.Option(
+            "--crossover-rate",
+            help="Probabilidad de cruzamiento de cada trabajo [0-1].",
+            min=0,
+            max=1)
+    ] = 0.8,
+    mutation_rate: Annotated[
+        float,
+        typer.Option(
+            "--mutation-rate",
+            help="Probabilidad de mutación de cada trabajo [0-1].",
+            min=0,
+            max=1)
+    ] = 0.2,
+    iterations: Annotated[
+        int,
+        typer.Option(
+            "--iterations",
+            help="Número máximo de generaciones de cada trabajo.",
+            min=1)
+    ] = 1000,
+    seed: SeedOption = 1,
+):
+    """Escalera de tamaños de N-Reinas como trabajos JSONL para `batch`."""
+    sizes = nqueen_ladder(max_n, min_n, factor)
+    jobs = write_nqueen_ladder(output, sizes, seeds, seed, population_size=population_size,
+                               crossover_rate=crossover_rate, mutation_rate=mutation_rate,
+                               iterations=iterations)
+    print(f"{output}: {jobs} trabajos, tamaños {sizes}")
@@ -1,10 +1,28 @@
 import typer
 import os
 from src.problems.n_queen.NQueen import NQueen
-from typing import Annotated
+from typing import Annotated, Optional
+from src.core.termination import build_termination
+from src.commands.options import (TimeLimitOption, MaxEvaluationsOption, TargetOption,
+                                  ToleranceOption, StagnationOption, CheckpointOption,
+                                  CheckpointIntervalOption, ResumeOption, make_checkpointer,
+                                  ProfileOption, make_profiler, TraceOption)
 
 app = typer.Typer()
 
+
+def check_steady_state(value: str | None) -> str | None:
+    if value not in (None, "worst", "tournament"):
+        raise typer.BadParameter("Debe ser 'worst' o 'tournament'.")
+    return value
+
+
+def check_duplicates(value: str | None) -> str | None:
+    if value not in (None, "reject", "remutate"):
+        raise typer.BadParameter("Debe ser 'reject' o 'remutate'.")
+    return value
+
+
 @app.command()
 def n_queen(
     seed: Annotated[
@@ -62,8 +80,52 @@ def n_queen(
             ),
         ),
     ],
+    time_limit: TimeLimitOption = None,
+    max_evaluations: MaxEvaluationsOption = None,
+    target: TargetOption = None,
+    tolerance: ToleranceOption = 0.0,
+    stagnation: StagnationOption = None,
+    checkpoint: CheckpointOption = None,
+    checkpoint_interval: CheckpointIntervalOption = 60.0,
+    resume: ResumeOption = False,
+    profile: ProfileOption = False,
+    trace: TraceOption = None,
+    steady_state: Annotated[
+        Optional[str],
+        typer.Option(
+            "--steady-state",
+            help="Modo estacionario: cada hijo reemplaza en el lugar al peor individuo ('worst') "
+                 "o al perdedor de un torneo ('tournament') en vez de regenerar la población.",
+            callback=check_steady_state,
+        ),
+    ] = None,
+    duplicates: Annotated[
+        Optional[str],
+        typer.Option(
+            "--duplicates",
+            help="Elimina hijos repetidos (detectados con un hash de Zobrist) antes de evaluarlos: "
+                 "'reject' los descarta y 'remutate' los vuelve a mutar.",
+            callback=check_duplicates,
+        ),
+    ] = None,
 ):
     """Solucionador del problema de las N-Reinas usando algoritmos genéticos."""
+    elitism = os.getenv("ELITISMO", False)
+    if elitism and steady_state is not None:
+        raise typer.BadParameter("--steady-state no se puede combinar con ELITISMO.",
+                                 param_hint="'--steady-state'")
+    checkpointer = make_checkpointer(checkpoint, checkpoint_interval, resume)
+    termination = build_termination(
+        time_limit, max_evaluations, target, tolerance, stagnation, minimize=True)
+    recorder = None
+    if trace is not None:
+        from src.core.trace import TraceRecorder
+        recorder = TraceRecorder()
     nqueen = NQueen(seed, n, population_size, crossover_rate,
-                    mutation_rate, iterations)
-    nqueen.start(os.getenv("ELITISMO", False))
+                    mutation_rate, iterations, termination, checkpointer,
+                    profiler=make_profiler(profile),
+                    trace=recorder)
+    nqueen.start(elitism, steady_state=steady_state,
+                 duplicates=duplicates)
+    if trace is not None:
+        nqueen.trace.save(trace)
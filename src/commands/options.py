@@ -0,0 +1,112 @@
+"""Opciones de línea de comandos compartidas entre los comandos."""
+
+import typer
+from pathlib import Path
+from typing import Annotated, Optional, TYPE_CHECKING
+from src.core.profiling import Profiler, format_report
+
+if TYPE_CHECKING:
+    from src.core.checkpoint import Checkpointer
+
+TimeLimitOption = Annotated[
+    Optional[float],
+    typer.Option(
+        "--time-limit",
+        help="Tiempo máximo de ejecución en segundos.",
+        min=0)
+]
+
+MaxEvaluationsOption = Annotated[
+    Optional[int],
+    typer.Option(
+        "--max-evaluations",
+        help="Número máximo de evaluaciones de la función objetivo.",
+        min=1)
+]
+
+TargetOption = Annotated[
+    Optional[float],
+    typer.Option(
+        "--target",
+        help="Valor objetivo; la ejecución termina al alcanzarlo (considerando --tolerance).")
+]
+
+ToleranceOption = Annotated[
+    float,
+    typer.Option(
+        "--tolerance",
+        help="Tolerancia absoluta respecto a --target.",
+        min=0)
+]
+
+StagnationOption = Annotated[
+    Optional[int],
+    typer.Option(
+        "--stagnation",
+        help="Termina si el mejor valor no mejora durante este número de iteraciones.",
+        min=1)
+]
+
+CheckpointOption = Annotated[
+    Optional[Path],
+    typer.Option(
+        "--checkpoint",
+        help="Archivo donde se guarda periódicamente el estado del solucionador.",
+        resolve_path=True,
+        dir_okay=False)
+]
+
+CheckpointIntervalOption = Annotated[
+    float,
+    typer.Option(
+        "--checkpoint-interval",
+        help="Segundos entre checkpoints.",
+        min=0)
+]
+
+ResumeOption = Annotated[
+    bool,
+    typer.Option(
+        "--resume",
+        help="Continúa desde el checkpoint indicado con --checkpoint si existe.",
+        is_flag=True)
+]
+
+
+def make_checkpointer(path: Optional[Path], interval: float, resume: bool) -> Optional["Checkpointer"]:
+    """Construye el Checkpointer de las opciones --checkpoint/--checkpoint-interval/--resume."""
+    if path is None:
+        if resume:
+            raise typer.BadParameter(
+                "--resume requiere --checkpoint.", param_hint="--resume")
+        return None
+    from src.core.checkpoint import Checkpointer
+    return Checkpointer(path, interval=interval, resume=resume)
+
+
+ProfileOption = Annotated[
+    bool,
+    typer.Option(
+        "--profile",
+        help="Mide el tiempo de cada fase del solucionador e imprime un resumen al terminar.",
+        is_flag=True)
+]
+
+
+def make_profiler(profile: bool) -> Optional[Profiler]:
+    """Construye un Profiler que imprime su resumen al terminar (si --profile está activo)."""
+    if not profile:
+        return None
+    profiler = Profiler()
+    profiler.on("report", lambda report: print(format_report(report)))
+    return profiler
+
+
+TraceOption = Annotated[
+    Optional[Path],
+    typer.Option(
+        "--trace",
+        help="Guarda la convergencia por iteración (mejor, media, peor, diversidad, tiempo) en CSV o .npz.",
+        resolve_path=True,
+        dir_okay=False)
+]
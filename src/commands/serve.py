@@ -0,0 +1,62 @@
+import typer
+from typing import Annotated
+
+app = typer.Typer()
+
+
+@app.command(name="serve")
+def serve(
+    host: Annotated[
+        str,
+        typer.Option(
+            "--host",
+            help="Dirección en la que escucha el servicio.")
+    ] = "127.0.0.1",
+    port: Annotated[
+        int,
+        typer.Option(
+            "--port",
+            "-p",
+            help="Puerto HTTP.")
+    ] = 8765,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            "-w",
+            help="Número de procesos que resuelven trabajos.",
+            min=1)
+    ] = 1,
+    progress_interval: Annotated[
+        float,
+        typer.Option(
+            "--progress-interval",
+            help="Segundos entre eventos de progreso de cada trabajo.",
+            min=0)
+    ] = 0.5,
+    verbose: Annotated[
+        bool,
+        typer.Option(
+            "--verbose",
+            "-v",
+            help="Registra cada petición HTTP.",
+            is_flag=True)
+    ] = False,
+):
+    """Servicio HTTP local que resuelve trabajos JSON manteniendo las instancias en caché.
+
+    POST /jobs con un trabajo como los de `batch` responde eventos NDJSON
+    (accepted, progress, result/error). GET /health retorna el estado.
+    """
+    from src.core.SolverService import SolverServer, SolverService
+
+    service = SolverService(workers, progress_interval)
+    server = SolverServer((host, port), service, verbose)
+    print(f"Escuchando en http://{host}:{server.server_port} con {workers} procesos")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
@@ -0,0 +1,199 @@
+import json
+import sys
+import typer
+from pathlib import Path
+from typing import Annotated, Any, Optional
+
+app = typer.Typer()
+
+METHODS = ("halving", "f-race")
+
+
+def check_solver(value: str) -> str:
+    from src.core.tuning import BUDGET_KEYS
+
+    if value not in BUDGET_KEYS:
+        raise typer.BadParameter(f"Debe ser uno de: {', '.join(BUDGET_KEYS)}.")
+    return value
+
+
+def check_method(value: str) -> str:
+    from src.core.tuning import has_scipy
+
+    if value not in METHODS:
+        raise typer.BadParameter(f"Debe ser uno de: {', '.join(METHODS)}.")
+    if value == "f-race" and not has_scipy():
+        raise typer.BadParameter("F-race requiere scipy: pip install .[tune] (o pip install scipy).")
+    return value
+
+
+def parse_value(text: str) -> Any:
+    """Interpreta `text` como JSON (números, booleanos, null) o, si no lo es, como texto."""
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return text
+
+
+def parse_assignment(text: str) -> tuple[str, str]:
+    name, sep, value = text.partition("=")
+    if not sep or not name:
+        raise typer.BadParameter(f"Se esperaba nombre=valor, se recibió {text!r}.")
+    return name, value
+
+
+@app.command(name="tune")
+def tune(
+    solver: Annotated[
+        str,
+        typer.Argument(
+            help="Solucionador a ajustar: n-queen, acs o eo.",
+            callback=check_solver)
+    ],
+    param: Annotated[
+        list[str],
+        typer.Option(
+            "--param",
+            "-p",
+            help="Parámetro a ajustar con sus valores, p. ej. -p alpha=0.1,0.3,0.5. "
+                 "Se evalúa el producto cartesiano de todos los -p.")
+    ],
+    fixed: Annotated[
+        Optional[list[str]],
+        typer.Option(
+            "--set",
+            "-s",
+            help="Parámetro fijo, p. ej. -s instance=berlin52.tsp o -s n=16.")
+    ] = None,
+    method: Annotated[
+        str,
+        typer.Option(
+            "--method",
+            "-m",
+            help="'halving' (successive halving) o 'f-race' (requiere scipy: pip install .[tune]).",
+            callback=check_method)
+    ] = "halving",
+    min_budget: Annotated[
+        int,
+        typer.Option(
+            "--min-budget",
+            help="Iteraciones de la primera ronda de successive halving.",
+            min=1)
+    ] = 50,
+    max_budget: Annotated[
+        int,
+        typer.Option(
+            "--max-budget",
+            help="Iteraciones de la última ronda (halving) o de cada ejecución (f-race).",
+            min=1)
+    ] = 1000,
+    eta: Annotated[
+        int,
+        typer.Option(
+            "--eta",
+            help="Halving: fracción 1/eta que sobrevive y factor de aumento del presupuesto.",
+            min=2)
+    ] = 3,
+    seeds: Annotated[
+        int,
+        typer.Option(
+            "--seeds",
+            help="Halving: semillas por configuración en cada ronda.",
+            min=1)
+    ] = 3,
+    max_blocks: Annotated[
+        int,
+        typer.Option(
+            "--max-blocks",
+            help="F-race: máximo de semillas (bloques).",
+            min=2)
+    ] = 20,
+    min_blocks: Annotated[
+        int,
+        typer.Option(
+            "--min-blocks",
+            help="F-race: bloques antes de la primera prueba de Friedman.",
+            min=2)
+    ] = 5,
+    alpha: Annotated[
+        float,
+        typer.Option(
+            "--alpha",
+            help="F-race: nivel de significancia.",
+            min=0,
+            max=1)
+    ] = 0.05,
+    seed: Annotated[
+        int,
+        typer.Option(
+            "--seed",
+            help="Primera semilla; las rondas usan seed, seed+1, ...")
+    ] = 1,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            "-w",
+            help="Número de procesos. Con 1 todo se ejecuta en el proceso actual.",
+            min=1)
+    ] = 1,
+    output: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--output",
+            "-o",
+            help="Archivo JSON con el ranking final y el historial de rondas.",
+            resolve_path=True,
+            dir_okay=False)
+    ] = None,
+):
+    """Ajusta parámetros por carreras: descarta pronto las configuraciones inferiores.
+    """
+    from src.core.sweep import grid
+    from src.core.sweep_tasks import json_default
+    from src.core.tuning import f_race, successive_halving
+
+    ranges = {}
+    for text in param:
+        name, values = parse_assignment(text)
+        ranges[name] = [parse_value(value) for value in values.split(",")]
+    fixed_params = {name: parse_value(value)
+                    for name, value in map(parse_assignment, fixed or [])}
+    configs = list(grid(**ranges))
+
+    def on_round(entry: dict[str, Any]) -> None:
+        print(f"Ronda {entry['round']}: presupuesto {entry['budget']}, "
+              f"{entry['alive']} -> {entry['survivors']} configuraciones, "
+              f"{entry['evaluations']} evaluaciones acumuladas")
+
+    try:
+        if method == "halving":
+            race = successive_halving(solver, configs, fixed_params, min_budget, max_budget, eta,
+                                      seeds, seed, workers, on_round)
+            grid_budget = len(configs) * seeds * max_budget
+        else:
+            race = f_race(solver, configs, fixed_params, max_budget, max_blocks, min_blocks, alpha,
+                          seed, workers, on_round)
+            grid_budget = len(configs) * max_blocks * max_budget
+    except KeyError as exc:
+        print(f"Falta el parámetro {exc} del solucionador (usa -p o -s).", file=sys.stderr)
+        raise typer.Exit(code=1)
+    except (ImportError, ValueError) as exc:
+        print(exc, file=sys.stderr)
+        raise typer.Exit(code=1)
+
+    print(f"\nMejores configuraciones de {len(configs)}:")
+    for i in race.ranking[:5]:
+        print(f"  {race.configs[i]}  costo medio {race.mean_cost(i):.2f} "
+              f"({len(race.costs[i])} ejecuciones de {race.budgets[i]} iteraciones)")
+    print(f"Presupuesto usado: {race.budget_used:,} iteraciones en {race.evaluations} ejecuciones "
+          f"({grid_budget / race.budget_used:.1f}× menos que la grilla completa)")
+
+    if output is not None:
+        ranking = [{"params": race.configs[i], "mean_cost": race.mean_cost(i),
+                    "costs": race.costs[i], "budget": race.budgets[i]} for i in race.ranking]
+        output.write_text(json.dumps(
+            {"solver": solver, "method": method, "fixed": fixed_params, "ranking": ranking,
+             "history": race.history, "evaluations": race.evaluations,
+             "budget_used": race.budget_used, "grid_budget": grid_budget},
+            default=json_default, indent=2))
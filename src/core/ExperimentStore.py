@@ -0,0 +1,189 @@
+import hashlib
+import itertools
+import json
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator
+import numpy as np
+
+Cell = tuple[str, str, dict[str, Any], int | None]
+
+# Celdas cuyo lease se toma en una misma transacción (un solo commit)
+LEASE_BATCH = 256
+
+
+def _canonical(value: Any) -> Any:
+    """Normaliza valores (p. ej. escalares de NumPy) para que el hash sea estable."""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, np.ndarray):
+        value = value.tolist()
+    if isinstance(value, float):
+        return round(value, 12)
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return value
+
+
+def experiment_key(solver: str, instance: str, params: dict[str, Any], seed: int | None) -> str:
+    """Hash canónico de (solver, instancia, parámetros, semilla).
+
+    El orden de los parámetros no importa y los flotantes se redondean para
+    que valores como `np.float64(0.7000000000000001)` y `0.7` coincidan.
+    """
+    payload = json.dumps(
+        [solver, str(instance), _canonical(params), _canonical(seed)],
+        sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass
+class ExperimentStore:
+    """Registro de experimentos de un barrido, persistido en SQLite.
+
+    Cada celda del barrido se identifica con `experiment_key`. Una celda
+    puede estar `running` (con un lease que expira tras `lease_seconds`) o
+    `done`. Al reanudar un barrido, `pending` descarta las celdas
+    terminadas y las que otro proceso tiene en curso con un lease vigente,
+    por lo que un barrido interrumpido continúa donde quedó sin duplicar
+    resultados.
+
+    Usage:
+        store = ExperimentStore("db.sqlite")
+        for key, params in store.pending(cells):
+            ...
+            store.complete(key, result)
+    """
+    path: str
+    lease_seconds: float = 3600.0
+    owner: str = field(default_factory=lambda: f"{time.time_ns()}")
+
+    def __post_init__(self):
+        self.con = sqlite3.connect(self.path, check_same_thread=False)
+        self.con.execute(
+            """CREATE TABLE IF NOT EXISTS experiments (
+                KEY TEXT PRIMARY KEY,
+                SOLVER TEXT,
+                INSTANCE TEXT,
+                PARAMS TEXT,
+                SEED INTEGER,
+                STATUS TEXT,
+                OWNER TEXT,
+                LEASE_UNTIL REAL,
+                RESULT TEXT
+            )"""
+        )
+        self.con.commit()
+
+    def key(self, solver: str, instance: str, params: dict[str, Any], seed: int | None) -> str:
+        return experiment_key(solver, instance, params, seed)
+
+    def status(self, key: str) -> str | None:
+        row = self.con.execute(
+            "SELECT STATUS FROM experiments WHERE KEY = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def is_done(self, key: str) -> bool:
+        return self.status(key) == "done"
+
+    def pending(self, cells: Iterable[Cell], lease: bool = True) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Filtra las celdas que faltan por ejecutar.
+
+        Los leases se toman por bloques de `LEASE_BATCH` celdas, con un
+        solo commit por bloque.
+
+        Args:
+            cells: Iterable de (solver, instancia, parámetros, semilla).
+            lease: Si es True, toma un lease sobre cada celda retornada.
+
+        Returns:
+            Iterador de (clave, parámetros) de las celdas pendientes.
+        """
+        cells = iter(cells)
+        while chunk := list(itertools.islice(cells, LEASE_BATCH)):
+            keys = [self.key(*cell) for cell in chunk]
+            if lease:
+                available = self.acquire_many(list(zip(keys, chunk)))
+            else:
+                available = [self.status(key) != "done" for key in keys]
+            for key, (_, _, params, _), ok in zip(keys, chunk, available):
+                if ok:
+                    yield key, params
+
+    def acquire(self, key: str, solver: str, instance: str, params: dict[str, Any], seed: int | None) -> bool:
+        """Marca la celda como `running` si no está terminada ni tomada por otro."""
+        return self.acquire_many([(key, (solver, instance, params, seed))])[0]
+
+    def acquire_many(self, cells: list[tuple[str, Cell]]) -> list[bool]:
+        """Como `acquire`, para varias celdas (clave, celda) en una sola transacción.
+
+        Returns:
+            list[bool]: Si se tomó el lease de cada celda.
+        """
+        now = time.time()
+        acquired = []
+        with self.con:
+            for key, (solver, instance, params, seed) in cells:
+                cur = self.con.execute(
+                    """INSERT INTO experiments
+                           (KEY, SOLVER, INSTANCE, PARAMS, SEED, STATUS, OWNER, LEASE_UNTIL)
+                       VALUES (?, ?, ?, ?, ?, 'running', ?, ?)
+                       ON CONFLICT(KEY) DO UPDATE
+                           SET OWNER = excluded.OWNER, LEASE_UNTIL = excluded.LEASE_UNTIL
+                       WHERE STATUS != 'done' AND (LEASE_UNTIL < ? OR OWNER = excluded.OWNER)""",
+                    (key, solver, str(instance), json.dumps(_canonical(params), sort_keys=True),
+                     _canonical(seed), self.owner, now + self.lease_seconds, now))
+                acquired.append(cur.rowcount > 0)
+        return acquired
+
+    @staticmethod
+    def mark_done(cur: sqlite3.Cursor, key: str, result: Any = None) -> bool:
+        """Marca la celda como terminada usando un cursor externo, sin hacer commit.
+
+        Permite registrar la celda en la misma transacción que sus
+        resultados (por ejemplo desde un `ResultSink`).
+
+        Returns:
+            bool: False si la celda ya estaba terminada (resultado duplicado).
+        """
+        cur.execute(
+            """UPDATE experiments SET STATUS = 'done', LEASE_UNTIL = NULL, RESULT = ?
+               WHERE KEY = ? AND STATUS != 'done'""",
+            (json.dumps(_canonical(result)) if result is not None else None, key))
+        return cur.rowcount > 0
+
+    def complete(self, key: str, result: Any = None) -> bool:
+        """Marca la celda como terminada.
+
+        Returns:
+            bool: False si la celda ya estaba terminada (resultado duplicado).
+        """
+        done = self.mark_done(self.con.cursor(), key, result)
+        self.con.commit()
+        return done
+
+    def expire_leases(self) -> int:
+        """Libera todos los leases vigentes.
+
+        Útil al reanudar tras una caída, cuando se sabe que ningún otro
+        proceso está ejecutando el barrido.
+
+        Returns:
+            int: Número de celdas liberadas.
+        """
+        cur = self.con.execute(
+            "UPDATE experiments SET LEASE_UNTIL = 0 WHERE STATUS = 'running'")
+        self.con.commit()
+        return cur.rowcount
+
+    def release(self, key: str) -> None:
+        """Libera el lease de una celda que falló para que se pueda reintentar."""
+        self.con.execute(
+            "UPDATE experiments SET LEASE_UNTIL = 0 WHERE KEY = ? AND STATUS != 'done'", (key,))
+        self.con.commit()
+
+    def close(self) -> None:
+        self.con.close()
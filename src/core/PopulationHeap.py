@@ -0,0 +1,63 @@
+import heapq
+
+
+class PopulationHeap:
+    """
+    Índice de una población por fitness (menor es mejor).
+
+    Mantiene dos montículos, uno de mínimos y otro de máximos, con
+    entradas `(fitness, posición, versión)`. Reemplazar un individuo
+    agrega una entrada nueva a cada montículo y deja la anterior
+    obsoleta; las entradas obsoletas se descartan al consultar el mejor
+    o el peor. Así, `best()`, `worst()` y `replace()` cuestan O(log P)
+    amortizado en lugar de ordenar la población completa. Cuando las
+    entradas obsoletas superan a las vigentes los montículos se
+    reconstruyen en O(P).
+
+    `fitness` es la lista de fitness de la población y se actualiza en
+    el lugar con cada `replace()`.
+
+    Usage:
+        index = PopulationHeap(pop_fitness)
+        worst = index.worst()
+        if child_fitness <= pop_fitness[worst]:
+            population[worst] = child
+            index.replace(worst, child_fitness)
+        best_fitness = pop_fitness[index.best()]
+    """
+
+    def __init__(self, fitness: list[float | int]):
+        self.fitness = fitness
+        self._version = [0] * len(fitness)
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._min = [(f, i, self._version[i]) for i, f in enumerate(self.fitness)]
+        self._max = [(-f, i, self._version[i]) for i, f in enumerate(self.fitness)]
+        heapq.heapify(self._min)
+        heapq.heapify(self._max)
+
+    def _top(self, heap: list[tuple[float | int, int, int]]) -> int:
+        version = self._version
+        while heap[0][2] != version[heap[0][1]]:
+            heapq.heappop(heap)
+        return heap[0][1]
+
+    def best(self) -> int:
+        """Posición del individuo de menor fitness."""
+        return self._top(self._min)
+
+    def worst(self) -> int:
+        """Posición del individuo de mayor fitness."""
+        return self._top(self._max)
+
+    def replace(self, position: int, fitness: float | int) -> None:
+        """Asigna un nuevo fitness a `position` (p. ej. al reemplazar al individuo)."""
+        self.fitness[position] = fitness
+        self._version[position] += 1
+        if max(len(self._min), len(self._max)) > 2 * len(self.fitness):
+            self._rebuild()
+            return
+        version = self._version[position]
+        heapq.heappush(self._min, (fitness, position, version))
+        heapq.heappush(self._max, (-fitness, position, version))
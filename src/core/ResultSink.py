@@ -0,0 +1,130 @@
+import json
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+import numpy as np
+
+
+def encode_individual(individual: Iterable[int]) -> bytes:
+    """Codifica una permutación como bytes compactos.
+
+    El primer byte indica el tamaño en bytes de cada gen (1, 2 o 4) y el
+    resto son los genes en little-endian. Una permutación de 100 genes
+    ocupa 101 bytes en lugar de ~400 caracteres de JSON.
+    """
+    array = np.asarray(list(individual), dtype=np.int64)
+    top = int(array.max()) if array.size else 0
+    dtype = np.dtype("<u1") if top < 1 << 8 else np.dtype("<u2") if top < 1 << 16 else np.dtype("<u4")
+    return bytes([dtype.itemsize]) + array.astype(dtype).tobytes()
+
+
+def decode_individual(data: bytes | str) -> list[int]:
+    """Decodifica un individuo guardado con `encode_individual` o como JSON (formato antiguo)."""
+    if isinstance(data, str):
+        return json.loads(data)
+    dtype = {1: "<u1", 2: "<u2", 4: "<u4"}[data[0]]
+    return np.frombuffer(data, dtype=dtype, offset=1).tolist()
+
+
+_CLOSE = object()
+
+
+@dataclass
+class ResultSink:
+    """Escritor de resultados en SQLite con un hilo dedicado.
+
+    Los resultados se reciben por una cola con `put` y un único hilo los
+    escribe llamando a `write(cursor, item)`. Las escrituras se agrupan en
+    transacciones de hasta `batch_size` elementos o `flush_interval`
+    segundos, con la base de datos en modo WAL y `synchronous=NORMAL`, de
+    modo que el costo de cada commit se reparte entre muchos resultados.
+    Las sentencias se preparan una vez y se reutilizan gracias a la caché
+    de sentencias de sqlite3, siempre que `write` use el mismo SQL.
+
+    Usage:
+        def write(cur, item):
+            cur.execute("INSERT INTO results VALUES (?, ?)", item)
+
+        with ResultSink("db.sqlite", write) as sink:
+            sink.put((1, 2))
+    """
+    path: str
+    write: Callable[[sqlite3.Cursor, Any], None]
+    batch_size: int = 500
+    flush_interval: float = 1.0
+    max_queue: int = 10000
+    written: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        self._queue: queue.Queue = queue.Queue(maxsize=self.max_queue)
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(
+            target=self._run, name="ResultSink", daemon=True)
+        self._thread.start()
+
+    def put(self, item: Any) -> None:
+        if self._error is not None:
+            raise self._error
+        self._queue.put(item)
+
+    def close(self) -> None:
+        """Escribe lo pendiente, hace el último commit y detiene el hilo."""
+        if self._thread.is_alive():
+            self._queue.put(_CLOSE)
+            self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self) -> "ResultSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        con = sqlite3.connect(self.path, cached_statements=256)
+        try:
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute("PRAGMA synchronous=NORMAL")
+            cur = con.cursor()
+            uncommitted = 0
+            last_commit = time.monotonic()
+
+            while True:
+                timeout = max(0.0, self.flush_interval -
+                              (time.monotonic() - last_commit))
+                try:
+                    item = self._queue.get(timeout=timeout if uncommitted else None)
+                except queue.Empty:
+                    item = None
+
+                if item is _CLOSE:
+                    break
+                if item is not None:
+                    if not uncommitted:
+                        last_commit = time.monotonic()
+                    self.write(cur, item)
+                    uncommitted += 1
+                    self.written += 1
+
+                if uncommitted and (uncommitted >= self.batch_size or
+                                    time.monotonic() - last_commit >= self.flush_interval):
+                    con.commit()
+                    uncommitted = 0
+                    last_commit = time.monotonic()
+
+            con.commit()
+        except BaseException as exc:
+            self._error = exc
+            # Vaciar la cola para no bloquear a los productores
+            while True:
+                try:
+                    if self._queue.get_nowait() is _CLOSE:
+                        break
+                except queue.Empty:
+                    break
+        finally:
+            con.close()
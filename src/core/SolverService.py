@@ -0,0 +1,213 @@
+import itertools
+import json
+import multiprocessing as mp
+import queue
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from src.core.sweep_tasks import json_default, solver_task
+from src.core.termination import Termination, build_termination
+
+
+# Estado de cada proceso del pool (se asigna en `_init_worker`)
+_progress = None
+_progress_interval = 0.5
+
+
+def _init_worker(progress, interval: float) -> None:
+    global _progress, _progress_interval
+    _progress = progress
+    _progress_interval = interval
+
+
+@dataclass
+class ProgressReporter(Termination):
+    """Criterio que nunca detiene la ejecución; publica el progreso del trabajo
+    cada `interval` segundos en la cola compartida con el proceso principal."""
+    job: int
+    interval: float
+    last: float = field(default=0.0, init=False)
+
+    def start(self) -> None:
+        self.last = time.monotonic()
+
+    def done(self, iteration: int, evaluations: int, best: float) -> bool:
+        now = time.monotonic()
+        if now - self.last >= self.interval:
+            self.last = now
+            _progress.put({"event": "progress", "job": self.job, "iteration": iteration,
+                           "evaluations": evaluations, "best": float(best)})
+        return False
+
+
+def run_job(job: int, params: dict[str, Any]) -> dict[str, Any]:
+    """Ejecuta un trabajo en un proceso del pool.
+
+    Además de los parámetros de la tarea (ver `src.core.sweep_tasks`), acepta
+    `time_limit`, `max_evaluations`, `target`, `tolerance` y `stagnation`.
+    """
+    termination: Termination = ProgressReporter(job, _progress_interval)
+    limits = build_termination(
+        params.get("time_limit"), params.get("max_evaluations"), params.get("target"),
+        params.get("tolerance", 0.0), params.get("stagnation"),
+        minimize=params.get("solver") != "eo")
+    if limits is not None:
+        termination = termination | limits
+
+    start = time.perf_counter()
+    result = solver_task(params, termination)
+    return {**result, "seconds": time.perf_counter() - start}
+
+
+class SolverService:
+    """
+    Pool de procesos de larga vida que resuelve trabajos JSON.
+
+    Cada proceso conserva en caché (LRU) las instancias leídas y las
+    matrices precalculadas (`src.core.sweep_tasks`), por lo que los
+    trabajos sobre las mismas instancias no vuelven a parsear ni a
+    calcular nada. Los eventos de cada trabajo (`accepted`, `progress`,
+    `result` o `error`) se entregan por una cola propia del trabajo.
+
+    Usage:
+        service = SolverService(workers=4)
+        job, events = service.submit({"solver": "eo", ...})
+        while (event := events.get())["event"] not in ("result", "error"):
+            print(event)
+        service.close()
+    """
+
+    def __init__(self, workers: int, progress_interval: float = 0.5):
+        ctx = mp.get_context()
+        self._progress = ctx.Queue()
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=ctx, initializer=_init_worker,
+            initargs=(self._progress, progress_interval))
+        self.workers = workers
+        self._ids = itertools.count(1)
+        self._jobs: dict[int, queue.Queue] = {}
+        self._lock = threading.Lock()
+        self.completed = 0
+        self._router = threading.Thread(
+            target=self._route, name="SolverServiceRouter", daemon=True)
+        self._router.start()
+
+    def submit(self, params: dict[str, Any]) -> tuple[int, queue.Queue]:
+        job = next(self._ids)
+        events: queue.Queue = queue.Queue()
+        events.put({"event": "accepted", "job": job})
+        with self._lock:
+            self._jobs[job] = events
+        future = self._executor.submit(run_job, job, params)
+        future.add_done_callback(lambda f: self._finish(job, f))
+        return job, events
+
+    def _finish(self, job: int, future: Future) -> None:
+        try:
+            event = {"event": "result", "job": job, "result": future.result()}
+        except Exception as exc:
+            event = {"event": "error", "job": job, "error": repr(exc)}
+        # Bajo el lock para que ningún progreso llegue después del resultado
+        with self._lock:
+            events = self._jobs.pop(job)
+            events.put(event)
+            self.completed += 1
+
+    def _route(self) -> None:
+        while (event := self._progress.get()) is not None:
+            with self._lock:
+                events = self._jobs.get(event["job"])
+                if events is not None:
+                    events.put(event)
+
+    def health(self) -> dict[str, Any]:
+        with self._lock:
+            running = len(self._jobs)
+        return {"status": "ok", "workers": self.workers, "running": running,
+                "completed": self.completed}
+
+    def close(self) -> None:
+        self._executor.shutdown(cancel_futures=True)
+        self._progress.put(None)
+        self._router.join()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "SolverServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status: int, payload: dict[str, Any]) -> None:
+        body = json.dumps(payload, default=json_default).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send_json(200, self.server.service.health())
+        else:
+            self._send_json(404, {"error": f"Ruta desconocida: {self.path}"})
+
+    def do_POST(self) -> None:
+        if self.path != "/jobs":
+            self._send_json(404, {"error": f"Ruta desconocida: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            params = json.loads(self.rfile.read(length))
+            if not isinstance(params, dict):
+                raise ValueError("El trabajo debe ser un objeto JSON")
+        except ValueError as exc:
+            self._send_json(400, {"error": f"JSON inválido: {exc}"})
+            return
+
+        stream = params.pop("stream", True)
+        _, events = self.server.service.submit(params)
+
+        if not stream:
+            while (event := events.get())["event"] not in ("result", "error"):
+                pass
+            self._send_json(200 if event["event"] == "result" else 500, event)
+            return
+
+        # Un evento JSON por línea; la respuesta termina al cerrar la conexión
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        while True:
+            event = events.get()
+            try:
+                self.wfile.write(json.dumps(event, default=json_default).encode() + b"\n")
+                self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                # El cliente se fue; el trabajo termina igual en el pool
+                return
+            if event["event"] in ("result", "error"):
+                return
+
+
+class SolverServer(ThreadingHTTPServer):
+    """Servidor HTTP de `SolverService`.
+
+    Endpoints:
+        POST /jobs: Recibe un trabajo JSON (como en `batch`) y responde un
+            stream NDJSON de eventos; con `"stream": false` responde solo
+            el resultado final.
+        GET /health: Estado del servicio.
+    """
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], service: SolverService, verbose: bool = False):
+        super().__init__(address, _Handler)
+        self.service = service
+        self.verbose = verbose
@@ -3,6 +3,19 @@ from dataclasses import dataclass, field
 import numpy as np
 import numpy.typing as npt
 import math
+from src.utils.tsp_parser import euclidean_distance_matrix
+from src.core.termination import Termination
+from src.core.checkpoint import (Checkpointer, State, array_fingerprint, numpy_rng_state,
+                                 restore_numpy_rng_state)
+from src.core.profiling import NULL_PROFILER, Profiler
+from src.core.trace import TraceRecorder
+
+
+def heuristic_matrix(distances: npt.NDArray) -> npt.NDArray:
+    """Heurística η = 1 / d (0 en la diagonal y para distancias nulas)."""
+    heuristics = np.zeros(distances.shape)
+    np.divide(1.0, distances, out=heuristics, where=distances > 0)
+    return heuristics
 
 
 @dataclass
@@ -13,24 +26,37 @@ class AntColonySystem(ABC):
     beta: float
     q0: float
     max_iterations: int
-    nodes: npt.NDArray
+    nodes: npt.NDArray | None
     it: int = 0
-    
+    distances: npt.NDArray | None = None
+    termination: Termination | None = None
+    evaluations: int = 0
+    best_cost: float = math.inf
+    checkpoint: Checkpointer | None = None
+    profiler: Profiler | None = None
+    trace: TraceRecorder | None = None
+    heuristics: npt.NDArray | None = None
+    _fingerprint: str | None = field(default=None, init=False, repr=False)
+
     def __post_init__(self):
         np.random.seed(self.seed)
+        if self.distances is None:
+            self.distances = euclidean_distance_matrix(self.nodes)
 
     def end_condition(self):
-        return self.it == self.max_iterations
+        return self.terminated() or self.it >= self.max_iterations
+
+    def terminated(self) -> bool:
+        """Consulta los criterios de término usando el costo en caché."""
+        return self.termination is not None and self.termination.done(
+            self.it, self.evaluations, self.best_cost)
 
     def roulette(self, values: npt.NDArray) -> int:
         total = np.sum(values)
         pick = np.random.uniform(0, total)
-        current = 0
-        for i, value in enumerate(values):
-            current += value
-            if current > pick:
-                return i
-        return 0
+        # Primer índice cuya suma acumulada supera a `pick`
+        i = int(np.searchsorted(np.cumsum(values), pick, side="right"))
+        return i if i < len(values) else 0
 
     def next_node(self, i: int, visited_mask: npt.NDArray) -> int:
         q = np.random.rand()
@@ -42,11 +68,8 @@ class AntColonySystem(ABC):
         if len(available_nodes) == 0:
             return 0  # No hay nodos disponibles
 
-        # Calcular valores τ * η^β solo para nodos no visitados
-        tau_eta_values = np.array([
-            (self.pheromones[i, j]) * (self.heuristics[i, j] ** self.beta)
-            for j in available_nodes
-        ])
+        # Valores τ * η^β de los nodos no visitados (lectura de una fila de choice_info)
+        tau_eta_values = self.choice_info[i, available_nodes]
 
         if q <= self.q0:
             # Explotación: elegir el mejor nodo disponible
@@ -60,38 +83,88 @@ class AntColonySystem(ABC):
             return available_nodes[self.roulette(tau_eta_values)]
 
     def cost(self, solution: npt.NDArray) -> float:
-        return sum(np.linalg.norm(
-            self.nodes[solution[i]] - self.nodes[solution[i - 1]]) for i in range(len(solution)))
+        return float(np.sum(self.distances[solution, np.roll(solution, 1)]))
 
     def update_local_pheromone(self, i: int, j: int) -> float:
         return (1 - self.alpha) * self.pheromones[i, j] + self.alpha * self.Tij0
 
+    def set_pheromone(self, i: int, j: int, value: float) -> None:
+        """Asigna la feromona de una arista manteniendo `choice_info` al día."""
+        self.pheromones[i, j] = value
+        self.choice_info[i, j] = value * self.heuristics_beta[i, j]
+
+    def update_choice_info(self) -> None:
+        """Recalcula `choice_info` = τ * η^β completo (tras la actualización global)."""
+        np.multiply(self.pheromones, self.heuristics_beta, out=self.choice_info)
+
     def update_global_pheromone(self, best_solution: npt.NDArray) -> npt.NDArray:
         pheromones = (1 - self.alpha) * self.pheromones
-        for i in range(len(self.nodes)):
+        deposit = self.alpha / self.cost(best_solution)
+        for i in range(len(self.distances)):
             j = best_solution[i]
             k = best_solution[i - 1]
-            pheromones[j, k] += self.alpha / self.cost(best_solution)
+            pheromones[j, k] += deposit
         return pheromones
 
     def get_best(self, colony: npt.NDArray):
         return colony[np.argmax([1/self.cost(sol) for sol in colony])]
 
+    def checkpoint_params(self) -> dict:
+        """Parámetros que deben coincidir para reanudar desde un checkpoint."""
+        if self._fingerprint is None:
+            # Se calcula una vez: `maybe_save` consulta los parámetros en cada iteración
+            self._fingerprint = array_fingerprint(self.distances)
+        return {"seed": self.seed, "colony_size": self.colony_size, "alpha": self.alpha,
+                "beta": self.beta, "q0": self.q0, "n": len(self.distances),
+                "instance": self._fingerprint}
+
+    def checkpoint_state(self) -> State:
+        arrays, meta = numpy_rng_state()
+        arrays.update(pheromones=self.pheromones, best_solution=self.best_solution)
+        meta.update(it=self.it, evaluations=self.evaluations,
+                    best_cost=self.best_cost, Tij0=self.Tij0)
+        return arrays, meta
+
+    def restore_state(self, arrays: dict[str, npt.NDArray], meta: dict) -> None:
+        restore_numpy_rng_state(arrays, meta)
+        self.pheromones = arrays["pheromones"]
+        self.best_solution = arrays["best_solution"]
+        self.it = meta["it"]
+        self.evaluations = meta["evaluations"]
+        self.best_cost = meta["best_cost"]
+        self.Tij0 = meta["Tij0"]
+
     def start(self) -> npt.NDArray:
-        n = len(self.nodes)
-        self.best_solution = np.random.permutation(n)
-        self.Tij0 = 1 / (n * self.cost(self.best_solution))
-        self.pheromones = np.full((n, n), self.Tij0, dtype=np.float64)
-
-        # Corregir cálculo de heurísticas
-        self.heuristics = np.zeros((n, n))
-        for i in range(n):
-            for j in range(n):
-                if i != j:
-                    distance = np.linalg.norm(self.nodes[i] - self.nodes[j])
-                    self.heuristics[i, j] = 1 / distance if distance > 0 else 0
+        n = len(self.distances)
+        restored = None
+        if self.checkpoint is not None:
+            restored = self.checkpoint.load("acs", self.checkpoint_params())
 
+        if restored is not None:
+            self.restore_state(*restored)
+        else:
+            self.best_solution = np.random.permutation(n)
+            self.best_cost = self.cost(self.best_solution)
+            self.evaluations = 1
+            self.Tij0 = 1 / (n * self.best_cost)
+            self.pheromones = np.full((n, n), self.Tij0, dtype=np.float64)
+        if self.termination is not None:
+            self.termination.start()
+        if self.trace is not None:
+            self.trace.start()
+            self.trace.record(self.it, self.best_cost)
+
+        if self.heuristics is None:
+            self.heuristics = heuristic_matrix(self.distances)
+        # η^β no cambia durante la ejecución; `heuristics` puede venir de una
+        # caché compartida, así que no se modifica
+        self.heuristics_beta = self.heuristics ** self.beta
+        self.choice_info = np.empty_like(self.pheromones)
+        self.update_choice_info()
+
+        prof = self.profiler if self.profiler is not None else NULL_PROFILER
         while not self.end_condition():
+            t = prof.tic()
             visited = np.zeros((self.colony_size, n), dtype=bool)
             colony = np.full((self.colony_size, n), -1, dtype=int)
 
@@ -108,19 +181,46 @@ class AntColonySystem(ABC):
                     j = self.next_node(current_node, visited[ant])
                     colony[ant, step] = j
                     visited[ant, j] = True
-                    self.pheromones[current_node, j] = self.update_local_pheromone(
-                        current_node, j)
+                    self.set_pheromone(current_node, j, self.update_local_pheromone(
+                        current_node, j))
 
             # Conectar último nodo con el primero para completar el ciclo
             for ant in range(self.colony_size):
                 first_node = colony[ant, 0]
                 last_node = colony[ant, -1]
-                self.pheromones[last_node, first_node] = self.update_local_pheromone(
-                    last_node, first_node)
-
-            new_best = self.get_best(colony)
-            if self.cost(new_best) < self.cost(self.best_solution):
-                self.best_solution = new_best
+                self.set_pheromone(last_node, first_node, self.update_local_pheromone(
+                    last_node, first_node))
+            prof.toc("construction", t)
+            prof.count("local_updates", self.colony_size * n)
+
+            t = prof.tic()
+            costs = [self.cost(sol) for sol in colony]
+            self.evaluations += self.colony_size
+            best_ant = int(np.argmin(costs))
+            if costs[best_ant] < self.best_cost:
+                self.best_solution = colony[best_ant]
+                self.best_cost = costs[best_ant]
+                prof.count("improvements")
+            prof.toc("evaluation", t)
+            prof.count("evaluations", self.colony_size)
+
+            t = prof.tic()
             self.pheromones = self.update_global_pheromone(self.best_solution)
+            self.update_choice_info()
+            prof.toc("global_update", t)
             self.it += 1
+            if self.trace is not None:
+                # Diversidad: fracción de hormigas con un costo distinto
+                self.trace.record(self.it, self.best_cost, float(np.mean(costs)), float(np.max(costs)),
+                                  len(np.unique(costs)) / self.colony_size)
+            if self.checkpoint is not None:
+                t = prof.tic()
+                self.checkpoint.maybe_save(
+                    "acs", self.checkpoint_params(), self.it, self.checkpoint_state)
+                prof.toc("checkpoint", t)
+
+        if self.checkpoint is not None:
+            self.checkpoint.save("acs", self.checkpoint_params(),
+                                 self.it, self.checkpoint_state())
+        prof.finish()
         return self.best_solution
@@ -0,0 +1,179 @@
+from dataclasses import dataclass
+import numpy as np
+import numpy.typing as npt
+from src.core.algorithms.ExtremeOptimization import GREEDY_NOISE, INITIALIZERS
+from src.core.termination import Termination
+from src.core.profiling import NULL_PROFILER, Profiler
+from src.core.trace import TraceRecorder
+
+
+@dataclass
+class BatchExtremeOptimization:
+    """
+    `chains` cadenas independientes de optimización extrema que avanzan a
+    la vez sobre una matriz booleana (cadenas × ítems).
+
+    Cada iteración aplica a todas las cadenas el mismo paso que
+    `ExtremeOptimization`: si la solución cabe se agrega un ítem, si no
+    se quita uno, eligiéndolo por rango de eficiencia con probabilidad
+    ∝ k^-tau (descendente al agregar, ascendente al quitar). El rango de
+    todas las cadenas se sortea con un único `searchsorted` sobre la
+    distribución acumulada de k^-tau, y el ítem con ese rango se ubica con
+    una suma acumulada por fila. Pesos y precios de cada cadena se
+    mantienen en vectores de largo `chains`, así que una iteración cuesta
+    O(chains · n_items) operaciones vectorizadas en lugar de `chains`
+    iteraciones en Python.
+
+    Usa el generador global de NumPy (`np.random.seed(seed)`), igual que
+    `ExtremeOptimization`, y cada cadena hace los mismos sorteos que ella:
+    con una sola cadena ambas consumen la misma secuencia aleatoria.
+
+    Usage:
+        batch = BatchExtremeOptimization(seed=1, chains=32, n_items=n, capacidad=c, tau=1.5,
+                                         precios=precios, pesos=pesos, max_iterations=20000)
+        best_sol, best_price = batch.start()
+    """
+    seed: int
+    chains: int
+    n_items: int
+    capacidad: int
+    tau: float
+    precios: npt.NDArray[np.int32]
+    pesos: npt.NDArray[np.int32]
+    max_iterations: int = 1
+    iterations: int = 1
+    optimal_solution: int | None = None
+    termination: Termination | None = None
+    profiler: Profiler | None = None
+    trace: TraceRecorder | None = None
+    upper_bound: int | None = None
+    gap_tolerance: float = 0.0
+    initializer: str = "random"
+
+    def __post_init__(self):
+        if self.chains < 1:
+            raise ValueError("chains debe ser al menos 1")
+        if self.initializer not in INITIALIZERS:
+            raise ValueError(f"initializer debe ser uno de {INITIALIZERS}, se recibió {self.initializer!r}")
+        np.random.seed(self.seed)
+
+    def reached_target(self, precio: int) -> bool:
+        """Igual que `ExtremeOptimization.reached_target`."""
+        if self.optimal_solution is not None and precio == self.optimal_solution:
+            return True
+        return self.upper_bound is not None and precio >= self.upper_bound * (1 - self.gap_tolerance)
+
+    def soluciones_iniciales(self, fitness: npt.NDArray[np.float64]) -> npt.NDArray[np.bool_]:
+        """Matriz (chains × n_items) de soluciones iniciales factibles según `initializer`."""
+        sols = np.zeros((self.chains, self.n_items), dtype=bool)
+        rows = np.arange(self.chains)
+        if self.initializer == "empty":
+            return sols
+        if self.initializer == "random":
+            # Igual que `generar_solucion_inicial`: un ítem al azar y, si no
+            # cabe solo, otro sorteado entre los que caben
+            items = np.random.randint(0, self.n_items, self.chains)
+            no_caben = self.pesos[items] > self.capacidad
+            if no_caben.any():
+                caben = np.flatnonzero(self.pesos <= self.capacidad)
+                if len(caben) == 0:
+                    return sols
+                items[no_caben] = np.random.choice(caben, int(no_caben.sum()))
+            sols[rows, items] = True
+            return sols
+
+        fitness = np.broadcast_to(fitness, sols.shape)
+        if self.initializer == "randomized_greedy":
+            fitness = fitness * np.random.uniform(1 - GREEDY_NOISE, 1 + GREEDY_NOISE, sols.shape)
+        orden = np.argsort(-fitness, axis=1, kind="stable")
+        # Largo del prefijo de cada fila cuyo peso acumulado cabe en la mochila
+        acumulado = np.cumsum(self.pesos[orden], axis=1)
+        largo = (acumulado <= self.capacidad).sum(axis=1)
+        en_prefijo = np.arange(self.n_items) < largo[:, None]
+        sols[np.repeat(rows, largo), orden[en_prefijo]] = True
+        return sols
+
+    def start(self) -> tuple[npt.NDArray[np.int32], int]:
+        """Ejecuta todas las cadenas y retorna la mejor solución encontrada y su precio."""
+        precios = np.asarray(self.precios, dtype=np.int64)
+        pesos = np.asarray(self.pesos, dtype=np.int64)
+        fitness: npt.NDArray[np.float64] = precios / pesos
+        # Ítems por eficiencia descendente; quitar recorre el mismo orden al revés
+        orden = np.argsort(-fitness, kind="stable")
+        pesos_orden, precios_orden = pesos[orden], precios[orden]
+        # Distribución acumulada de k^-tau para k = 1..n (compartida por todas las cadenas)
+        cdf = np.cumsum(np.arange(1, self.n_items + 1, dtype=float) ** (-self.tau))
+
+        K = self.chains
+        rows = np.arange(K)
+        sols = self.soluciones_iniciales(fitness)[:, orden]
+        peso = sols @ pesos_orden
+        precio = sols @ precios_orden
+        factible = peso <= self.capacidad
+        best_sols = sols.copy()
+        best_precios = np.where(factible, precio, -1)
+
+        if self.termination is not None:
+            self.termination.start()
+        best_chain = int(np.argmax(best_precios))
+        mejor = int(best_precios[best_chain])
+        if self.trace is not None:
+            self.trace.start()
+            self._record_trace(0, mejor, precio, sols)
+
+        prof = self.profiler if self.profiler is not None else NULL_PROFILER
+        self.iterations = 0
+        for i in range(1, self.max_iterations + 1):
+            if self.reached_target(mejor):
+                break
+            t = prof.tic()
+            agregar = factible
+            # Candidatos de cada cadena: ítems fuera (agregar) o dentro (quitar),
+            # en orden de rango; al quitar se recorre la fila invertida
+            candidatos = np.where(agregar[:, None], ~sols, sols[:, ::-1])
+            conteo = np.cumsum(candidatos, axis=1)
+            m = conteo[:, -1]
+            activas = m > 0
+            u = np.random.random(K) * cdf[np.maximum(m, 1) - 1]
+            rango = np.minimum(np.searchsorted(cdf, u, side="right"), np.maximum(m, 1) - 1)
+            posicion = np.argmax(conteo > rango[:, None], axis=1)
+            item = np.where(agregar, posicion, self.n_items - 1 - posicion)
+            filas, item = rows[activas], item[activas]
+            signo = np.where(agregar[activas], 1, -1)
+            sols[filas, item] = agregar[activas]
+            peso[filas] += signo * pesos_orden[item]
+            precio[filas] += signo * precios_orden[item]
+            prof.toc("selection", t)
+            n_agregar = int(np.count_nonzero(agregar & activas))
+            prof.count("additions", n_agregar)
+            prof.count("removals", len(filas) - n_agregar)
+
+            t = prof.tic()
+            factible = peso <= self.capacidad
+            mejora = factible & (precio > best_precios)
+            if mejora.any():
+                best_sols[mejora] = sols[mejora]
+                best_precios[mejora] = precio[mejora]
+                best_chain = int(np.argmax(best_precios))
+                mejor = int(best_precios[best_chain])
+                prof.count("improvements", int(np.count_nonzero(mejora)))
+            self.iterations = i
+            prof.toc("evaluation", t)
+            prof.count("evaluations", K)
+            if self.trace is not None:
+                self._record_trace(i, mejor, precio, sols)
+            if self.termination is not None and self.termination.done(i, i * K, mejor):
+                break
+
+        self.best_prices = best_precios
+        best_sol = np.zeros(self.n_items, dtype=np.int32)
+        best_sol[orden] = best_sols[best_chain]
+        prof.finish()
+        return best_sol, int(best_sol @ precios)
+
+    def _record_trace(self, iteration: int, mejor: int, precio: npt.NDArray[np.int64],
+                      sols: npt.NDArray[np.bool_]) -> None:
+        # Diversidad: fracción de cadenas con una solución distinta
+        distintas = len(np.unique(np.packbits(sols, axis=1), axis=0))
+        self.trace.record(iteration, mejor, float(precio.mean()), float(precio.min()),
+                          distintas / self.chains)
@@ -1,7 +1,18 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import numpy as np
 import numpy.typing as npt
 from src.core.algorithms.selection.roulette import roulette
+from src.core.termination import Termination
+from src.core.checkpoint import (Checkpointer, State, array_fingerprint, numpy_rng_state,
+                                 restore_numpy_rng_state)
+from src.core.profiling import NULL_PROFILER, Profiler
+from src.core.trace import TraceRecorder
+
+
+REPAIR_METHODS = (None, "rank", "efficiency")
+INITIALIZERS = ("random", "greedy", "randomized_greedy", "empty")
+# Ruido multiplicativo de la eficiencia en la inicialización greedy aleatorizada
+GREEDY_NOISE = 0.2
 
 
 @dataclass
@@ -15,49 +26,186 @@ class ExtremeOptimization:
     max_iterations: int = 1
     iterations: int = 1
     optimal_solution: int | None = None
+    termination: Termination | None = None
+    checkpoint: Checkpointer | None = None
+    profiler: Profiler | None = None
+    trace: TraceRecorder | None = None
+    upper_bound: int | None = None
+    gap_tolerance: float = 0.0
+    repair: str | None = None
+    initializer: str = "random"
+    _fingerprint: str | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
+        if self.repair not in REPAIR_METHODS:
+            raise ValueError(f"repair debe ser uno de {REPAIR_METHODS}, se recibió {self.repair!r}")
+        if self.initializer not in INITIALIZERS:
+            raise ValueError(f"initializer debe ser uno de {INITIALIZERS}, se recibió {self.initializer!r}")
         np.random.seed(self.seed)
 
+    def reached_target(self, precio: int) -> bool:
+        """True si `precio` es el óptimo conocido o está a lo más a
+        `gap_tolerance` (relativo) de la cota superior `upper_bound`."""
+        if self.optimal_solution is not None and precio == self.optimal_solution:
+            return True
+        return self.upper_bound is not None and precio >= self.upper_bound * (1 - self.gap_tolerance)
+
+    def checkpoint_params(self) -> dict:
+        """Parámetros que deben coincidir para reanudar desde un checkpoint."""
+        if self._fingerprint is None:
+            self._fingerprint = array_fingerprint(self.precios, self.pesos)
+        params = {"seed": self.seed, "n_items": self.n_items, "capacidad": self.capacidad,
+                  "tau": self.tau, "instance": self._fingerprint}
+        if self.repair is not None:
+            params["repair"] = self.repair
+        return params
+
+    def checkpoint_state(self, solution: npt.NDArray[np.int32], best_sol: npt.NDArray[np.int32], precio_mejor_sol: int) -> State:
+        arrays, meta = numpy_rng_state()
+        arrays.update(solution=solution, best_sol=best_sol)
+        meta.update(precio_mejor_sol=int(precio_mejor_sol))
+        return arrays, meta
+
     def start(self) -> tuple[npt.NDArray[np.int32], int]:
-        solution: npt.NDArray[np.int32] = self.generar_solucion_inicial()
         fitness: npt.NDArray[np.float64] = self.precios / self.pesos
-        best_sol: npt.NDArray[np.int32] = solution.copy()
-
-        for i in range(1,self.max_iterations+1):
+        restored = None
+        if self.checkpoint is not None:
+            restored = self.checkpoint.load("eo", self.checkpoint_params())
+
+        if restored is not None:
+            arrays, meta = restored
+            restore_numpy_rng_state(arrays, meta)
+            solution: npt.NDArray[np.int32] = arrays["solution"]
+            best_sol: npt.NDArray[np.int32] = arrays["best_sol"]
+            precio_mejor_sol = meta["precio_mejor_sol"]
+            self.iterations = first = meta["iteration"]
+            # Una ejecución que ya alcanzó el óptimo (o la cota) no continúa
+            if not self.reached_target(precio_mejor_sol):
+                first += 1
+            else:
+                first = self.max_iterations + 1
+        else:
+            solution = self.construir_solucion_inicial(fitness)
+            best_sol = solution.copy()
+            precio_mejor_sol = np.sum(best_sol * self.precios)
+            first = 1
+        if self.termination is not None:
+            self.termination.start()
+        if self.trace is not None:
+            # EO mantiene una sola solución: `mean` registra el precio de la solución actual
+            self.trace.start()
+            self.trace.record(first - 1, precio_mejor_sol, precio_mejor_sol)
+
+        prof = self.profiler if self.profiler is not None else NULL_PROFILER
+        for i in range(first, self.max_iterations+1):
+            t = prof.tic()
             alcanza_capacidad = np.sum(
                 self.pesos[solution == 1]) <= self.capacidad
 
             if alcanza_capacidad:
                 self.agregar_item(solution, fitness, 0)
+                prof.count("additions")
+            elif self.repair is not None:
+                prof.count("removals", self.reparar_solucion(solution, fitness))
+                prof.count("repairs")
             else:
                 self.agregar_item(solution, fitness, 1)
+                prof.count("removals")
+            prof.toc("selection", t)
 
+            t = prof.tic()
             precio_sol = np.sum(solution * self.precios)
-            precio_mejor_sol = np.sum(best_sol * self.precios)
             alcanza_capacidad = np.sum(
                 self.pesos[solution == 1]) <= self.capacidad
             self.iterations = i
             if alcanza_capacidad and precio_sol > precio_mejor_sol:
                 best_sol = solution.copy()
-                if self.optimal_solution is not None and precio_sol == self.optimal_solution:
-                    break
-
+                precio_mejor_sol = precio_sol
+                prof.count("improvements")
+            prof.toc("evaluation", t)
+            prof.count("evaluations")
+            if self.trace is not None:
+                self.trace.record(i, precio_mejor_sol, precio_sol)
+            # Criterios de término (tiempo, estancamiento, otro reinicio alcanzó el óptimo, ...)
+            if self.termination is not None and self.termination.done(i, i, precio_mejor_sol):
+                break
+            if self.reached_target(precio_mejor_sol):
+                break
+            if self.checkpoint is not None:
+                t = prof.tic()
+                self.checkpoint.maybe_save("eo", self.checkpoint_params(), i, lambda: self.checkpoint_state(
+                    solution, best_sol, precio_mejor_sol))
+                prof.toc("checkpoint", t)
+
+        if self.checkpoint is not None:
+            self.checkpoint.save("eo", self.checkpoint_params(), self.iterations,
+                                 self.checkpoint_state(solution, best_sol, precio_mejor_sol))
+        prof.finish()
         return best_sol, np.sum(best_sol * self.precios, dtype=int)
 
-    def generar_solucion_inicial(self) -> npt.NDArray[np.int32]:
+    def construir_solucion_inicial(self, fitness: npt.NDArray[np.float64]) -> npt.NDArray[np.int32]:
+        """Solución inicial factible según `initializer`.
+
+        - `random`: un solo ítem al azar (`generar_solucion_inicial`).
+        - `greedy`: los ítems de mayor eficiencia mientras quepan.
+        - `randomized_greedy`: igual, con la eficiencia perturbada por un
+          ruido multiplicativo de ±`GREEDY_NOISE`.
+        - `empty`: la mochila vacía.
+        """
+        if self.initializer == "random":
+            return self.generar_solucion_inicial()
         sol = np.zeros(self.n_items, dtype=np.int32)
-        sol[np.random.randint(0, self.n_items)] = 1
-
-        alcanza_capacidad = np.sum(
-            self.pesos * sol) <= self.capacidad
-
-        while not alcanza_capacidad:
-            sol = np.zeros(self.n_items, dtype=np.int32)
-            sol[np.random.randint(0, self.n_items)] = 1
+        if self.initializer == "empty":
+            return sol
+
+        if self.initializer == "randomized_greedy":
+            fitness = fitness * np.random.uniform(1 - GREEDY_NOISE, 1 + GREEDY_NOISE, self.n_items)
+        orden = np.argsort(-fitness, kind="stable")
+        # Prefijo más largo del orden cuyo peso acumulado cabe en la mochila
+        k = int(np.searchsorted(np.cumsum(self.pesos[orden]), self.capacidad, side="right"))
+        sol[orden[:k]] = 1
+        return sol
 
+    def generar_solucion_inicial(self) -> npt.NDArray[np.int32]:
+        sol = np.zeros(self.n_items, dtype=np.int32)
+        i = np.random.randint(0, self.n_items)
+        if self.pesos[i] > self.capacidad:
+            # Se sortea entre los ítems que caben solos (si no cabe ninguno, vacía)
+            caben = np.flatnonzero(self.pesos <= self.capacidad)
+            if len(caben) == 0:
+                return sol
+            i = np.random.choice(caben)
+        sol[i] = 1
         return sol
 
+    def reparar_solucion(self, sol: npt.NDArray[np.int32], fitness: npt.NDArray[np.float64]) -> int:
+        """Quita ítems en una sola pasada hasta que la solución sea factible.
+
+        Con `repair="efficiency"` se quitan en orden de eficiencia
+        ascendente; con `repair="rank"` el orden se sortea sin reemplazo con
+        la misma distribución de rangos (k^-tau) que `agregar_item`, usando
+        claves log(U)/w (Efraimidis-Spirakis). En ambos casos la suma
+        acumulada de los pesos y `searchsorted` indican cuántos ítems del
+        orden hay que quitar para eliminar el exceso.
+
+        Returns:
+            Número de ítems quitados.
+        """
+        indices_sol = np.flatnonzero(sol)
+        exceso = int(self.pesos[indices_sol].sum()) - self.capacidad
+        if exceso <= 0:
+            return 0
+
+        # Menor eficiencia primero (rango 1)
+        orden = indices_sol[np.argsort(fitness[indices_sol], kind="stable")]
+        if self.repair == "rank":
+            claves = np.log(np.random.random(len(orden))) / self.generar_vector_prob(len(orden))
+            orden = orden[np.argsort(-claves, kind="stable")]
+
+        k = int(np.searchsorted(np.cumsum(self.pesos[orden]), exceso, side="left")) + 1
+        sol[orden[:k]] = 0
+        return k
+
     def generar_vector_prob(self, n: int) -> npt.NDArray[np.float64]:
         vector_prob = np.arange(1, n + 1, dtype=float)
         vector_prob **= (-self.tau)
@@ -65,6 +213,9 @@ class ExtremeOptimization:
 
     def agregar_item(self, sol: npt.NDArray[np.int32], fitness: npt.NDArray[np.float64], valor: int) -> None:
         indices_sol = np.where(sol == valor)[0]
+        if len(indices_sol) == 0:
+            # Todos los ítems ya están (o no está ninguno): no hay qué mover
+            return
         sol_temporal = np.array(
             [indices_sol, fitness[indices_sol].astype(float)], dtype=object)
 
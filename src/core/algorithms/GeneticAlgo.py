@@ -1,8 +1,25 @@
+from __future__ import annotations
 from abc import ABC, abstractmethod
 import random
 import queue
 from src.core.EventEmitter import EventEmitter
-from typing import Callable, Any, Iterable
+from src.core.termination import Termination
+from src.core.profiling import NULL_PROFILER, Profiler
+from src.core.PopulationHeap import PopulationHeap
+from collections import Counter
+from typing import Callable, Any, Container, Hashable, Iterable, Sequence, TYPE_CHECKING
+
+# NumPy is only needed for checkpoints and traces; importing it lazily keeps
+# pure-Python runs (e.g. NQueen) fast to start.
+if TYPE_CHECKING:
+    from src.core.checkpoint import Checkpointer, State
+    from src.core.trace import TraceRecorder
+
+SELECTION_METHODS = ("roulette", "deterministic_tournament", "probabilistic_tournament", "custom")
+STEADY_STATE_REPLACEMENTS = (None, "worst", "tournament")
+DUPLICATE_POLICIES = (None, "reject", "remutate")
+# Extra mutations tried before rejecting a duplicate child
+MAX_REMUTATIONS = 3
 
 
 class GeneticAlgo[T](ABC, EventEmitter):
@@ -14,13 +31,27 @@ class GeneticAlgo[T](ABC, EventEmitter):
         population_size (int): Size of the population.
         mutation_rate (float): Probability of mutation for an individual.
         crossover_rate (float): Probability of crossover between two parents.
+        termination (Termination | None): Optional shared termination criteria.
+        evaluations (int): Number of fitness evaluations performed.
+        best_fitness (float | int): Best (lowest) fitness of the current population.
+        checkpoint (Checkpointer | None): Optional checkpoint/resume policy.
+        profiler (Profiler | None): Optional per-phase timers and counters.
+        trace (TraceRecorder | None): Optional per-generation convergence trace.
+        elitism (bool): Whether the current run keeps the best individual.
+        selection_method (str): Parent selection method of the current run.
+        steady_state (str | None): Steady-state replacement of the current run.
+        duplicates (str | None): Duplicate elimination policy of the current run.
 
     Methods:
         generate_population: Generates the initial population.
         fitness: Evaluates the fitness of an individual.
         crossover: Combines two parents to create a child.
         mutate: Mutates an individual.
+        individual_hash: Hash used to detect duplicate individuals.
+        mutate_hashed: Mutates an individual updating its hash.
         end_condition: Checks if the end condition for the algorithm is met.
+        terminated: Checks the shared termination criteria using cached values.
+        checkpoint_params: Parameters that must match to resume from a checkpoint.
         start: Runs the genetic algorithm until the end condition is met.
     """
 
@@ -31,6 +62,16 @@ class GeneticAlgo[T](ABC, EventEmitter):
     crossover_rate: float
     population: list[T]
     pop_fitness: list[float | int]
+    termination: Termination | None
+    evaluations: int
+    best_fitness: float | int
+    checkpoint: Checkpointer | None
+    profiler: Profiler | None
+    trace: TraceRecorder | None
+    elitism: bool
+    selection_method: str
+    steady_state: str | None
+    duplicates: str | None
     __event_emitter__: EventEmitter
 
     def __init__(
@@ -39,11 +80,25 @@ class GeneticAlgo[T](ABC, EventEmitter):
         population_size: int,
         mutation_rate: float,
         crossover_rate: float,
+        termination: Termination | None = None,
+        checkpoint: Checkpointer | None = None,
+        profiler: Profiler | None = None,
+        trace: TraceRecorder | None = None,
     ):
         self.seed = seed
         self.population_size = population_size
         self.mutation_rate = mutation_rate
         self.crossover_rate = crossover_rate
+        self.termination = termination
+        self.checkpoint = checkpoint
+        self.profiler = profiler
+        self.trace = trace
+        self.elitism = False
+        self.selection_method = "roulette"
+        self.steady_state = None
+        self.duplicates = None
+        self.evaluations = 0
+        self.best_fitness = float("inf")
         random.seed(seed)
         super().__init__()
 
@@ -62,6 +117,86 @@ class GeneticAlgo[T](ABC, EventEmitter):
     @abstractmethod
     def end_condition(self) -> bool: ...
 
+    def evaluate(self, individual: T) -> float | int:
+        """Evaluates an individual, counting the evaluation."""
+        self.evaluations += 1
+        return self.fitness(individual)
+
+    def terminated(self) -> bool:
+        """Checks the termination criteria with the cached best fitness."""
+        return self.termination is not None and self.termination.done(
+            self.gen, self.evaluations, self.best_fitness)
+
+    def _init_run(self) -> None:
+        self.gen = 0
+        self.evaluations = 0
+        if self.termination is not None:
+            self.termination.start()
+        if self.trace is not None:
+            self.trace.start()
+
+    def checkpoint_params(self) -> dict:
+        """Parameters that must match to resume from a checkpoint (including the run mode)."""
+        return {"seed": self.seed, "population_size": self.population_size,
+                "mutation_rate": self.mutation_rate, "crossover_rate": self.crossover_rate,
+                "elitism": bool(self.elitism), "selection": self.selection_method,
+                "steady_state": self.steady_state, "duplicates": self.duplicates}
+
+    def checkpoint_state(self) -> State:
+        """Population, fitness, counters and RNG state.
+
+        Individuals must be convertible to a rectangular NumPy array
+        (e.g. permutations).
+        """
+        import numpy as np
+        from src.core.checkpoint import python_rng_state
+
+        arrays, meta = python_rng_state()
+        arrays.update(population=np.asarray(self.population),
+                      pop_fitness=np.asarray(self.pop_fitness))
+        meta.update(gen=self.gen, evaluations=self.evaluations)
+        return arrays, meta
+
+    def _restore_checkpoint(self) -> bool:
+        """Restores the last checkpoint if resuming; returns True if it did."""
+        if self.checkpoint is None:
+            return False
+        restored = self.checkpoint.load(type(self).__name__, self.checkpoint_params())
+        if restored is None:
+            return False
+        from src.core.checkpoint import restore_python_rng_state
+
+        arrays, meta = restored
+        restore_python_rng_state(arrays, meta)
+        self.population = arrays["population"].tolist()
+        self.pop_fitness = arrays["pop_fitness"].tolist()
+        self.gen = meta["gen"]
+        self.evaluations = meta["evaluations"]
+        return True
+
+    def _save_checkpoint(self, force: bool = False) -> None:
+        if self.checkpoint is None:
+            return
+        prof = self._profiler()
+        t = prof.tic()
+        name, params = type(self).__name__, self.checkpoint_params()
+        if force:
+            self.checkpoint.save(name, params, self.gen, self.checkpoint_state())
+        else:
+            self.checkpoint.maybe_save(name, params, self.gen, self.checkpoint_state)
+        prof.toc("checkpoint", t)
+
+    def _record_trace(self) -> None:
+        """Records best/mean/worst fitness and the fraction of distinct individuals."""
+        if self.trace is None:
+            return
+        fitness = self.pop_fitness
+        diversity = len(set(map(tuple, self.population))) / len(self.population)
+        self.trace.record(self.gen, min(fitness), sum(fitness) / len(fitness), max(fitness), diversity)
+
+    def _profiler(self) -> Profiler:
+        return self.profiler if self.profiler is not None else NULL_PROFILER
+
     def roulette(self, iter_list: Iterable[Any], key: Callable[[Any], float] = None) -> int:
         """Implements roulette wheel selection.
 
@@ -94,12 +229,14 @@ class GeneticAlgo[T](ABC, EventEmitter):
             List of indices of the selected items
         """
 
-        sampled = random.sample(list(enumerate(iter_list)), k)
+        values = self.__as_sequence(iter_list)
+        # Sampling indices directly avoids copying the population: O(k)
+        sampled = random.sample(range(len(values)), k)
         if key:
-            sampled.sort(key=lambda x: key(x[1]))
+            sampled.sort(key=lambda i: key(values[i]))
         else:
-            sampled.sort(key=lambda x: x[1])
-        return sampled[0][0]
+            sampled.sort(key=values.__getitem__)
+        return sampled[0]
 
     def probabilistic_tournament(self, iter_list: Iterable[Any], key: Callable[[Any], float] = None, k: int = 3, p: float = 0.75) -> list[int]:
         """Implements probabilistic tournament selection.
@@ -112,17 +249,164 @@ class GeneticAlgo[T](ABC, EventEmitter):
             List of indices of the selected items
         """
 
-        sampled = random.sample(list(enumerate(iter_list)), k)
+        values = self.__as_sequence(iter_list)
+        sampled = random.sample(range(len(values)), k)
         if key:
-            sampled.sort(key=lambda x: key(x[1]))
+            sampled.sort(key=lambda i: key(values[i]))
         else:
-            sampled.sort(key=lambda x: x[1])
+            sampled.sort(key=values.__getitem__)
         for _ in range(k):
             r = random.random()
             for i in range(k):
                 if r < p * (1 - p) ** i:
-                    return sampled[i][0]
-        return sampled[-1][0]
+                    return sampled[i]
+        return sampled[-1]
+
+    @staticmethod
+    def __as_sequence(iter_list: Iterable[Any]) -> Sequence[Any]:
+        return iter_list if isinstance(iter_list, Sequence) else list(iter_list)
+
+    def tournament_loser(self, k: int = 3) -> int:
+        """Index of the worst (highest fitness) of `k` random individuals."""
+        fitness = self.pop_fitness
+        return max(random.sample(range(len(fitness)), k), key=fitness.__getitem__)
+
+    def individual_hash(self, individual: T) -> Hashable:
+        """Hash used to detect duplicate individuals (see `start(duplicates=...)`).
+
+        Subclasses can return a Zobrist-style hash that `mutate_hashed`
+        updates in O(1).
+        """
+        return hash(tuple(individual))
+
+    def mutate_hashed(self, individual: T, individual_hash: Hashable) -> tuple[T, Hashable]:
+        """Mutates an individual and returns it with its updated hash.
+
+        The default recomputes the hash; subclasses whose mutation is a
+        local change (e.g. a swap) can update it incrementally.
+        """
+        child = self.mutate(individual)
+        return child, self.individual_hash(child)
+
+    def _mutate(self, child: T, child_hash: Hashable | None) -> tuple[T, Hashable | None]:
+        if child_hash is None:
+            return self.mutate(child), None
+        return self.mutate_hashed(child, child_hash)
+
+    def _offspring(self, parent1: T, parent2: T, crossover: bool, parent1_hash: Hashable | None,
+                   seen: Container[Hashable] | None) -> tuple[T | None, Hashable | None, bool]:
+        """Creates a child by crossover (or by mutating `parent1` if `crossover` is False).
+
+        With duplicate elimination (`seen` is not None) a child whose hash is
+        in `seen` is re-mutated or rejected before it is evaluated; a
+        rejected child is returned as None.
+
+        Returns:
+            The child, its hash and whether it was mutated.
+        """
+        prof = self._profiler()
+        if crossover:
+            # CROSSOVER
+            t = prof.tic()
+            child = self.crossover(parent1, parent2)
+            prof.toc("crossover", t)
+            self.emit("crossover", self.gen, parent1, parent2, child)
+            child_hash = self.individual_hash(child) if seen is not None else None
+            mutated = random.random() < self.mutation_rate
+        else:
+            child, child_hash, mutated = parent1, parent1_hash, True
+
+        if mutated:
+            # MUTATION
+            t = prof.tic()
+            child, child_hash = self._mutate(child, child_hash)
+            prof.toc("mutation", t)
+
+        if seen is None or child_hash not in seen:
+            return child, child_hash, mutated
+
+        t = prof.tic()
+        if self.duplicates == "remutate":
+            for _ in range(MAX_REMUTATIONS):
+                child, child_hash = self.mutate_hashed(child, child_hash)
+                prof.count("duplicates_remutated")
+                if child_hash not in seen:
+                    prof.toc("deduplication", t)
+                    return child, child_hash, True
+        prof.count("duplicates_rejected")
+        prof.toc("deduplication", t)
+        return None, None, mutated
+
+    def _evaluate_child(self, child: T, mutated: bool) -> float | int:
+        # EVALUATION (once per child, shared by both events)
+        prof = self._profiler()
+        t = prof.tic()
+        child_fitness = self.evaluate(child)
+        prof.toc("evaluation", t)
+        if mutated:
+            self.emit("mutated", self.gen, child, child_fitness)
+        self.emit("new_individual", self.gen, child, child_fitness)
+        return child_fitness
+
+    def _hash_population(self) -> list[Hashable] | None:
+        if self.duplicates is None:
+            return None
+        return [self.individual_hash(ind) for ind in self.population]
+
+    def _breed(self, select: Callable[[list[int | float]], int], pop_hashes: list[Hashable] | None,
+               population: list[T], fitness: list[float | int], hashes: list[Hashable] | None,
+               both_parents: bool) -> None:
+        """Fills `population` and `fitness` (and `hashes`) up to `population_size` with offspring.
+
+        Without crossover `parent1` is copied, and also `parent2` if
+        `both_parents`, reusing their known fitness. A child rejected as a
+        duplicate is replaced by another child (new parents are selected),
+        not by a copy of its parent; only after `population_size`
+        consecutive rejections are the parents copied instead.
+        """
+        prof = self._profiler()
+        # Hashes of the current and the new population
+        seen = None if pop_hashes is None else set(pop_hashes)
+        rejected = 0
+        while len(population) < self.population_size:
+            # SELECTION
+            t = prof.tic()
+            parent1_idx = select(self.pop_fitness)
+            parent2_idx = select(self.pop_fitness)
+            parent1 = self.population[parent1_idx]
+            parent2 = self.population[parent2_idx]
+            prof.toc("selection", t)
+
+            cross_chance = random.random()
+            crossed = cross_chance < self.crossover_rate
+            child = None
+            if crossed:
+                child, child_hash, mutated = self._offspring(parent1, parent2, True, None, seen)
+
+            if child is not None:
+                population.append(child)
+                fitness.append(self._evaluate_child(child, mutated))
+                if seen is not None:
+                    seen.add(child_hash)
+                    hashes.append(child_hash)
+                rejected = 0
+                continue
+            if crossed:
+                # Rejected duplicate: try another child
+                rejected += 1
+                if rejected < self.population_size:
+                    continue
+                prof.count("duplicates_kept")
+                rejected = 0
+
+            for parent_idx in (parent1_idx, parent2_idx) if both_parents else (parent1_idx,):
+                if len(population) == self.population_size:
+                    break
+                population.append(self.population[parent_idx])
+                fitness.append(self.pop_fitness[parent_idx])
+                prof.count("fitness_reused")
+                if seen is not None:
+                    hashes.append(pop_hashes[parent_idx])
 
     def __elitism_start(self, selection_method: str = "roulette", custom_selection_method: Callable[[list[int | float]], int] | None = None) -> list[tuple[float | int, T]]:
         methods = {
@@ -131,77 +415,161 @@ class GeneticAlgo[T](ABC, EventEmitter):
             "probabilistic_tournament": self.probabilistic_tournament,
             "custom": custom_selection_method
         }
-        select = methods.get(selection_method, self.roulette)
+        select = methods[selection_method]
         
-        self.gen = 0
-        self.population: list[T] = self.generate_population()
-        self.emit("initial_population", self.gen, self.population)
-        
-        self.pop_fitness = [self.fitness(ind) for ind in self.population]
+        self._init_run()
+        prof = self._profiler()
+        if not self._restore_checkpoint():
+            self.population: list[T] = self.generate_population()
+            self.emit("initial_population", self.gen, self.population)
+            t = prof.tic()
+            self.pop_fitness = [self.evaluate(ind) for ind in self.population]
+            prof.toc("evaluation", t)
+
         sorted_population = sorted(zip(self.pop_fitness, self.population), key=lambda x: x[0])
+        self.best_fitness = sorted_population[0][0]
+        self._record_trace()
         self.emit("evaluated_population", self.gen, sorted_population)
+        pop_hashes = self._hash_population()
 
         while not self.end_condition():
             # Keep the best individual (elitism)
             best_fitness, best_individual = sorted_population[0]
             temp_population = [best_individual]
             fitness_temp = [best_fitness]
-            
-            # Generate the rest of the population
-            while len(temp_population) < self.population_size:
-                # SELECTION - select parents from current population
-                parent1_idx = select(self.pop_fitness)
-                parent2_idx = select(self.pop_fitness)
-                parent1 = self.population[parent1_idx]
-                parent2 = self.population[parent2_idx]
-
-                cross_chance = random.random()
-                if cross_chance < self.crossover_rate:
-                    # CROSSOVER
-                    child = self.crossover(parent1, parent2)
-                    self.emit("crossover", self.gen, parent1, parent2, child)
-                    
-                    mut_chance = random.random()
-                    if mut_chance < self.mutation_rate:
-                        # MUTATION
-                        child = self.mutate(child)
-                        self.emit("mutated", self.gen, child, self.fitness(child))
-                    
-                    # EVALUATION
-                    child_fitness = self.fitness(child)
-                    self.emit("new_individual", self.gen, child, child_fitness)
-                    
-                    temp_population.append(child)
-                    fitness_temp.append(child_fitness)
-                else:
-                    # If no crossover, add one of the parents
-                    temp_population.append(parent1)
-                    fitness_temp.append(self.fitness(parent1))
+            hashes_temp = None if pop_hashes is None else [self.individual_hash(best_individual)]
+
+            # Generate the rest of the population (one parent per child without crossover)
+            self._breed(select, pop_hashes, temp_population, fitness_temp, hashes_temp, False)
 
+            t = prof.tic()
             self.gen += 1
             self.population = temp_population
             self.pop_fitness = fitness_temp
+            pop_hashes = hashes_temp
             sorted_population = sorted(zip(self.pop_fitness, self.population), key=lambda x: x[0])
+            self.best_fitness = sorted_population[0][0]
+            prof.toc("replacement", t)
+            self._record_trace()
             self.emit("new_generation", self.gen, sorted_population)
+            self._save_checkpoint()
 
+        self._save_checkpoint(force=True)
+        prof.count("evaluations", self.evaluations)
+        prof.finish()
         self.emit("end")
         return sorted_population
 
+    def __steady_state_start(self, select: Callable[[list[int | float]], int], replacement: str) -> list[tuple[float | int, T]]:
+        self._init_run()
+        prof = self._profiler()
+        if not self._restore_checkpoint():
+            self.population: list[T] = self.generate_population()
+            t = prof.tic()
+            self.pop_fitness = [self.evaluate(ind) for ind in self.population]
+            prof.toc("evaluation", t)
+
+        index = PopulationHeap(self.pop_fitness)
+        self.best_fitness = self.pop_fitness[index.best()]
+        self._record_trace()
+        # Checkpoints are only written at generation boundaries
+        offspring = self.gen * self.population_size
+        pop_hashes = self._hash_population()
+        # Multiset of the hashes in the population
+        seen = None if pop_hashes is None else Counter(pop_hashes)
+
+        while not self.end_condition():
+            # SELECTION
+            t = prof.tic()
+            parent1_idx = select(self.pop_fitness)
+            parent2_idx = select(self.pop_fitness)
+            parent1 = self.population[parent1_idx]
+            parent2 = self.population[parent2_idx]
+            prof.toc("selection", t)
+
+            # Without crossover the child is a mutated copy of parent1, since
+            # an unchanged copy would only duplicate it
+            child, child_hash, mutated = self._offspring(
+                parent1, parent2, random.random() < self.crossover_rate,
+                None if pop_hashes is None else pop_hashes[parent1_idx], seen)
+
+            if child is not None:
+                child_fitness = self._evaluate_child(child, mutated)
+
+                # REPLACEMENT: the child only enters if it is not worse than the
+                # individual it replaces, so the best one is never lost
+                t = prof.tic()
+                slot = index.worst() if replacement == "worst" else self.tournament_loser()
+                if child_fitness <= self.pop_fitness[slot]:
+                    self.population[slot] = child
+                    index.replace(slot, child_fitness)
+                    self.best_fitness = self.pop_fitness[index.best()]
+                    if seen is not None:
+                        seen[pop_hashes[slot]] -= 1
+                        if not seen[pop_hashes[slot]]:
+                            del seen[pop_hashes[slot]]
+                        seen[child_hash] += 1
+                        pop_hashes[slot] = child_hash
+                    prof.count("replacements")
+                else:
+                    prof.count("rejected")
+                prof.toc("replacement", t)
+
+            # A generation is `population_size` offspring (rejected duplicates included)
+            offspring += 1
+            if offspring % self.population_size == 0:
+                self.gen += 1
+                self._record_trace()
+                self.emit("new_generation", self.gen, list(zip(self.pop_fitness, self.population)))
+                self._save_checkpoint()
+
+        self._save_checkpoint(force=True)
+        prof.count("evaluations", self.evaluations)
+        prof.finish()
+        self.emit("end")
+        return sorted(zip(self.pop_fitness, self.population), key=lambda x: x[0])
+
     def start(self,
               elitism: bool = False,
               selection_method: str = "roulette",
-              custom_selection_method: Callable[[list[int | float]], int] | None = None) -> list[tuple[float | int, T]]:
+              custom_selection_method: Callable[[list[int | float]], int] | None = None,
+              steady_state: str | None = None,
+              duplicates: str | None = None) -> list[tuple[float | int, T]]:
         """Runs the genetic algorithm until the end condition is met.
 
         Args:
             elitism (bool, optional): Select the best parents for crossover. Defaults to False.
             selection_method (str, optional): Selection method to use ('roulette', 'deterministic_tournament', 'probabilistic_tournament'). Defaults to 'roulette'.
             custom_selection_method: Custom selection function when selection_method is 'custom'.
+            steady_state (str, optional): Instead of rebuilding the population every generation,
+                each child replaces in place the 'worst' individual or a 'tournament' loser
+                (if the child is not worse). One generation counts `population_size` children.
+                Defaults to None (generational). Cannot be combined with `elitism`.
+            duplicates (str, optional): Duplicate elimination. Children whose `individual_hash`
+                is already in the population are 'reject'ed or 're-mutate'd (up to
+                MAX_REMUTATIONS times) before they are evaluated. In the generational modes a
+                rejected child is replaced by another child; copies of the parents made
+                without crossover are kept. Defaults to None (keep them).
         """
 
+        if selection_method not in SELECTION_METHODS:
+            raise ValueError(
+                f"selection_method must be one of {SELECTION_METHODS}, got {selection_method!r}")
         if selection_method == "custom" and custom_selection_method is None:
             raise ValueError(
                 "Custom selection method must be provided when selection_method is 'custom'")
+        if steady_state not in STEADY_STATE_REPLACEMENTS:
+            raise ValueError(
+                f"steady_state must be one of {STEADY_STATE_REPLACEMENTS}, got {steady_state!r}")
+        if duplicates not in DUPLICATE_POLICIES:
+            raise ValueError(
+                f"duplicates must be one of {DUPLICATE_POLICIES}, got {duplicates!r}")
+        if elitism and steady_state is not None:
+            raise ValueError("elitism and steady_state cannot be combined")
+        self.elitism = elitism
+        self.selection_method = selection_method
+        self.steady_state = steady_state
+        self.duplicates = duplicates
 
         if elitism:
             return self.__elitism_start(selection_method, custom_selection_method)
@@ -212,52 +580,41 @@ class GeneticAlgo[T](ABC, EventEmitter):
             "probabilistic_tournament": self.probabilistic_tournament,
             "custom": custom_selection_method
         }
-        select = methods.get(selection_method, self.roulette)
-
-        self.gen = 0
-        self.population: list[T] = self.generate_population()
-        self.pop_fitness = [self.fitness(ind) for ind in self.population]
+        select = methods[selection_method]
+
+        if steady_state is not None:
+            return self.__steady_state_start(select, steady_state)
+
+        self._init_run()
+        prof = self._profiler()
+        if not self._restore_checkpoint():
+            self.population: list[T] = self.generate_population()
+            t = prof.tic()
+            self.pop_fitness = [self.evaluate(ind) for ind in self.population]
+            prof.toc("evaluation", t)
+        self.best_fitness = min(self.pop_fitness)
+        self._record_trace()
+        pop_hashes = self._hash_population()
 
         while not self.end_condition():
             temp_population = []
             fitness_temp = []
+            hashes_temp = None if pop_hashes is None else []
+            self._breed(select, pop_hashes, temp_population, fitness_temp, hashes_temp, True)
 
-            while len(temp_population) < self.population_size:
-                # SELECTION
-                parent1_idx = select(self.pop_fitness)
-                parent2_idx = select(self.pop_fitness)
-                parent1 = self.population[parent1_idx]
-                parent2 = self.population[parent2_idx]
-
-                cross_chance = random.random()
-                if cross_chance < self.crossover_rate:
-                    # CROSSOVER
-                    child = self.crossover(parent1, parent2)
-                    self.emit("crossover", self.gen, parent1, parent2, child)
-                    
-                    mut_chance = random.random()
-                    if mut_chance < self.mutation_rate:
-                        # MUTATION
-                        child = self.mutate(child)
-                        self.emit("mutated", self.gen, child, self.fitness(child))
-                    
-                    # EVALUATION
-                    child_fitness = self.fitness(child)
-                    self.emit("new_individual", self.gen, child, child_fitness)
-                    
-                    temp_population.append(child)
-                    fitness_temp.append(child_fitness)
-                else:
-                    temp_population.append(parent1)
-                    fitness_temp.append(self.fitness(parent1))
-                    if len(temp_population) < self.population_size:
-                        temp_population.append(parent2)
-                        fitness_temp.append(self.fitness(parent2))
-
+            t = prof.tic()
             self.gen += 1
-            self.population = temp_population[:self.population_size]
-            self.pop_fitness = fitness_temp[:self.population_size]
+            self.population = temp_population
+            self.pop_fitness = fitness_temp
+            pop_hashes = hashes_temp
+            self.best_fitness = min(self.pop_fitness)
+            prof.toc("replacement", t)
+            self._record_trace()
             self.emit("new_generation", self.gen, list(zip(self.pop_fitness, self.population)))
+            self._save_checkpoint()
 
+        self._save_checkpoint(force=True)
+        prof.count("evaluations", self.evaluations)
+        prof.finish()
         self.emit("end")
         return sorted(zip(self.pop_fitness, self.population), key=lambda x: x[0])
@@ -0,0 +1,186 @@
+import multiprocessing as mp
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from multiprocessing.sharedctypes import Synchronized
+from typing import Any, Callable
+import numpy as np
+import numpy.typing as npt
+from src.core.algorithms.ExtremeOptimization import ExtremeOptimization
+from src.core.termination import Termination
+
+
+# Estado compartido de cada proceso del pool (se asigna en `_init_worker`;
+# el plazo, en cada `_run_restart`)
+_stop_event = None
+_best_value = None
+_deadline: float | None = None
+
+
+def _init_worker(stop_event, best_value) -> None:
+    global _stop_event, _best_value
+    _stop_event = stop_event
+    _best_value = best_value
+
+
+def _ready(_: int) -> None:
+    """Tarea vacía para levantar los procesos del pool antes de medir tiempos."""
+
+
+@dataclass
+class SharedStop(Termination):
+    """Criterio de término que consulta el estado compartido entre reinicios.
+
+    Solo se consulta cada `check_every` iteraciones para que el costo de
+    sincronización entre procesos sea despreciable frente a la iteración.
+    Publica el mejor valor del reinicio y se detiene en cuanto el mejor
+    valor compartido cumple `reached_target`, aunque lo haya encontrado
+    un reinicio que todavía no termina.
+    """
+    check_every: int
+    reached_target: Callable[[int], bool] | None = None
+
+    def done(self, iteration: int, evaluations: int, best: float) -> bool:
+        if iteration % self.check_every:
+            return False
+        with _best_value.get_lock():
+            if best > _best_value.value:
+                _best_value.value = int(best)
+            shared_best = _best_value.value
+        if self.reached_target is not None and self.reached_target(shared_best):
+            _stop_event.set()
+            return True
+        if _stop_event.is_set():
+            return True
+        return _deadline is not None and time.monotonic() >= _deadline
+
+
+def _run_restart(seed: int, params: dict[str, Any], check_every: int,
+                 deadline: float | None) -> dict[str, Any]:
+    global _deadline
+    _deadline = deadline
+    if _stop_event.is_set():
+        return {"seed": seed, "solution": None, "price": -1, "iterations": 0, "reached_target": False}
+
+    params = dict(params)
+    shared_stop = SharedStop(check_every)
+    termination: Termination = shared_stop
+    if params.get("termination") is not None:
+        termination = termination | params["termination"]
+    params["termination"] = termination
+
+    optimizer = ExtremeOptimization(seed=seed, **params)
+    shared_stop.reached_target = optimizer.reached_target
+    solution, price = optimizer.start()
+
+    with _best_value.get_lock():
+        if price > _best_value.value:
+            _best_value.value = int(price)
+
+    reached_target = optimizer.reached_target(price)
+    if reached_target:
+        _stop_event.set()
+
+    return {"seed": seed, "solution": solution, "price": int(price),
+            "iterations": optimizer.iterations, "reached_target": reached_target}
+
+
+@dataclass
+class RestartResult:
+    best_solution: npt.NDArray[np.int32] | None
+    best_price: int
+    seed: int | None
+    iterations: int
+    reached_target: bool
+    time_to_target: float | None
+    elapsed: float
+    runs: list[dict[str, Any]] = field(default_factory=list)
+    # Mejor valor publicado por los reinicios (incluye los interrumpidos)
+    best_known: int = -1
+
+
+@dataclass
+class RestartManager:
+    """Ejecuta varios reinicios de ExtremeOptimization en paralelo.
+
+    Los reinicios comparten el mejor valor conocido y se detienen todos
+    cuando ese valor alcanza `optimal_solution` (o `upper_bound`) o se agota `time_limit`
+    (en segundos). Los reinicios que aún no comenzaron se cancelan.
+
+    El pool de procesos se crea en el primer `run` y se reutiliza en los
+    siguientes (p. ej. una llamada por instancia); `time_to_target` se mide
+    con los procesos ya levantados. Se libera con `close()` o usando el
+    gestor como contexto.
+
+    Usage:
+        with RestartManager(restarts=8, workers=4) as manager:
+            for instance in instances:
+                result = manager.run(seed, **params)
+    """
+    restarts: int
+    workers: int
+    time_limit: float | None = None
+    check_every: int = 50
+    _executor: ProcessPoolExecutor | None = field(default=None, init=False, repr=False)
+    _stop_event: Any = field(default=None, init=False, repr=False)
+    _best_value: Synchronized | None = field(default=None, init=False, repr=False)
+
+    def __enter__(self) -> "RestartManager":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            ctx = mp.get_context()
+            self._stop_event = ctx.Event()
+            self._best_value = ctx.Value("q", -1)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=ctx, initializer=_init_worker,
+                initargs=(self._stop_event, self._best_value))
+            list(self._executor.map(_ready, range(self.workers)))
+        return self._executor
+
+    def close(self) -> None:
+        """Termina los procesos del pool."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def run(self, seed: int, **params: Any) -> RestartResult:
+        executor = self._pool()
+        # Al terminar un `run` ya no quedan reinicios en curso, así que el
+        # estado compartido se puede reiniciar
+        stop_event, best_value = self._stop_event, self._best_value
+        stop_event.clear()
+        best_value.value = -1
+        start_time = time.monotonic()
+        deadline = start_time + self.time_limit if self.time_limit is not None else None
+
+        runs: list[dict[str, Any]] = []
+        time_to_target: float | None = None
+
+        futures = [executor.submit(_run_restart, seed + r, params, self.check_every, deadline)
+                   for r in range(self.restarts)]
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            run = future.result()
+            runs.append(run)
+            if run["reached_target"] and time_to_target is None:
+                time_to_target = time.monotonic() - start_time
+                stop_event.set()
+                for pending in futures:
+                    pending.cancel()
+
+        elapsed = time.monotonic() - start_time
+        finished = [run for run in runs if run["solution"] is not None]
+        if not finished:
+            return RestartResult(None, -1, None, 0, False, None, elapsed, runs,
+                                 best_known=best_value.value)
+
+        best = max(finished, key=lambda run: run["price"])
+        return RestartResult(best["solution"], best["price"], best["seed"], best["iterations"],
+                             best["reached_target"], time_to_target, elapsed, runs,
+                             best_known=best_value.value)
@@ -0,0 +1,293 @@
+"""Suite de benchmarks reproducibles para los solucionadores.
+
+Cada caso (solucionador + instancia + parámetros fijos) se ejecuta en un
+proceso nuevo, de modo que la memoria máxima (`ru_maxrss`) corresponda
+solo a ese caso y ninguna caché de otro caso afecte los tiempos. Se
+mide únicamente la llamada a `start()`; la carga de la instancia queda
+fuera de la medición.
+
+Usage:
+    cases = default_cases(Path("instancias"))
+    report = run_benchmark(cases, repeat=3)
+    save_report(report, "bench.json")
+    compare_reports(load_report("base.json"), report)
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+import numpy as np
+from src.core.termination import Termination
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+BENCH_VERSION = 1
+
+# Generaciones por tamaño de tablero: la evaluación de NQueen es O(n²)
+NQUEEN_SIZES = {8: 200, 16: 200, 32: 100, 64: 50, 128: 20, 256: 5, 512: 2, 1000: 2}
+NQUEEN_QUICK_SIZES = {8: 100, 16: 100, 32: 50, 64: 20}
+
+
+@dataclass
+class BenchCase:
+    """Caso del benchmark.
+
+    Attributes:
+        name: Identificador estable usado para comparar entre commits.
+        solver: `acs`, `n-queen` o `eo`.
+        params: Parámetros del solucionador (con semilla fija).
+        target: Valor objetivo para medir el tiempo hasta alcanzarlo.
+    """
+    name: str
+    solver: str
+    params: dict[str, Any]
+    target: float | None = None
+
+
+@dataclass
+class TargetTimer(Termination):
+    """Criterio que nunca detiene la ejecución; registra cuándo se alcanzó `target`."""
+    target: float
+    minimize: bool = True
+    started: float = field(default=0.0, init=False)
+    reached: float | None = field(default=None, init=False)
+
+    def start(self) -> None:
+        self.started = time.perf_counter()
+        self.reached = None
+
+    def done(self, iteration: int, evaluations: int, best: float) -> bool:
+        if self.reached is None and (best <= self.target if self.minimize else best >= self.target):
+            self.reached = time.perf_counter() - self.started
+        return False
+
+
+def default_cases(data_dir: Path | None = None, quick: bool = False, target_gap: float = 0.05) -> list[BenchCase]:
+    """Matriz fija de casos.
+
+    Incluye NQueen para una escalera de tamaños y, si se indica
+    `data_dir`, cada archivo `*.tsp` (ACS) y `knapPI_*` (EO, hasta tres
+    instancias por archivo) de esa carpeta.
+
+    Args:
+        data_dir: Carpeta con las instancias TSPLIB y de la mochila.
+        quick: Usa tamaños y presupuestos reducidos (para CI).
+        target_gap: Holgura relativa sobre el óptimo conocido del TSP para
+            el tiempo hasta el objetivo.
+    """
+    from src.utils.knapack_parser import iter_knapack_instances
+    from src.utils.tsp_parser import KNOWN_OPTIMA, read_tsplib
+
+    cases = []
+    for n, generations in (NQUEEN_QUICK_SIZES if quick else NQUEEN_SIZES).items():
+        cases.append(BenchCase(
+            f"n-queen/n{n}", "n-queen",
+            {"seed": 1, "n": n, "population_size": 50, "crossover_rate": 0.8,
+             "mutation_rate": 0.2, "iterations": generations},
+            target=0))
+
+    if data_dir is None:
+        return cases
+
+    for path in sorted(data_dir.glob("*.tsp")):
+        n = len(read_tsplib(path)["distances"])
+        if quick and n > 200:
+            continue
+        iterations = 50 if n <= 100 else 20 if n <= 500 else 5
+        optimum = KNOWN_OPTIMA.get(path.stem)
+        cases.append(BenchCase(
+            f"acs/{path.stem}", "acs",
+            {"instance": str(path), "seed": 1, "colony_size": 10, "alpha": 0.1,
+             "beta": 2.5, "q0": 0.9, "max_iterations": 5 if quick else iterations},
+            target=optimum * (1 + target_gap) if optimum is not None else None))
+
+    for path in sorted(data_dir.glob("knapPI_*")):
+        for index, instance in zip(range(3), iter_knapack_instances(path)):
+            cases.append(BenchCase(
+                f"eo/{instance['title']}", "eo",
+                {"instance": str(path), "index": index, "seed": 1, "tau": 1.5,
+                 "max_iterations": 2000 if quick else 20000},
+                target=instance["z"]))
+    return cases
+
+
+def _peak_rss_mb() -> float | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta KiB y macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_case(case: BenchCase) -> dict[str, Any]:
+    """Ejecuta un caso en el proceso actual y retorna sus métricas."""
+    params = case.params
+    timer = TargetTimer(case.target, minimize=case.solver != "eo") if case.target is not None else None
+
+    if case.solver == "n-queen":
+        from src.problems.n_queen.NQueen import NQueen
+        solver = NQueen(params["seed"], params["n"], params["population_size"],
+                        params["crossover_rate"], params["mutation_rate"],
+                        params["iterations"], timer, silent=True)
+    elif case.solver == "acs":
+        from src.core.algorithms.AntColonySystem import AntColonySystem
+        from src.utils.tsp_parser import read_tsplib
+        instance = read_tsplib(params["instance"])
+        solver = AntColonySystem(params["seed"], params["colony_size"], params["alpha"],
+                                 params["beta"], params["q0"], params["max_iterations"],
+                                 instance["coordinates"], distances=instance["distances"],
+                                 termination=timer)
+    elif case.solver == "eo":
+        from src.core.algorithms.ExtremeOptimization import ExtremeOptimization
+        from src.utils.knapack_parser import knapack_parser
+        instance = knapack_parser(params["instance"])[params["index"]]
+        solver = ExtremeOptimization(
+            seed=params["seed"], n_items=instance["n"], capacidad=instance["c"],
+            tau=params["tau"], precios=instance["precios"].astype(np.int32),
+            pesos=instance["pesos"].astype(np.int32),
+            max_iterations=params["max_iterations"], optimal_solution=instance["z"],
+            termination=timer)
+    else:
+        raise ValueError(f"Solucionador desconocido: {case.solver}")
+
+    baseline_rss = _peak_rss_mb()
+    start = time.perf_counter()
+    result = solver.start()
+    seconds = time.perf_counter() - start
+
+    if case.solver == "n-queen":
+        iterations, evaluations, best = solver.gen, solver.evaluations, solver.best_fitness
+    elif case.solver == "acs":
+        iterations, evaluations, best = solver.it, solver.evaluations, solver.best_cost
+    else:
+        # EO evalúa una solución por iteración
+        iterations = evaluations = solver.iterations
+        best = int(result[1])
+
+    return {
+        "seconds": seconds,
+        "iterations": iterations,
+        "evaluations": evaluations,
+        "best": float(best),
+        "time_to_target": timer.reached if timer is not None else None,
+        "baseline_rss_mb": baseline_rss,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def _median(values: list[float | None]) -> float | None:
+    values = [v for v in values if v is not None]
+    return statistics.median(values) if values else None
+
+
+def summarize(case: BenchCase, runs: list[dict[str, Any]]) -> dict[str, Any]:
+    """Combina las repeticiones de un caso usando la mediana."""
+    seconds = statistics.median(run["seconds"] for run in runs)
+    iterations = runs[0]["iterations"]
+    evaluations = runs[0]["evaluations"]
+    return {
+        "case": case.name,
+        "solver": case.solver,
+        "params": case.params,
+        "repeat": len(runs),
+        "iterations": iterations,
+        "evaluations": evaluations,
+        "best": runs[0]["best"],
+        "seconds": seconds,
+        "iterations_per_sec": iterations / seconds if seconds > 0 else None,
+        "evaluations_per_sec": evaluations / seconds if seconds > 0 else None,
+        "time_to_target": _median([run["time_to_target"] for run in runs]),
+        "peak_rss_mb": _median([run["peak_rss_mb"] for run in runs]),
+        "baseline_rss_mb": _median([run["baseline_rss_mb"] for run in runs]),
+    }
+
+
+def environment() -> dict[str, Any]:
+    """Datos del entorno para saber qué se está comparando."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def run_benchmark(cases: Iterable[BenchCase], repeat: int = 3, on_case=None) -> dict[str, Any]:
+    """Ejecuta cada caso `repeat` veces, cada vez en un proceso nuevo.
+
+    Args:
+        cases: Casos a ejecutar.
+        repeat: Repeticiones por caso (se reporta la mediana del tiempo).
+        on_case: Se llama como `on_case(summary)` al terminar cada caso.
+    """
+    results = []
+    # max_tasks_per_child=1: un proceso nuevo por ejecución
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as executor:
+        for case in cases:
+            runs = [executor.submit(run_case, case).result() for _ in range(repeat)]
+            summary = summarize(case, runs)
+            results.append(summary)
+            if on_case is not None:
+                on_case(summary)
+    return {"version": BENCH_VERSION, "environment": environment(), "results": results}
+
+
+def save_report(report: dict[str, Any], path: Path | str) -> None:
+    Path(path).write_text(json.dumps(report, indent=2))
+
+
+def load_report(path: Path | str) -> dict[str, Any]:
+    return json.loads(Path(path).read_text())
+
+
+# Métrica -> True si un valor mayor es mejor
+COMPARED_METRICS = {
+    "iterations_per_sec": True,
+    "evaluations_per_sec": True,
+    "time_to_target": False,
+    "peak_rss_mb": False,
+}
+
+
+def compare_reports(baseline: dict[str, Any], current: dict[str, Any], threshold: float = 0.10) -> list[dict[str, Any]]:
+    """Compara dos reportes caso a caso.
+
+    Returns:
+        Lista de filas `{case, metric, baseline, current, change, regression}`
+        donde `change` es el cambio relativo y `regression` indica si
+        empeoró más que `threshold`.
+    """
+    base = {row["case"]: row for row in baseline["results"]}
+    rows = []
+    for row in current["results"]:
+        previous = base.get(row["case"])
+        if previous is None:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            old, new = previous.get(metric), row.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            worse = -change if higher_is_better else change
+            rows.append({"case": row["case"], "metric": metric, "baseline": old,
+                         "current": new, "change": change, "regression": worse > threshold})
+    return rows
@@ -0,0 +1,156 @@
+"""Checkpoints del estado de los solucionadores.
+
+Cada checkpoint es un único archivo `.npz` (sin comprimir, para que
+guardar la matriz de feromonas de una instancia grande sea barato) con
+los arreglos del estado y un bloque de metadatos JSON. La escritura es
+atómica: se escribe a un archivo temporal y se reemplaza con
+`os.replace`, por lo que una interrupción durante el guardado nunca deja
+un checkpoint corrupto.
+
+Usage:
+    checkpoint = Checkpointer("acs.npz", interval=60, resume=True)
+    acs = AntColonySystem(..., checkpoint=checkpoint)
+    acs.start()  # continúa desde acs.npz si existe
+"""
+
+import hashlib
+import json
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+import numpy as np
+import numpy.typing as npt
+
+CHECKPOINT_VERSION = 1
+
+State = tuple[dict[str, npt.NDArray], dict[str, Any]]
+
+
+def save_checkpoint(path: Path | str, arrays: dict[str, npt.NDArray], meta: dict[str, Any]) -> None:
+    """Guarda los arreglos y metadatos de forma atómica en `path`."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = json.dumps({"version": CHECKPOINT_VERSION, **meta}).encode()
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as file:
+        np.savez(file, __meta__=np.frombuffer(payload, dtype=np.uint8), **arrays)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path: Path | str) -> State:
+    """Carga un checkpoint guardado con `save_checkpoint`.
+
+    Returns:
+        tuple: (arreglos, metadatos).
+    """
+    with np.load(path) as data:
+        arrays = {name: data[name] for name in data.files if name != "__meta__"}
+        meta = json.loads(data["__meta__"].tobytes())
+    if meta.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(
+            f"Versión de checkpoint no soportada: {meta.get('version')}")
+    return arrays, meta
+
+
+def array_fingerprint(*arrays: npt.ArrayLike) -> str:
+    """Hash BLAKE2b del contenido de `arrays` (con su tipo y forma).
+
+    Se agrega a los parámetros del checkpoint para que no se pueda
+    reanudar con otra instancia del mismo tamaño.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+def numpy_rng_state() -> State:
+    """Estado del generador global de NumPy (`np.random.seed`)."""
+    name, keys, pos, has_gauss, cached_gaussian = np.random.get_state()
+    return {"np_rng_keys": keys}, {"np_rng": [name, int(pos), int(has_gauss), float(cached_gaussian)]}
+
+
+def restore_numpy_rng_state(arrays: dict[str, npt.NDArray], meta: dict[str, Any]) -> None:
+    name, pos, has_gauss, cached_gaussian = meta["np_rng"]
+    np.random.set_state((name, arrays["np_rng_keys"], pos, has_gauss, cached_gaussian))
+
+
+def python_rng_state() -> State:
+    """Estado del generador global del módulo `random`."""
+    version, internal, gauss_next = random.getstate()
+    return {"py_rng": np.array(internal, dtype=np.uint32)}, {"py_rng": [version, gauss_next]}
+
+
+def restore_python_rng_state(arrays: dict[str, npt.NDArray], meta: dict[str, Any]) -> None:
+    version, gauss_next = meta["py_rng"]
+    random.setstate((version, tuple(int(x) for x in arrays["py_rng"]), gauss_next))
+
+
+@dataclass
+class Checkpointer:
+    """Política de guardado y reanudación de un solucionador.
+
+    Se guarda cuando pasan `interval` segundos o `every` iteraciones desde
+    el último checkpoint (lo que ocurra primero). El estado solo se
+    construye cuando corresponde guardar, así que consultar `maybe_save`
+    en cada iteración es barato.
+
+    Attributes:
+        path: Archivo del checkpoint.
+        every: Iteraciones entre checkpoints (None para desactivar).
+        interval: Segundos entre checkpoints (None para desactivar).
+        resume: Si es True, el solucionador continúa desde `path` si existe.
+    """
+    path: Path | str
+    every: int | None = None
+    interval: float | None = 60.0
+    resume: bool = False
+    last_iteration: int = field(default=0, init=False)
+    last_time: float = field(default_factory=time.monotonic, init=False)
+
+    def __post_init__(self):
+        self.path = Path(self.path)
+
+    def load(self, solver: str, params: dict[str, Any]) -> State | None:
+        """Carga el checkpoint si `resume` está activo y el archivo existe.
+
+        Raises:
+            ValueError: Si el checkpoint pertenece a otro solucionador o a
+                otros parámetros (el máximo de iteraciones sí puede cambiar).
+        """
+        if not self.resume or not self.path.exists():
+            return None
+        arrays, meta = load_checkpoint(self.path)
+        if meta.get("solver") != solver or meta.get("params") != json.loads(json.dumps(params)):
+            raise ValueError(
+                f"El checkpoint {self.path} no corresponde a esta ejecución "
+                f"(solver={meta.get('solver')}, params={meta.get('params')}).")
+        self.last_iteration = meta["iteration"]
+        self.last_time = time.monotonic()
+        return arrays, meta
+
+    def due(self, iteration: int) -> bool:
+        if self.every is not None and iteration - self.last_iteration >= self.every:
+            return True
+        return self.interval is not None and time.monotonic() - self.last_time >= self.interval
+
+    def save(self, solver: str, params: dict[str, Any], iteration: int, state: State) -> None:
+        arrays, meta = state
+        save_checkpoint(self.path, arrays, {
+            **meta, "solver": solver, "params": params, "iteration": iteration})
+        self.last_iteration = iteration
+        self.last_time = time.monotonic()
+
+    def maybe_save(self, solver: str, params: dict[str, Any], iteration: int, state: Callable[[], State]) -> bool:
+        """Guarda `state()` si corresponde según `every` / `interval`."""
+        if not self.due(iteration):
+            return False
+        self.save(solver, params, iteration, state())
+        return True
@@ -0,0 +1,100 @@
+"""Instrumentación por fase de los ciclos de los solucionadores.
+
+Los solucionadores marcan el inicio y fin de cada fase con `tic()` /
+`toc(fase, t0)` y cuentan eventos con `count(nombre)`. Sin perfilador se
+usa `NULL_PROFILER`, cuyos métodos no hacen nada, por lo que el costo
+cuando está desactivado es una llamada vacía por fase.
+
+Al terminar, el solucionador llama a `finish()` y el perfilador emite el
+evento `report` con el resumen.
+
+Usage:
+    profiler = Profiler()
+    profiler.on("report", lambda report: print(format_report(report)))
+    AntColonySystem(..., profiler=profiler).start()
+"""
+
+import time
+from collections import defaultdict
+from typing import Any
+from src.core.EventEmitter import EventEmitter
+
+
+class Profiler(EventEmitter):
+    """Acumula tiempos por fase (en nanosegundos) y contadores."""
+
+    enabled = True
+
+    def __init__(self):
+        super().__init__()
+        self.times: defaultdict[str, int] = defaultdict(int)
+        self.calls: defaultdict[str, int] = defaultdict(int)
+        self.counters: defaultdict[str, int] = defaultdict(int)
+        self.started = time.perf_counter_ns()
+
+    def tic(self) -> int:
+        return time.perf_counter_ns()
+
+    def toc(self, phase: str, started: int) -> None:
+        self.times[phase] += time.perf_counter_ns() - started
+        self.calls[phase] += 1
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] += n
+
+    def report(self) -> dict[str, Any]:
+        """Resumen serializable: segundos y llamadas por fase, y contadores."""
+        return {
+            "total": (time.perf_counter_ns() - self.started) / 1e9,
+            "phases": {phase: {"seconds": ns / 1e9, "calls": self.calls[phase]}
+                       for phase, ns in self.times.items()},
+            "counters": dict(self.counters),
+        }
+
+    def merge(self, report: dict[str, Any]) -> None:
+        """Suma a este perfilador un reporte de otra ejecución (p. ej. de otro proceso)."""
+        for phase, data in report["phases"].items():
+            self.times[phase] += int(data["seconds"] * 1e9)
+            self.calls[phase] += data["calls"]
+        for name, value in report["counters"].items():
+            self.counters[name] += value
+
+    def finish(self) -> None:
+        self.emit("report", self.report())
+
+
+class NullProfiler:
+    """Perfilador desactivado: todas las operaciones son vacías."""
+
+    enabled = False
+
+    def tic(self) -> int:
+        return 0
+
+    def toc(self, phase: str, started: int) -> None:
+        pass
+
+    def count(self, name: str, n: int = 1) -> None:
+        pass
+
+    def finish(self) -> None:
+        pass
+
+
+NULL_PROFILER = NullProfiler()
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Tabla de texto con el porcentaje de tiempo de cada fase."""
+    measured = sum(data["seconds"] for data in report["phases"].values()) or 1.0
+    lines = ["", "=== PERFIL ===", f"{'Fase':<20}{'Tiempo (s)':>12}{'%':>8}{'Llamadas':>12}{'µs/llamada':>12}"]
+    for phase, data in sorted(report["phases"].items(), key=lambda item: -item[1]["seconds"]):
+        per_call = data["seconds"] / data["calls"] * 1e6 if data["calls"] else 0.0
+        lines.append(f"{phase:<20}{data['seconds']:>12.4f}{data['seconds'] / measured:>8.1%}"
+                     f"{data['calls']:>12}{per_call:>12.2f}")
+    if report["counters"]:
+        lines.append("")
+        lines.append(f"{'Contador':<20}{'Valor':>12}")
+        for name, value in sorted(report["counters"].items()):
+            lines.append(f"{name:<20}{value:>12}")
+    return "\n".join(lines)
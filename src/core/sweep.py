@@ -0,0 +1,112 @@
+"""Motor de barridos de parámetros sobre un pool de procesos.
+
+Las combinaciones de parámetros se agrupan en lotes (`chunksize`) que se
+envían a un `ProcessPoolExecutor`, manteniendo acotado el número de lotes
+en vuelo para no materializar barridos enormes en memoria. Los resultados
+se entregan a `on_result` siempre desde el proceso principal, de modo que
+un único escritor (por ejemplo una conexión SQLite) recibe todos los
+resultados sin necesidad de locks.
+
+Usage:
+    def task(params):
+        return NQueen(**params).start()
+
+    run_sweep(task, grid(seed=range(10), n=range(4, 16)), on_result=store)
+"""
+
+import itertools
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator
+import numpy as np
+
+
+Params = dict[str, Any]
+Task = Callable[[Params], Any]
+
+
+def grid(**ranges: Iterable[Any]) -> Iterator[Params]:
+    """Genera perezosamente el producto cartesiano de los rangos como diccionarios."""
+    keys = list(ranges)
+    for values in itertools.product(*ranges.values()):
+        yield dict(zip(keys, values))
+
+
+def task_seed(base_seed: int, index: int) -> int:
+    """Deriva una semilla independiente y reproducible para la tarea `index`."""
+    return int(np.random.SeedSequence([base_seed, index]).generate_state(1)[0])
+
+
+def _run_chunk(task: Task, chunk: list[tuple[int, Params]]) -> list[tuple[int, bool, Any]]:
+    results = []
+    for index, params in chunk:
+        try:
+            results.append((index, True, task(params)))
+        except Exception as exc:
+            results.append((index, False, exc))
+    return results
+
+
+def _chunks(combinations: Iterable[Params], chunksize: int, base_seed: int | None, seed_key: str) -> Iterator[list[tuple[int, Params]]]:
+    indexed = enumerate(combinations)
+    while chunk := list(itertools.islice(indexed, chunksize)):
+        if base_seed is not None:
+            chunk = [(index, {**params, seed_key: task_seed(base_seed, index)})
+                     for index, params in chunk]
+        yield chunk
+
+
+def run_sweep(
+    task: Task,
+    combinations: Iterable[Params],
+    on_result: Callable[[int, Params, Any], None],
+    on_error: Callable[[int, Params, Exception], None] | None = None,
+    workers: int | None = None,
+    chunksize: int = 8,
+    max_in_flight: int | None = None,
+    base_seed: int | None = None,
+    seed_key: str = "seed",
+) -> int:
+    """Ejecuta `task` sobre cada combinación de parámetros en paralelo.
+
+    Args:
+        task: Función a nivel de módulo (debe ser serializable con pickle).
+        combinations: Iterable (posiblemente perezoso) de diccionarios de parámetros.
+        on_result: Se llama como `on_result(index, params, result)` en el proceso principal.
+        on_error: Se llama con la excepción de una tarea fallida. Si es None, la excepción se propaga.
+        workers: Número de procesos (por defecto `os.cpu_count()`).
+        chunksize: Número de combinaciones por tarea enviada al pool.
+        max_in_flight: Máximo de lotes pendientes (por defecto `2 * workers`).
+        base_seed: Si se indica, cada tarea recibe en `seed_key` una semilla derivada de su índice.
+        seed_key: Nombre del parámetro donde se inyecta la semilla.
+
+    Returns:
+        int: Número de combinaciones procesadas.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * workers
+    chunks = _chunks(combinations, chunksize, base_seed, seed_key)
+    pending: dict = {}
+    processed = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while True:
+            for chunk in itertools.islice(chunks, max_in_flight - len(pending)):
+                pending[executor.submit(_run_chunk, task, chunk)] = dict(chunk)
+
+            if not pending:
+                break
+
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                params_by_index = pending.pop(future)
+                for index, ok, value in future.result():
+                    processed += 1
+                    if ok:
+                        on_result(index, params_by_index[index], value)
+                    elif on_error is not None:
+                        on_error(index, params_by_index[index], value)
+                    else:
+                        raise value
+
+    return processed
@@ -0,0 +1,163 @@
+"""Tareas de barrido para los solucionadores del repositorio.
+
+Cada tarea recibe un diccionario de parámetros y retorna un diccionario
+con el resultado, de modo que se puedan usar directamente con
+`src.core.sweep.run_sweep`. Las instancias (y la matriz heurística del
+TSP) se leen una sola vez por proceso gracias a `lru_cache`; la clave
+incluye la fecha de modificación del archivo, así que un proceso de larga
+vida (p. ej. `serve`) relee las instancias que cambian en disco.
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+import numpy as np
+import numpy.typing as npt
+from src.core.algorithms.AntColonySystem import AntColonySystem, heuristic_matrix
+from src.core.algorithms.ExtremeOptimization import ExtremeOptimization
+from src.core.algorithms.BatchExtremeOptimization import BatchExtremeOptimization
+from src.problems.n_queen.NQueen import NQueen
+from src.problems.knapsack.bounds import KnapsackBounds, knapsack_bounds
+from src.utils.instance_cache import load_knapsack
+from src.utils.knapack_parser import KnapdackData
+from src.core.termination import Termination
+from src.utils.tsp_parser import TSPInstance, read_tsplib
+
+
+def _stamp(path: Path | str) -> tuple[str, int]:
+    return str(path), os.stat(path).st_mtime_ns
+
+
+@lru_cache(maxsize=8)
+def _tsp_instance(path: str, mtime_ns: int) -> TSPInstance:
+    return read_tsplib(path)
+
+
+@lru_cache(maxsize=8)
+def _tsp_heuristics(path: str, mtime_ns: int) -> npt.NDArray:
+    return heuristic_matrix(_tsp_instance(path, mtime_ns)["distances"])
+
+
+@lru_cache(maxsize=8)
+def _knapsack_instances(path: str, mtime_ns: int) -> list[KnapdackData]:
+    return load_knapsack(path)
+
+
+@lru_cache(maxsize=64)
+def _knapsack_bounds(path: str, mtime_ns: int, index: int) -> KnapsackBounds:
+    instance = _knapsack_instances(path, mtime_ns)[index]
+    return knapsack_bounds(instance["precios"], instance["pesos"], instance["c"])
+
+
+def tsp_instance(path: Path | str) -> TSPInstance:
+    return _tsp_instance(*_stamp(path))
+
+
+def tsp_heuristics(path: Path | str) -> npt.NDArray:
+    return _tsp_heuristics(*_stamp(path))
+
+
+def knapsack_instances(path: Path | str) -> list[KnapdackData]:
+    return _knapsack_instances(*_stamp(path))
+
+
+def knapsack_instance_bounds(path: Path | str, index: int) -> KnapsackBounds:
+    return _knapsack_bounds(*_stamp(path), index)
+
+
+def json_default(value: Any) -> Any:
+    """`default` de `json.dumps` para los resultados (arreglos y escalares de NumPy)."""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+def nqueen_task(params: dict[str, Any], termination: Termination | None = None) -> dict[str, Any]:
+    """Parámetros: seed, n, population_size, crossover_rate, mutation_rate,
+    iterations y opcionalmente elitism, selection_method, steady_state, duplicates
+    y top."""
+    nqueen = NQueen(
+        params["seed"],
+        params["n"],
+        params["population_size"],
+        params["crossover_rate"],
+        params["mutation_rate"],
+        params["iterations"],
+        termination,
+        silent=params.get("silent", True),
+    )
+    sorted_population = nqueen.start(
+        params.get("elitism", False), params.get("selection_method", "roulette"),
+        steady_state=params.get("steady_state"), duplicates=params.get("duplicates"))
+    return {
+        "fitness": sorted_population[0][0],
+        "generations": nqueen.gen,
+        "top": sorted_population[:params.get("top", 10)],
+    }
+
+
+def acs_task(params: dict[str, Any], termination: Termination | None = None) -> dict[str, Any]:
+    """Parámetros: instance (ruta TSPLIB), seed, colony_size, alpha, beta, q0
+    y max_iterations."""
+    instance = tsp_instance(params["instance"])
+    acs = AntColonySystem(
+        params["seed"],
+        params["colony_size"],
+        params["alpha"],
+        params["beta"],
+        params["q0"],
+        params["max_iterations"],
+        instance["coordinates"],
+        distances=instance["distances"],
+        termination=termination,
+        heuristics=tsp_heuristics(params["instance"]),
+    )
+    tour = acs.start()
+    return {"cost": acs.cost(tour), "iterations": acs.it, "tour": tour}
+
+
+def eo_task(params: dict[str, Any], termination: Termination | None = None) -> dict[str, Any]:
+    """Parámetros: instance (ruta del archivo de la mochila), index (posición
+    de la instancia en el archivo), seed, tau, max_iterations y opcionalmente
+    bound (usar la cota superior como objetivo), gap, repair, initializer y
+    chains (cadenas vectorizadas con `BatchExtremeOptimization`)."""
+    if params.get("chains", 1) > 1 and params.get("repair") is not None:
+        raise ValueError("chains no se puede combinar con repair")
+    instance = knapsack_instances(params["instance"])[params["index"]]
+    bounds = knapsack_instance_bounds(params["instance"], params["index"]) if params.get("bound") else None
+    kwargs = dict(
+        seed=params["seed"],
+        n_items=instance["n"],
+        capacidad=instance["c"],
+        tau=params["tau"],
+        precios=np.array(instance["precios"], dtype=np.int32),
+        pesos=np.array(instance["pesos"], dtype=np.int32),
+        max_iterations=params["max_iterations"],
+        optimal_solution=instance["z"],
+        termination=termination,
+        upper_bound=bounds.upper if bounds is not None else None,
+        gap_tolerance=params.get("gap", 0.0),
+        initializer=params.get("initializer", "random"),
+    )
+    if params.get("chains", 1) > 1:
+        optimizer = BatchExtremeOptimization(chains=params["chains"], **kwargs)
+    else:
+        optimizer = ExtremeOptimization(repair=params.get("repair"), **kwargs)
+    _, price = optimizer.start()
+    result = {"price": int(price), "iterations": optimizer.iterations, "z": instance["z"]}
+    if bounds is not None:
+        result.update(bound=bounds.upper, bound_exact=bounds.exact, gap=bounds.gap(int(price)))
+    return result
+
+
+TASKS = {"n-queen": nqueen_task, "acs": acs_task, "eo": eo_task}
+
+
+def solver_task(params: dict[str, Any], termination: Termination | None = None) -> dict[str, Any]:
+    """Despacha según `params["solver"]` (`n-queen`, `acs` o `eo`)."""
+    task = TASKS.get(params.get("solver"))
+    if task is None:
+        raise ValueError(
+            f"Solucionador desconocido: {params.get('solver')!r} (opciones: {', '.join(TASKS)})")
+    return task(params, termination)
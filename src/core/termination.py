@@ -0,0 +1,145 @@
+"""Criterios de término compartidos por todos los solucionadores.
+
+Cada solucionador llama a `start()` al comenzar y a
+`done(iteration, evaluations, best)` una vez por iteración, pasando el
+mejor valor que ya tiene en caché (nunca se recalcula el costo para
+evaluar el criterio). Los criterios se combinan con `|`.
+
+Usage:
+    termination = TimeBudget(60) | TargetValue(7542) | Stagnation(200)
+    acs = AntColonySystem(..., termination=termination)
+"""
+
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+
+
+class Termination(ABC):
+    def start(self) -> None:
+        """Reinicia el estado interno al comenzar una ejecución."""
+
+    @abstractmethod
+    def done(self, iteration: int, evaluations: int, best: float) -> bool: ...
+
+    def __or__(self, other: "Termination") -> "AnyOf":
+        return AnyOf([self, other])
+
+
+@dataclass
+class AnyOf(Termination):
+    """Termina cuando se cumple cualquiera de los criterios.
+
+    Attributes:
+        triggered: Criterio que detuvo la ejecución (None si ninguno).
+    """
+    criteria: list[Termination]
+    triggered: Termination | None = field(default=None, init=False)
+
+    def start(self) -> None:
+        self.triggered = None
+        for criterion in self.criteria:
+            criterion.start()
+
+    def done(self, iteration: int, evaluations: int, best: float) -> bool:
+        for criterion in self.criteria:
+            if criterion.done(iteration, evaluations, best):
+                self.triggered = criterion
+                return True
+        return False
+
+    def __or__(self, other: Termination) -> "AnyOf":
+        return AnyOf([*self.criteria, other])
+
+
+@dataclass
+class MaxIterations(Termination):
+    iterations: int
+
+    def done(self, iteration: int, evaluations: int, best: float) -> bool:
+        return iteration >= self.iterations
+
+
+@dataclass
+class TimeBudget(Termination):
+    """Presupuesto de tiempo de reloj en segundos desde `start()`."""
+    seconds: float
+    deadline: float = field(default=float("inf"), init=False)
+
+    def start(self) -> None:
+        self.deadline = time.perf_counter() + self.seconds
+
+    def done(self, iteration: int, evaluations: int, best: float) -> bool:
+        return time.perf_counter() >= self.deadline
+
+
+@dataclass
+class EvaluationBudget(Termination):
+    """Número máximo de evaluaciones de la función objetivo."""
+    evaluations: int
+
+    def done(self, iteration: int, evaluations: int, best: float) -> bool:
+        return evaluations >= self.evaluations
+
+
+@dataclass
+class TargetValue(Termination):
+    """Termina al alcanzar `target` con una tolerancia absoluta o relativa."""
+    target: float
+    tolerance: float = 0.0
+    relative: bool = False
+    minimize: bool = True
+
+    def done(self, iteration: int, evaluations: int, best: float) -> bool:
+        slack = self.tolerance * abs(self.target) if self.relative else self.tolerance
+        if self.minimize:
+            return best <= self.target + slack
+        return best >= self.target - slack
+
+
+@dataclass
+class Stagnation(Termination):
+    """Termina si el mejor valor no mejora en más de `min_delta` durante `window` iteraciones."""
+    window: int
+    min_delta: float = 0.0
+    minimize: bool = True
+    reference: float | None = field(default=None, init=False)
+    since: int = field(default=0, init=False)
+
+    def start(self) -> None:
+        self.reference = None
+        self.since = 0
+
+    def done(self, iteration: int, evaluations: int, best: float) -> bool:
+        improvement = None if self.reference is None else (
+            self.reference - best if self.minimize else best - self.reference)
+        if improvement is None or improvement > self.min_delta:
+            self.reference = best
+            self.since = iteration
+            return False
+        return iteration - self.since >= self.window
+
+
+def build_termination(
+    time_limit: float | None = None,
+    max_evaluations: int | None = None,
+    target: float | None = None,
+    tolerance: float = 0.0,
+    stagnation: int | None = None,
+    minimize: bool = True,
+) -> Termination | None:
+    """Construye la combinación de criterios a partir de las opciones de la CLI.
+
+    Returns:
+        Termination | None: None si no se indicó ningún criterio.
+    """
+    criteria: list[Termination] = []
+    if time_limit is not None:
+        criteria.append(TimeBudget(time_limit))
+    if max_evaluations is not None:
+        criteria.append(EvaluationBudget(max_evaluations))
+    if target is not None:
+        criteria.append(TargetValue(target, tolerance, minimize=minimize))
+    if stagnation is not None:
+        criteria.append(Stagnation(stagnation, minimize=minimize))
+    return AnyOf(criteria) if criteria else None
@@ -0,0 +1,84 @@
+import tempfile
+import unittest
+from pathlib import Path
+import numpy as np
+
+from src.core.algorithms.AntColonySystem import AntColonySystem
+from src.core.algorithms.ExtremeOptimization import ExtremeOptimization
+from src.core.checkpoint import Checkpointer
+
+
+def random_nodes(seed, n=25):
+    return np.random.default_rng(seed).uniform(0, 1000, (n, 2))
+
+
+def random_knapsack(seed, n=60):
+    rng = np.random.default_rng(seed)
+    pesos = rng.integers(1, 100, n).astype(np.int32)
+    return dict(n_items=n, capacidad=int(pesos.sum() // 3), tau=1.4,
+                precios=rng.integers(1, 100, n).astype(np.int32), pesos=pesos)
+
+
+class CheckpointTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "state.npz"
+
+
+class TestAntColonySystemResume(CheckpointTestCase):
+    def acs(self, max_iterations, nodes=None, checkpoint=None):
+        return AntColonySystem(3, 8, 0.1, 2.5, 0.9, max_iterations,
+                               random_nodes(1) if nodes is None else nodes, checkpoint=checkpoint)
+
+    def test_resume_matches_straight_run(self):
+        straight = self.acs(12)
+        straight.start()
+
+        self.acs(5, checkpoint=Checkpointer(self.path, every=1)).start()
+        resumed = self.acs(12, checkpoint=Checkpointer(self.path, every=1, resume=True))
+        resumed.start()
+
+        self.assertEqual(resumed.it, straight.it)
+        self.assertEqual(resumed.evaluations, straight.evaluations)
+        self.assertEqual(resumed.best_cost, straight.best_cost)
+        self.assertEqual(resumed.best_solution.tolist(), straight.best_solution.tolist())
+        np.testing.assert_array_equal(resumed.pheromones, straight.pheromones)
+
+    def test_resume_with_another_instance_is_rejected(self):
+        self.acs(3, checkpoint=Checkpointer(self.path, every=1)).start()
+        other = self.acs(6, nodes=random_nodes(2), checkpoint=Checkpointer(self.path, resume=True))
+        with self.assertRaises(ValueError):
+            other.start()
+
+
+class TestExtremeOptimizationResume(CheckpointTestCase):
+    def eo(self, max_iterations, instance=None, checkpoint=None, **kwargs):
+        return ExtremeOptimization(seed=5, max_iterations=max_iterations, checkpoint=checkpoint,
+                                   **(instance or random_knapsack(1)), **kwargs)
+
+    def test_resume_matches_straight_run(self):
+        for repair in (None, "rank"):
+            with self.subTest(repair=repair):
+                self.path.unlink(missing_ok=True)
+                straight_sol, straight_price = self.eo(400, repair=repair).start()
+
+                self.eo(150, checkpoint=Checkpointer(self.path, every=1), repair=repair).start()
+                resumed = self.eo(400, checkpoint=Checkpointer(self.path, every=1, resume=True),
+                                  repair=repair)
+                resumed_sol, resumed_price = resumed.start()
+
+                self.assertEqual(resumed.iterations, 400)
+                self.assertEqual(resumed_price, straight_price)
+                self.assertEqual(resumed_sol.tolist(), straight_sol.tolist())
+
+    def test_resume_with_another_instance_is_rejected(self):
+        self.eo(50, checkpoint=Checkpointer(self.path, every=1)).start()
+        instance = random_knapsack(1)
+        instance["precios"] = instance["precios"][::-1].copy()
+        with self.assertRaises(ValueError):
+            self.eo(100, instance, checkpoint=Checkpointer(self.path, resume=True)).start()
+
+
+if __name__ == "__main__":
+    unittest.main()
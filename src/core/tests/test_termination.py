@@ -0,0 +1,154 @@
+import unittest
+from unittest import mock
+
+from src.core import termination
+from src.core.algorithms.GeneticAlgo import GeneticAlgo
+from src.core.termination import (AnyOf, EvaluationBudget, MaxIterations, Stagnation, TargetValue,
+                                  TimeBudget, build_termination)
+
+
+class ConstantGA(GeneticAlgo[list[int]]):
+    """Todos los individuos tienen el mismo fitness: el mejor nunca mejora."""
+
+    def generate_population(self):
+        return [[k] for k in range(self.population_size)]
+
+    def fitness(self, individual):
+        return 1
+
+    def crossover(self, parent1, parent2):
+        return parent2.copy()
+
+    def mutate(self, individual):
+        return individual.copy()
+
+    def end_condition(self):
+        return self.terminated() or self.gen >= 100
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def perf_counter(self):
+        return self.now
+
+
+class TestTimeBudget(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(termination, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_deadline_counts_from_start(self):
+        budget = TimeBudget(2.5)
+        self.clock.now = 50.0
+        budget.start()
+        self.clock.now = 52.4
+        self.assertFalse(budget.done(1, 1, 0))
+        self.clock.now = 52.5
+        self.assertTrue(budget.done(2, 2, 0))
+
+    def test_restart_resets_the_deadline(self):
+        budget = TimeBudget(1)
+        budget.start()
+        self.clock.now += 5
+        self.assertTrue(budget.done(1, 1, 0))
+        budget.start()
+        self.assertFalse(budget.done(1, 1, 0))
+
+    def test_not_started_never_ends(self):
+        self.assertFalse(TimeBudget(0).done(1, 1, 0))
+
+
+class TestStagnation(unittest.TestCase):
+    def run_until_done(self, criterion, values):
+        criterion.start()
+        for iteration, best in enumerate(values):
+            if criterion.done(iteration, iteration, best):
+                return iteration
+        return None
+
+    def test_constant_fitness_stops_after_window(self):
+        self.assertEqual(self.run_until_done(Stagnation(10), [7] * 100), 10)
+
+    def test_improvement_resets_the_window(self):
+        values = [9] * 5 + [8] * 20
+        self.assertEqual(self.run_until_done(Stagnation(10), values), 15)
+
+    def test_improvements_below_min_delta_do_not_count(self):
+        values = [10 - 0.01 * k for k in range(100)]
+        self.assertEqual(self.run_until_done(Stagnation(10, min_delta=0.5), values), 10)
+        self.assertIsNone(self.run_until_done(Stagnation(10), values))
+
+    def test_maximize(self):
+        values = [1, 2, 3] + [3] * 10 + [2] * 10
+        self.assertEqual(self.run_until_done(Stagnation(5, minimize=False), values), 7)
+
+    def test_start_resets_state(self):
+        criterion = Stagnation(3)
+        self.assertEqual(self.run_until_done(criterion, [1] * 10), 3)
+        self.assertEqual(self.run_until_done(criterion, [5] * 10), 3)
+
+    def test_genetic_algorithm_with_constant_fitness(self):
+        ga = ConstantGA(1, 10, 0.1, 0.9, termination=Stagnation(5))
+        ga.start()
+        self.assertEqual(ga.gen, 5)
+
+
+class TestTargetValue(unittest.TestCase):
+    def test_minimize(self):
+        target = TargetValue(100)
+        self.assertFalse(target.done(1, 1, 100.5))
+        self.assertTrue(target.done(1, 1, 100))
+        self.assertTrue(target.done(1, 1, 99))
+
+    def test_absolute_and_relative_tolerance(self):
+        self.assertTrue(TargetValue(100, tolerance=2).done(1, 1, 102))
+        self.assertFalse(TargetValue(100, tolerance=2).done(1, 1, 102.1))
+        self.assertTrue(TargetValue(200, tolerance=0.01, relative=True).done(1, 1, 202))
+        self.assertFalse(TargetValue(200, tolerance=0.01, relative=True).done(1, 1, 202.1))
+
+    def test_maximize(self):
+        target = TargetValue(500, tolerance=0.1, relative=True, minimize=False)
+        self.assertFalse(target.done(1, 1, 449))
+        self.assertTrue(target.done(1, 1, 450))
+
+    def test_genetic_algorithm_stops_at_target(self):
+        ga = ConstantGA(1, 10, 0.1, 0.9, termination=TargetValue(1))
+        ga.start()
+        self.assertEqual(ga.gen, 0)
+
+
+class TestCombination(unittest.TestCase):
+    def test_any_of_reports_the_triggered_criterion(self):
+        iterations = MaxIterations(5)
+        evaluations = EvaluationBudget(30)
+        combined = iterations | evaluations
+        self.assertIsInstance(combined, AnyOf)
+        combined.start()
+        self.assertFalse(combined.done(1, 10, 0))
+        self.assertTrue(combined.done(3, 30, 0))
+        self.assertIs(combined.triggered, evaluations)
+        combined.start()
+        self.assertIsNone(combined.triggered)
+        self.assertTrue(combined.done(5, 0, 0))
+        self.assertIs(combined.triggered, iterations)
+
+    def test_or_flattens(self):
+        combined = MaxIterations(1) | EvaluationBudget(1) | Stagnation(1)
+        self.assertEqual(len(combined.criteria), 3)
+
+    def test_build_termination(self):
+        self.assertIsNone(build_termination())
+        combined = build_termination(time_limit=5, max_evaluations=10, target=3, tolerance=1,
+                                     stagnation=7, minimize=False)
+        self.assertEqual([type(c) for c in combined.criteria],
+                         [TimeBudget, EvaluationBudget, TargetValue, Stagnation])
+        self.assertFalse(combined.criteria[2].minimize)
+        self.assertFalse(combined.criteria[3].minimize)
+
+
+if __name__ == "__main__":
+    unittest.main()
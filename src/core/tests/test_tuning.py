@@ -0,0 +1,102 @@
+import unittest
+from unittest import mock
+import numpy as np
+
+from src.core import tuning
+from src.core.tuning import f_race, friedman_discard, has_scipy, successive_halving
+
+
+def stub_cost(params):
+    """Costo determinista: menor `x` es mejor; más iteraciones reducen el costo."""
+    budget = params[tuning.BUDGET_KEYS[params["solver"]]]
+    return params["x"] * 100 / budget + (params["seed"] % 3) * 0.01
+
+
+def configs(*values):
+    return [{"x": x} for x in values]
+
+
+class StubbedTestCase(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+        def cost(params):
+            self.calls.append(params)
+            return stub_cost(params)
+
+        patcher = mock.patch.object(tuning, "cost_task", cost)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TestSuccessiveHalving(StubbedTestCase):
+    def test_reaches_max_budget(self):
+        # Con eta=3 y 4 configuraciones queda una tras el presupuesto 15: igual se evalúa con 45
+        race = successive_halving("n-queen", configs(4, 1, 3, 2), {"n": 8}, 5, 45, eta=3, seeds=3)
+        self.assertEqual([entry["budget"] for entry in race.history], [5, 15, 45])
+        self.assertEqual([entry["alive"] for entry in race.history], [4, 2, 1])
+        self.assertEqual(race.best, {"x": 1})
+        self.assertEqual(race.budgets[race.ranking[0]], 45)
+        self.assertEqual(race.evaluations, 4 * 3 + 2 * 3 + 1 * 3)
+        self.assertEqual(race.budget_used, 4 * 3 * 5 + 2 * 3 * 15 + 1 * 3 * 45)
+
+    def test_single_survivor_jumps_to_max_budget(self):
+        race = successive_halving("n-queen", configs(2, 1), {}, 1, 100, eta=2, seeds=1)
+        self.assertEqual([entry["budget"] for entry in race.history], [1, 100])
+
+    def test_stops_at_max_budget_with_several_alive(self):
+        race = successive_halving("n-queen", configs(*range(27)), {}, 1, 9, eta=3, seeds=2)
+        self.assertEqual([entry["budget"] for entry in race.history], [1, 3, 9])
+        self.assertEqual(race.history[-1]["survivors"], 3)
+        self.assertEqual(sorted(race.ranking), list(range(27)))
+        self.assertEqual(race.ranking[:3], [0, 1, 2])
+
+    def test_jobs_use_budget_key_fixed_params_and_paired_seeds(self):
+        successive_halving("acs", configs(1, 2), {"instance": "a.tsp"}, 10, 10, seeds=2,
+                           base_seed=7)
+        self.assertEqual(len(self.calls), 4)
+        for params in self.calls:
+            self.assertEqual(params["solver"], "acs")
+            self.assertEqual(params["instance"], "a.tsp")
+            self.assertEqual(params["max_iterations"], 10)
+        self.assertEqual([params["seed"] for params in self.calls], [7, 8, 7, 8])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            successive_halving("n-queen", configs(1), {}, 5, 45, eta=1)
+        with self.assertRaises(ValueError):
+            successive_halving("n-queen", configs(1), {}, 50, 45)
+        with self.assertRaises(ValueError):
+            successive_halving("tsp", configs(1), {}, 5, 45)
+        with self.assertRaises(ValueError):
+            successive_halving("n-queen", [], {}, 5, 45)
+
+
+@unittest.skipUnless(has_scipy(), "requiere scipy")
+class TestFRace(StubbedTestCase):
+    def test_discards_clearly_worse_configurations(self):
+        race = f_race("n-queen", configs(1, 5, 9), {}, 100, max_blocks=10, min_blocks=3)
+        self.assertEqual(race.best, {"x": 1})
+        self.assertLess(len(race.history), 10)
+        self.assertEqual(len(race.costs[race.ranking[0]]), len(race.history))
+
+    def test_friedman_keeps_ties(self):
+        costs = np.ones((6, 3))
+        self.assertFalse(friedman_discard(costs).any())
+
+    def test_friedman_discards_only_the_worst(self):
+        # Las dos primeras se alternan en cada bloque; la tercera siempre es la peor
+        costs = np.array([[1, 2, 9], [2, 1, 9]] * 5, dtype=float)
+        self.assertEqual(friedman_discard(costs, 0.05).tolist(), [False, False, True])
+
+
+class TestRequireScipy(unittest.TestCase):
+    def test_f_race_without_scipy_raises_import_error(self):
+        with mock.patch.object(tuning, "stats", None):
+            self.assertFalse(has_scipy())
+            with self.assertRaises(ImportError):
+                f_race("n-queen", configs(1, 2), {}, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
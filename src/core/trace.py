@@ -0,0 +1,113 @@
+"""Registro de la convergencia de los solucionadores.
+
+Cada iteración se escribe como una fila de un arreglo de NumPy
+preasignado que crece geométricamente (duplicando su capacidad), de modo
+que registrar una iteración no asigna memoria en el caso común. Con
+`max_points` la traza se submuestrea: al llenarse se descarta una de
+cada dos filas y se duplica el paso entre iteraciones registradas, por
+lo que una ejecución de millones de iteraciones ocupa memoria acotada.
+
+Usage:
+    trace = TraceRecorder(max_points=10_000)
+    acs = AntColonySystem(..., trace=trace)
+    acs.start()
+    plt.plot(trace.column("iteration"), trace.column("best"))
+"""
+
+import math
+import time
+from pathlib import Path
+import numpy as np
+import numpy.typing as npt
+
+FIELDS = ("iteration", "best", "mean", "worst", "diversity", "elapsed")
+
+
+class TraceRecorder:
+    """
+    Traza por iteración de mejor/media/peor fitness, diversidad y tiempo.
+
+    Los campos no disponibles para un solucionador (p. ej. `worst` en EO,
+    que mantiene una única solución) quedan como NaN.
+
+    Args:
+        capacity: Filas preasignadas inicialmente.
+        max_points: Máximo de filas antes de submuestrear (None para no limitar).
+    """
+
+    def __init__(self, capacity: int = 1024, max_points: int | None = None):
+        if max_points is not None and max_points < 2:
+            raise ValueError("max_points debe ser al menos 2")
+        self.max_points = max_points
+        self._initial_capacity = max(1, capacity if max_points is None else min(capacity, max_points))
+        self.start()
+
+    def start(self) -> None:
+        """Descarta lo registrado y reinicia el reloj."""
+        self._data = np.empty((self._initial_capacity, len(FIELDS)), dtype=np.float64)
+        self._size = 0
+        self._seen = 0
+        self.stride = 1
+        self._last: tuple[float, ...] | None = None
+        self._started = time.perf_counter()
+
+    def record(self, iteration: int, best: float, mean: float = math.nan,
+               worst: float = math.nan, diversity: float = math.nan) -> None:
+        row = (iteration, best, mean, worst, diversity, time.perf_counter() - self._started)
+        self._last = row
+        seen = self._seen
+        self._seen += 1
+        if seen % self.stride:
+            return
+
+        if self._size == len(self._data):
+            if self.max_points is not None and self._size >= self.max_points:
+                self._downsample()
+                if seen % self.stride:
+                    return
+            else:
+                self._grow()
+        self._data[self._size] = row
+        self._size += 1
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self._data)
+        if self.max_points is not None:
+            capacity = min(capacity, self.max_points)
+        data = np.empty((capacity, len(FIELDS)), dtype=np.float64)
+        data[:self._size] = self._data[:self._size]
+        self._data = data
+
+    def _downsample(self) -> None:
+        kept = self._data[:self._size:2]
+        self._size = len(kept)
+        self._data[:self._size] = kept
+        self.stride *= 2
+
+    def __len__(self) -> int:
+        return self._size
+
+    def as_array(self, include_last: bool = True) -> npt.NDArray[np.float64]:
+        """Filas registradas (copia); con `include_last` se agrega la última
+        iteración observada si el submuestreo la omitió."""
+        data = self._data[:self._size]
+        if include_last and self._last is not None and (
+                self._size == 0 or data[-1, 0] != self._last[0]):
+            data = np.vstack([data, self._last])
+        return data.copy()
+
+    def column(self, name: str, include_last: bool = True) -> npt.NDArray[np.float64]:
+        return self.as_array(include_last)[:, FIELDS.index(name)]
+
+    def as_dict(self, include_last: bool = True) -> dict[str, npt.NDArray[np.float64]]:
+        data = self.as_array(include_last)
+        return {name: data[:, i] for i, name in enumerate(FIELDS)}
+
+    def save(self, path: Path | str) -> None:
+        """Guarda la traza como `.npz` o, con cualquier otra extensión, como CSV."""
+        path = Path(path)
+        if path.suffix == ".npz":
+            np.savez(path, **self.as_dict())
+        else:
+            np.savetxt(path, self.as_array(), delimiter=",",
+                       header=",".join(FIELDS), comments="", fmt="%.10g")
@@ -0,0 +1,259 @@
+"""Ajuste de parámetros por carreras (racing).
+
+En lugar de ejecutar cada configuración de una grilla con todas las
+semillas y el presupuesto completo, las carreras descartan pronto las
+configuraciones claramente inferiores y dedican el cómputo restante a
+las prometedoras.
+
+- `successive_halving`: evalúa todas las configuraciones con un
+  presupuesto pequeño de iteraciones y conserva la mejor fracción
+  `1/eta`; el presupuesto se multiplica por `eta` en cada ronda hasta
+  `max_budget`. La última ronda siempre usa `max_budget`.
+- `f_race` (Birattari et al., 2002): evalúa las configuraciones vivas con
+  el presupuesto completo, una semilla (bloque) a la vez. Desde
+  `min_blocks` bloques aplica la prueba de Friedman y, si es
+  significativa, elimina las configuraciones cuya suma de rangos es
+  peor que la de la mejor según la comparación post-hoc de Conover.
+  Requiere `scipy` (dependencia opcional: `pip install .[tune]`).
+
+Todas las configuraciones usan las mismas semillas en cada ronda, de modo
+que las comparaciones son pareadas. El costo de una ejecución se obtiene
+del resultado de `sweep_tasks` con `OBJECTIVES` (menor es mejor).
+
+Usage:
+    configs = list(grid(colony_size=[5, 10, 20], alpha=[0.1, 0.3], beta=[2, 5], q0=[0.5, 0.9]))
+    race = successive_halving("acs", configs, {"instance": "berlin52.tsp"},
+                              min_budget=30, max_budget=1000)
+    print(race.best, race.budget_used)
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Callable
+import numpy as np
+import numpy.typing as npt
+from src.core.sweep import run_sweep
+from src.core.sweep_tasks import solver_task
+
+try:
+    from scipy import stats
+except ImportError:  # pragma: no cover - depende del entorno
+    stats = None
+
+Params = dict[str, Any]
+
+# Costo (menor es mejor) a partir del resultado de cada tarea de `sweep_tasks`
+OBJECTIVES: dict[str, Callable[[dict[str, Any]], float]] = {
+    "n-queen": lambda result: result["fitness"],
+    "acs": lambda result: result["cost"],
+    "eo": lambda result: -result["price"],
+}
+
+# Parámetro que fija el presupuesto (iteraciones) de cada solucionador
+BUDGET_KEYS = {"n-queen": "iterations", "acs": "max_iterations", "eo": "max_iterations"}
+
+
+def has_scipy() -> bool:
+    return stats is not None
+
+
+def _require_scipy() -> None:
+    if stats is None:
+        raise ImportError("F-race requiere scipy: pip install .[tune] (o pip install scipy)")
+
+
+@dataclass
+class RaceResult:
+    """Resultado de una carrera.
+
+    Attributes:
+        configs: Configuraciones evaluadas.
+        ranking: Índices de `configs` de la mejor a la peor; primero las
+            sobrevivientes y luego las eliminadas, de la última a la primera.
+        costs: Costos de cada configuración en su última ronda.
+        budgets: Presupuesto de la última ronda de cada configuración.
+        evaluations: Número de ejecuciones del solucionador.
+        budget_used: Suma de los presupuestos de todas las ejecuciones.
+        history: Una entrada por ronda (ronda, presupuesto, vivas, evaluaciones).
+    """
+    configs: list[Params]
+    ranking: list[int] = field(default_factory=list)
+    costs: list[list[float]] = field(default_factory=list)
+    budgets: list[int] = field(default_factory=list)
+    evaluations: int = 0
+    budget_used: int = 0
+    history: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def best(self) -> Params:
+        return self.configs[self.ranking[0]]
+
+    def mean_cost(self, index: int) -> float:
+        return float(np.mean(self.costs[index]))
+
+
+def cost_task(params: Params) -> float:
+    """Ejecuta `solver_task` y retorna solo el costo, para no transferir tours ni poblaciones."""
+    return float(OBJECTIVES[params["solver"]](solver_task(params)))
+
+
+def _run_round(jobs: list[Params], workers: int) -> list[float]:
+    if workers == 1:
+        return [cost_task(job) for job in jobs]
+    costs = [0.0] * len(jobs)
+
+    def on_result(index: int, params: Params, cost: float) -> None:
+        costs[index] = cost
+
+    run_sweep(cost_task, jobs, on_result, workers=workers, chunksize=1)
+    return costs
+
+
+class _Race:
+    """Estado compartido por los dos métodos: ejecuta rondas y contabiliza el presupuesto."""
+
+    def __init__(self, solver: str, configs: list[Params], fixed: Params, workers: int,
+                 on_round: Callable[[dict[str, Any]], None] | None):
+        if solver not in BUDGET_KEYS:
+            raise ValueError(
+                f"Solucionador desconocido: {solver!r} (opciones: {', '.join(BUDGET_KEYS)})")
+        if not configs:
+            raise ValueError("Se necesita al menos una configuración")
+        self.solver = solver
+        self.fixed = fixed
+        self.workers = workers
+        self.on_round = on_round
+        self.result = RaceResult(list(configs), costs=[[] for _ in configs], budgets=[0] * len(configs))
+        self.alive = list(range(len(configs)))
+        self.dropped: list[list[int]] = []
+
+    def run(self, seeds: list[int], budget: int) -> None:
+        """Evalúa cada configuración viva con cada semilla y `budget` iteraciones."""
+        result = self.result
+        jobs = [{"solver": self.solver, **self.fixed, **result.configs[i],
+                 BUDGET_KEYS[self.solver]: budget, "seed": seed}
+                for i in self.alive for seed in seeds]
+        values = _run_round(jobs, self.workers)
+        for k, i in enumerate(self.alive):
+            result.costs[i] = values[k * len(seeds):(k + 1) * len(seeds)]
+            result.budgets[i] = budget
+        result.evaluations += len(jobs)
+        result.budget_used += len(jobs) * budget
+
+    def end_round(self, budget: int, survivors: list[int]) -> None:
+        """Registra la ronda y conserva `survivors` (ordenadas de mejor a peor)."""
+        entry = {"round": len(self.result.history) + 1, "budget": budget,
+                 "alive": len(self.alive), "survivors": len(survivors),
+                 "evaluations": self.result.evaluations}
+        kept = set(survivors)
+        self.dropped.append(self.sorted([i for i in self.alive if i not in kept]))
+        self.alive = survivors
+        self.result.history.append(entry)
+        if self.on_round is not None:
+            self.on_round(entry)
+
+    def sorted(self, indices: list[int]) -> list[int]:
+        return sorted(indices, key=lambda i: (self.result.mean_cost(i), i))
+
+    def finish(self) -> RaceResult:
+        self.result.ranking = self.sorted(self.alive) + [
+            i for dropped in reversed(self.dropped) for i in dropped]
+        return self.result
+
+
+def successive_halving(solver: str, configs: list[Params], fixed: Params, min_budget: int,
+                       max_budget: int, eta: int = 3, seeds: int = 3, base_seed: int = 1,
+                       workers: int = 1,
+                       on_round: Callable[[dict[str, Any]], None] | None = None) -> RaceResult:
+    """Successive halving sobre el presupuesto de iteraciones.
+
+    En cada ronda se ejecuta cada configuración viva con las semillas
+    `base_seed, ..., base_seed + seeds - 1` y se conservan las
+    `ceil(vivas / eta)` de menor costo medio. La carrera termina tras la
+    ronda con `max_budget`: si antes queda una sola configuración, se
+    pasa directo a esa ronda, de modo que la ganadora siempre se evalúa
+    con el presupuesto completo.
+    """
+    if eta < 2:
+        raise ValueError("eta debe ser al menos 2")
+    if not 0 < min_budget <= max_budget:
+        raise ValueError("Se requiere 0 < min_budget <= max_budget")
+    race = _Race(solver, configs, fixed, workers, on_round)
+    seed_list = [base_seed + k for k in range(seeds)]
+    budget = min_budget
+    while True:
+        race.run(seed_list, budget)
+        order = race.sorted(race.alive)
+        if budget >= max_budget or len(order) == 1:
+            race.end_round(budget, order)
+            break
+        race.end_round(budget, order[:math.ceil(len(order) / eta)])
+        budget = max_budget if len(race.alive) == 1 else min(budget * eta, max_budget)
+    return race.finish()
+
+
+def friedman_discard(costs: npt.NDArray[np.float64], alpha: float = 0.05) -> npt.NDArray[np.bool_]:
+    """Configuraciones (columnas) que F-race descarta tras `k` bloques (filas).
+
+    Con dos configuraciones se usa la prueba de rangos con signo de
+    Wilcoxon; con más, la prueba de Friedman seguida de la comparación
+    de Conover de cada suma de rangos contra la mejor.
+    """
+    _require_scipy()
+    k, m = costs.shape
+    discard = np.zeros(m, dtype=bool)
+    if m == 2:
+        if not np.any(costs[:, 0] != costs[:, 1]):
+            return discard
+        try:
+            p = stats.wilcoxon(costs[:, 0], costs[:, 1]).pvalue
+        except ValueError:
+            return discard
+        if p < alpha:
+            discard[int(np.argmax(costs.mean(axis=0)))] = True
+        return discard
+
+    ranks = stats.rankdata(costs, axis=1)
+    rank_sums = ranks.sum(axis=0)
+    a = float((ranks ** 2).sum())
+    c = k * m * (m + 1) ** 2 / 4
+    if a - c <= 0:
+        # Todas las configuraciones empatan en todos los bloques
+        return discard
+    t_stat = (m - 1) * float(((rank_sums - k * (m + 1) / 2) ** 2).sum()) / (a - c)
+    if stats.chi2.sf(t_stat, m - 1) >= alpha:
+        return discard
+    dof = (k - 1) * (m - 1)
+    critical = stats.t.ppf(1 - alpha / 2, dof) * math.sqrt(
+        max(0.0, 2 * k * (1 - t_stat / (k * (m - 1))) * (a - c) / dof))
+    return rank_sums - rank_sums.min() > critical
+
+
+def f_race(solver: str, configs: list[Params], fixed: Params, budget: int, max_blocks: int = 20,
+           min_blocks: int = 5, alpha: float = 0.05, base_seed: int = 1, workers: int = 1,
+           on_round: Callable[[dict[str, Any]], None] | None = None) -> RaceResult:
+    """F-race: un bloque (semilla) por ronda con presupuesto `budget`.
+
+    Desde `min_blocks` bloques, cada ronda descarta las configuraciones
+    que `friedman_discard` declara inferiores con nivel `alpha`. La
+    carrera termina cuando queda una configuración o tras `max_blocks`.
+    """
+    _require_scipy()
+    if not 2 <= min_blocks <= max_blocks:
+        raise ValueError("Se requiere 2 <= min_blocks <= max_blocks")
+    race = _Race(solver, configs, fixed, workers, on_round)
+    blocks: dict[int, list[float]] = {i: [] for i in race.alive}
+    for block in range(max_blocks):
+        race.run([base_seed + block], budget)
+        for i in race.alive:
+            blocks[i].append(race.result.costs[i][0])
+            race.result.costs[i] = blocks[i]
+        survivors = race.alive
+        if block + 1 >= min_blocks and len(race.alive) > 1:
+            matrix = np.array([blocks[i] for i in race.alive], dtype=float).T
+            discard = friedman_discard(matrix, alpha)
+            survivors = [i for i, drop in zip(race.alive, discard) if not drop]
+        race.end_round(budget, race.sorted(survivors))
+        if len(race.alive) == 1:
+            break
+    return race.finish()
@@ -1,12 +1,43 @@
+import importlib
 import typer
-from src.commands.acs import app as acsapp
-from src.commands.n_queen import app as nqueenapp
+from typer.core import TyperGroup
+
+# Subcomando -> módulo que define su `app`. Los módulos se importan solo
+# cuando se ejecuta el subcomando, así cada ejecución carga únicamente las
+# dependencias del solucionador elegido.
+COMMANDS = {
+    "acs": "src.commands.acs",
+    "n-queen": "src.commands.n_queen",
+    "eo": "src.commands.extreme_optimization",
+    "bench": "src.commands.bench",
+    "batch": "src.commands.batch",
+    "serve": "src.commands.serve",
+    "generate": "src.commands.generate",
+    "tune": "src.commands.tune",
+}
+
+
+class LazyGroup(TyperGroup):
+    def list_commands(self, ctx):
+        return list(COMMANDS)
+
+    def get_command(self, ctx, name):
+        if name not in COMMANDS:
+            return None
+        module = importlib.import_module(COMMANDS[name])
+        command = typer.main.get_command(module.app)
+        # Un Typer con varios subcomandos se convierte en un grupo sin nombre
+        command.name = name
+        return command
+
+
+app = typer.Typer(cls=LazyGroup)
+
+
+@app.callback()
+def main():
+    """Algoritmos metaheurísticos: N-Reinas, agente viajero y mochila."""
 
-from src.commands.extreme_optimization import app as eoapp
 
 if __name__ == "__main__":
-    app = typer.Typer()
-    app.add_typer(acsapp)
-    app.add_typer(nqueenapp)
-    app.add_typer(eoapp)
     app()
@@ -0,0 +1,121 @@
+"""Cotas para el problema de la mochila 0/1.
+
+`dantzig_bound` calcula en O(n log n) la cota de la relajación lineal
+(Dantzig) y, de paso, el valor de la solución greedy asociada. Si la
+instancia es lo bastante pequeña (`n * c <= max_cells` para acotar el
+tiempo y `c <= max_capacity` para acotar la memoria), `dp_optimum`
+obtiene el óptimo exacto con programación dinámica vectorizada sobre la
+capacidad (O(n·c) operaciones y O(c) memoria).
+
+Usage:
+    bounds = knapsack_bounds(precios, pesos, capacidad)
+    eo = ExtremeOptimization(..., upper_bound=bounds.upper)
+    print(f"gap {bounds.gap(precio):.2%}")
+"""
+
+from dataclasses import dataclass
+import numpy as np
+import numpy.typing as npt
+
+# Máximo de celdas n * (c + 1) para intentar la programación dinámica
+DP_MAX_CELLS = 500_000_000
+# Máxima capacidad para la programación dinámica: el arreglo int64 de c + 1
+# celdas y su temporal ocupan ~16 bytes por celda (~320 MB con 2·10⁷)
+DP_MAX_CAPACITY = 20_000_000
+
+
+@dataclass(frozen=True)
+class KnapsackBounds:
+    """
+    Attributes:
+        lower: Precio de una solución factible (greedy).
+        upper: Cota superior válida del óptimo.
+        exact: True si `upper` es el óptimo (demostrado).
+    """
+    lower: int
+    upper: int
+    exact: bool
+
+    def gap(self, price: int) -> float:
+        """Diferencia relativa entre `price` y la cota superior."""
+        return (self.upper - price) / self.upper if self.upper > 0 else 0.0
+
+
+def dantzig_bound(precios: npt.ArrayLike, pesos: npt.ArrayLike, capacidad: int) -> tuple[int, int]:
+    """Cota de Dantzig y solución greedy.
+
+    Ordena los ítems por eficiencia (precio / peso) y llena la mochila hasta
+    el ítem crítico, el primero que no cabe; la cota agrega la fracción
+    de ese ítem que cabe.
+
+    Returns:
+        (greedy, cota): precio de la solución greedy (el mayor entre el
+        prefijo que cabe y el mejor ítem individual) y la parte entera de
+        la cota de la relajación lineal.
+    """
+    precios = np.asarray(precios, dtype=np.int64)
+    pesos = np.asarray(pesos, dtype=np.int64)
+    # Los ítems que no caben solos no pueden ser parte de ninguna solución
+    fits = pesos <= capacidad
+    precios, pesos = precios[fits], pesos[fits]
+    if len(precios) == 0:
+        return 0, 0
+
+    efficiency = np.full(len(precios), np.inf)
+    np.divide(precios, pesos, out=efficiency, where=pesos > 0)
+    order = np.argsort(-efficiency, kind="stable")
+    precios, pesos = precios[order], pesos[order]
+
+    cum_pesos = np.cumsum(pesos)
+    critical = int(np.searchsorted(cum_pesos, capacidad, side="right"))
+    prefix = int(precios[:critical].sum())
+    best_single = int(precios.max())
+    if critical == len(precios):
+        # Caben todos: el greedy es óptimo
+        return prefix, prefix
+
+    residual = capacidad - (int(cum_pesos[critical - 1]) if critical > 0 else 0)
+    upper = prefix + (residual * int(precios[critical])) // int(pesos[critical])
+    return max(prefix, best_single), upper
+
+
+def dp_optimum(precios: npt.ArrayLike, pesos: npt.ArrayLike, capacidad: int,
+               max_cells: int = DP_MAX_CELLS, max_capacity: int = DP_MAX_CAPACITY) -> int | None:
+    """Óptimo exacto por programación dinámica sobre la capacidad.
+
+    `best[w]` es el mejor precio con peso a lo más `w`; cada ítem actualiza
+    todo el arreglo con una sola operación de NumPy.
+
+    Returns:
+        El precio óptimo, o None si `n * (c + 1)` supera `max_cells` o
+        `c` supera `max_capacity`.
+    """
+    precios = np.asarray(precios, dtype=np.int64)
+    pesos = np.asarray(pesos, dtype=np.int64)
+    if capacidad > max_capacity or len(precios) * (capacidad + 1) > max_cells:
+        return None
+
+    best = np.zeros(capacidad + 1, dtype=np.int64)
+    for precio, peso in zip(precios.tolist(), pesos.tolist()):
+        if peso > capacidad or precio <= 0:
+            continue
+        if peso == 0:
+            best += precio
+            continue
+        # El lado derecho se evalúa antes de escribir: cada ítem se usa una vez
+        np.maximum(best[peso:], best[:-peso] + precio, out=best[peso:])
+    return int(best[-1])
+
+
+def knapsack_bounds(precios: npt.ArrayLike, pesos: npt.ArrayLike, capacidad: int,
+                    exact: bool = True, max_cells: int = DP_MAX_CELLS,
+                    max_capacity: int = DP_MAX_CAPACITY) -> KnapsackBounds:
+    """Cotas inferior y superior; con `exact` intenta además el óptimo por DP."""
+    lower, upper = dantzig_bound(precios, pesos, capacidad)
+    if lower == upper:
+        return KnapsackBounds(lower, upper, True)
+    if exact:
+        optimum = dp_optimum(precios, pesos, capacidad, max_cells, max_capacity)
+        if optimum is not None:
+            return KnapsackBounds(optimum, optimum, True)
+    return KnapsackBounds(lower, upper, False)
@@ -0,0 +1,60 @@
+import unittest
+import numpy as np
+
+from src.core.algorithms.BatchExtremeOptimization import BatchExtremeOptimization
+from src.core.algorithms.ExtremeOptimization import ExtremeOptimization, INITIALIZERS
+
+
+def random_instance(seed, n=40):
+    # Precios y pesos amplios: sin empates de eficiencia (el orden de los empates
+    # no es el mismo en ambas implementaciones)
+    rng = np.random.default_rng(seed)
+    precios = rng.integers(1, 1000, n).astype(np.int32)
+    pesos = rng.integers(1, 1000, n).astype(np.int32)
+    return dict(n_items=n, capacidad=int(pesos.sum() // 3), tau=1.4, precios=precios, pesos=pesos)
+
+
+class TestBatchExtremeOptimization(unittest.TestCase):
+    def test_one_chain_matches_extreme_optimization(self):
+        for seed in range(10):
+            for initializer in INITIALIZERS:
+                params = dict(random_instance(seed), seed=seed, max_iterations=200,
+                              initializer=initializer)
+                sol, price = ExtremeOptimization(**params).start()
+                batch_sol, batch_price = BatchExtremeOptimization(chains=1, **params).start()
+                self.assertEqual(batch_price, price)
+                self.assertEqual(batch_sol.tolist(), sol.tolist())
+
+    def test_reproducible_for_a_seed(self):
+        params = dict(random_instance(1), chains=16, max_iterations=300)
+        first = BatchExtremeOptimization(seed=7, **params)
+        first_sol, first_price = first.start()
+        second = BatchExtremeOptimization(seed=7, **params)
+        second_sol, second_price = second.start()
+        self.assertEqual(first_price, second_price)
+        self.assertEqual(first_sol.tolist(), second_sol.tolist())
+        self.assertEqual(first.best_prices.tolist(), second.best_prices.tolist())
+        other = BatchExtremeOptimization(seed=8, **params)
+        other.start()
+        self.assertNotEqual(first.best_prices.tolist(), other.best_prices.tolist())
+
+    def test_chains_match_single_runs_statistically(self):
+        chains, iterations = 60, 150
+        instance = random_instance(2, n=80)
+        batch = BatchExtremeOptimization(seed=1, chains=chains, max_iterations=iterations, **instance)
+        batch.start()
+        single = np.array([ExtremeOptimization(seed=seed, max_iterations=iterations, **instance).start()[1]
+                           for seed in range(chains)], dtype=float)
+        batched = batch.best_prices.astype(float)
+        error = np.sqrt(single.var(ddof=1) / chains + batched.var(ddof=1) / chains)
+        self.assertLess(abs(single.mean() - batched.mean()), 4 * error + 1)
+
+    def test_best_solution_is_feasible(self):
+        instance = random_instance(3)
+        sol, price = BatchExtremeOptimization(seed=1, chains=8, max_iterations=300, **instance).start()
+        self.assertLessEqual(int(instance["pesos"][sol == 1].sum()), instance["capacidad"])
+        self.assertEqual(price, int(instance["precios"][sol == 1].sum()))
+
+
+if __name__ == "__main__":
+    unittest.main()
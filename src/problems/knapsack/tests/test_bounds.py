@@ -0,0 +1,71 @@
+import itertools
+import random
+import unittest
+
+from src.problems.knapsack.bounds import dantzig_bound, dp_optimum, knapsack_bounds
+
+
+def brute_force(precios, pesos, capacidad):
+    best = 0
+    for chosen in itertools.product((0, 1), repeat=len(precios)):
+        if sum(w for w, x in zip(pesos, chosen) if x) <= capacidad:
+            best = max(best, sum(p for p, x in zip(precios, chosen) if x))
+    return best
+
+
+def random_instances(count, seed=1):
+    rng = random.Random(seed)
+    for _ in range(count):
+        n = rng.randint(1, 12)
+        precios = [rng.randint(0, 60) for _ in range(n)]
+        pesos = [rng.randint(0, 40) for _ in range(n)]
+        capacidad = rng.randint(0, sum(pesos) + 5)
+        yield precios, pesos, capacidad
+
+
+class TestBounds(unittest.TestCase):
+    def test_dp_matches_brute_force(self):
+        for precios, pesos, capacidad in random_instances(300):
+            self.assertEqual(dp_optimum(precios, pesos, capacidad),
+                             brute_force(precios, pesos, capacidad), (precios, pesos, capacidad))
+
+    def test_dantzig_brackets_the_optimum(self):
+        for precios, pesos, capacidad in random_instances(300, seed=2):
+            lower, upper = dantzig_bound(precios, pesos, capacidad)
+            optimum = brute_force(precios, pesos, capacidad)
+            self.assertLessEqual(lower, optimum, (precios, pesos, capacidad))
+            self.assertGreaterEqual(upper, optimum, (precios, pesos, capacidad))
+
+    def test_dantzig_hand_computed(self):
+        # Eficiencias 6, 5, 4: caben los dos primeros (peso 30) y 20/30 del tercero
+        self.assertEqual(dantzig_bound([60, 100, 120], [10, 20, 30], 50), (160, 240))
+        # Caben todos: la cota es exacta
+        self.assertEqual(dantzig_bound([5, 7], [1, 2], 10), (12, 12))
+        # Ningún ítem cabe
+        self.assertEqual(dantzig_bound([5, 7], [11, 12], 10), (0, 0))
+
+    def test_knapsack_bounds_are_exact_with_dp(self):
+        for precios, pesos, capacidad in random_instances(100, seed=3):
+            bounds = knapsack_bounds(precios, pesos, capacidad)
+            optimum = brute_force(precios, pesos, capacidad)
+            self.assertTrue(bounds.exact)
+            self.assertEqual((bounds.lower, bounds.upper), (optimum, optimum))
+
+    def test_fallback_above_capacity_cap(self):
+        precios, pesos, capacidad = [60, 100, 120], [10, 20, 30], 50
+        self.assertIsNone(dp_optimum(precios, pesos, capacidad, max_capacity=49))
+        self.assertIsNone(dp_optimum(precios, pesos, capacidad, max_cells=3 * 51 - 1))
+        self.assertEqual(dp_optimum(precios, pesos, capacidad, max_capacity=50), 220)
+
+        bounds = knapsack_bounds(precios, pesos, capacidad, max_capacity=49)
+        self.assertFalse(bounds.exact)
+        self.assertEqual((bounds.lower, bounds.upper), (160, 240))
+        self.assertAlmostEqual(bounds.gap(220), 20 / 240)
+
+    def test_exact_false_skips_dp(self):
+        bounds = knapsack_bounds([60, 100, 120], [10, 20, 30], 50, exact=False)
+        self.assertEqual((bounds.lower, bounds.upper, bounds.exact), (160, 240, False))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import numpy as np
+
+from src.core.algorithms.ExtremeOptimization import ExtremeOptimization, INITIALIZERS
+
+
+def make_eo(precios, pesos, capacidad, seed=1, **kwargs):
+    return ExtremeOptimization(
+        seed=seed, n_items=len(precios), capacidad=capacidad, tau=1.4,
+        precios=np.array(precios, dtype=np.int32), pesos=np.array(pesos, dtype=np.int32),
+        **kwargs)
+
+
+def random_instance(rng, n=40):
+    precios = rng.integers(1, 100, n)
+    pesos = rng.integers(1, 50, n)
+    return precios, pesos, int(pesos.sum() // 3)
+
+
+class TestRepair(unittest.TestCase):
+    def test_repair_always_yields_feasible_solutions(self):
+        rng = np.random.default_rng(1)
+        for repair in ("rank", "efficiency"):
+            for trial in range(200):
+                precios, pesos, capacidad = random_instance(rng)
+                eo = make_eo(precios, pesos, capacidad, seed=trial, repair=repair)
+                sol = (rng.random(len(precios)) < 0.7).astype(np.int32)
+                before = sol.copy()
+                removed = eo.reparar_solucion(sol, eo.precios / eo.pesos)
+                self.assertLessEqual(int(pesos[sol == 1].sum()), capacidad)
+                # Solo se quitan ítems que estaban en la solución
+                self.assertTrue(np.all(sol <= before))
+                self.assertEqual(removed, int((before - sol).sum()))
+
+    def test_efficiency_repair_removes_the_fewest_in_order(self):
+        rng = np.random.default_rng(2)
+        for _ in range(100):
+            precios, pesos, capacidad = random_instance(rng)
+            eo = make_eo(precios, pesos, capacidad, repair="efficiency")
+            sol = np.ones(len(precios), dtype=np.int32)
+            fitness = eo.precios / eo.pesos
+            removed = eo.reparar_solucion(sol, fitness)
+            # Sin el último ítem quitado la solución seguiría siendo infactible
+            orden = np.argsort(fitness, kind="stable")[:removed]
+            self.assertGreater(int(pesos.sum() - pesos[orden[:-1]].sum()), capacidad)
+
+    def test_feasible_solution_is_not_repaired(self):
+        eo = make_eo([10, 20, 30], [1, 2, 3], 10, repair="rank")
+        sol = np.array([1, 1, 1], dtype=np.int32)
+        self.assertEqual(eo.reparar_solucion(sol, eo.precios / eo.pesos), 0)
+        self.assertEqual(sol.tolist(), [1, 1, 1])
+
+    def test_runs_with_repair_return_feasible_solutions(self):
+        rng = np.random.default_rng(3)
+        for repair in ("rank", "efficiency"):
+            for seed in range(10):
+                precios, pesos, capacidad = random_instance(rng, 100)
+                eo = make_eo(precios, pesos, capacidad, seed=seed, repair=repair,
+                             max_iterations=300, initializer="greedy")
+                best, price = eo.start()
+                self.assertLessEqual(int(pesos[best == 1].sum()), capacidad)
+                self.assertEqual(price, int(precios[best == 1].sum()))
+
+
+class TestInitializers(unittest.TestCase):
+    def test_initial_solutions_are_feasible(self):
+        rng = np.random.default_rng(4)
+        for initializer in INITIALIZERS:
+            for seed in range(20):
+                precios, pesos, capacidad = random_instance(rng)
+                eo = make_eo(precios, pesos, capacidad, seed=seed, initializer=initializer)
+                sol = eo.construir_solucion_inicial(eo.precios / eo.pesos)
+                self.assertLessEqual(int(pesos[sol == 1].sum()), capacidad)
+
+    def test_greedy_takes_the_longest_fitting_prefix(self):
+        # Eficiencias 6, 5, 4, 1: caben los dos primeros (peso 30 de 45)
+        eo = make_eo([60, 100, 120, 10], [10, 20, 30, 10], 45, initializer="greedy")
+        self.assertEqual(eo.construir_solucion_inicial(eo.precios / eo.pesos).tolist(), [1, 1, 0, 0])
+
+    def test_no_item_fits(self):
+        # Regresión: generar_solucion_inicial sorteaba ítems hasta encontrar uno que cupiera
+        for initializer in INITIALIZERS:
+            eo = make_eo([10, 20, 30], [11, 12, 13], 10, initializer=initializer, max_iterations=20)
+            sol = eo.construir_solucion_inicial(eo.precios / eo.pesos)
+            self.assertEqual(sol.tolist(), [0, 0, 0])
+            _, price = eo.start()
+            self.assertEqual(price, 0)
+
+    def test_random_initializer_picks_an_item_that_fits(self):
+        for seed in range(50):
+            eo = make_eo([10, 20, 30, 40], [50, 5, 50, 50], 10, seed=seed)
+            self.assertEqual(eo.generar_solucion_inicial().tolist(), [0, 1, 0, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.utils.knapack_parser import iter_knapack_instances, knapack_parser
+
+
+def instance_text(title="knapPI_1_3_1000_1", n=3, items=("1,10,5,1", "2,20,8,0", "3,15,4,1"),
+                  z="z 25\n", separator="-----\n\n"):
+    return f"{title}\nn {n}\nc 12\n{z}time 0.00\n" + "".join(f"{item}\n" for item in items) + separator
+
+
+class TestKnapackParser(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "instances.txt"
+
+    def parse(self, text):
+        self.path.write_text(text)
+        return knapack_parser(self.path)
+
+    def test_well_formed_file(self):
+        instances = self.parse(instance_text() + instance_text("knapPI_1_3_1000_2", z=""))
+        self.assertEqual([instance["title"] for instance in instances],
+                         ["knapPI_1_3_1000_1", "knapPI_1_3_1000_2"])
+        first = instances[0]
+        self.assertEqual((first["n"], first["c"], first["z"]), (3, 12, 25))
+        self.assertEqual(first["precios"].tolist(), [10, 20, 15])
+        self.assertEqual(first["pesos"].tolist(), [5, 8, 4])
+        self.assertEqual(first["solucion_optima"].tolist(), [1, 0, 1])
+        # Sin línea z (instancias generadas sin óptimo exacto)
+        self.assertIsNone(instances[1]["z"])
+
+    def test_empty_file(self):
+        self.assertEqual(self.parse(""), [])
+        self.assertEqual(self.parse("\n\n"), [])
+
+    def test_last_instance_without_separator(self):
+        instances = self.parse(instance_text() + instance_text("knapPI_1_3_1000_2", separator=""))
+        self.assertEqual(len(instances), 2)
+        self.assertEqual(instances[1]["precios"].tolist(), [10, 20, 15])
+
+    def test_fewer_items_than_n(self):
+        with self.assertRaisesRegex(ValueError, "knapPI_1_3_1000_1"):
+            self.parse(instance_text(n=4))
+
+    def test_fewer_items_than_n_at_end_of_file(self):
+        with self.assertRaisesRegex(ValueError, "tiene 3 ítems, se esperaban 4"):
+            self.parse(instance_text(n=4, separator=""))
+
+    def test_file_ends_before_items(self):
+        with self.assertRaisesRegex(ValueError, "termina antes"):
+            self.parse(instance_text() + "knapPI_1_3_1000_2\nn 3\nc 12\n")
+
+    def test_malformed_item_line(self):
+        with self.assertRaisesRegex(ValueError, "mal formados"):
+            self.parse(instance_text(items=("1,10,5,1", "2,veinte,8,0", "3,15,4,1")))
+        with self.assertRaisesRegex(ValueError, "mal formados"):
+            self.parse(instance_text(items=("1,10,5,1", "2,20", "3,15,4,1")))
+
+    def test_malformed_header(self):
+        with self.assertRaises(ValueError):
+            self.parse(instance_text(n="tres"))
+
+    def test_instances_are_read_lazily(self):
+        # La segunda instancia está mal formada, pero la primera se entrega antes de leerla
+        self.path.write_text(instance_text() + instance_text("knapPI_1_3_1000_2", n=5))
+        instances = iter_knapack_instances(self.path)
+        self.assertEqual(next(instances)["title"], "knapPI_1_3_1000_1")
+        with self.assertRaises(ValueError):
+            next(instances)
+
+
+if __name__ == "__main__":
+    unittest.main()
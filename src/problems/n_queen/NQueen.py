@@ -1,11 +1,20 @@
+from __future__ import annotations
 from src.core.algorithms.GeneticAlgo import GeneticAlgo
 from src.core.EventEmitter import on
-from src.utils.print_chessboard import print_chessboard
+from src.core.termination import Termination
+from src.core.profiling import Profiler
+from typing import TYPE_CHECKING
 import random
 
+if TYPE_CHECKING:
+    from src.core.checkpoint import Checkpointer
+    from src.core.trace import TraceRecorder
+
 class NQueen(GeneticAlgo[list[int]]):
     n: int
     iterations: int
+    silent: bool
+    _zobrist: list[list[int]] | None
 
     def __init__(
         self,
@@ -15,10 +24,21 @@ class NQueen(GeneticAlgo[list[int]]):
         crossover_rate: float,
         mutation_rate: float,
         iterations: int,
+        termination: Termination | None = None,
+        checkpoint: Checkpointer | None = None,
+        silent: bool = False,
+        profiler: Profiler | None = None,
+        trace: TraceRecorder | None = None,
     ):
-        super().__init__(seed, population_size, mutation_rate, crossover_rate)
+        super().__init__(seed, population_size, mutation_rate,
+                         crossover_rate, termination, checkpoint, profiler, trace)
         self.n = n
         self.iterations = iterations
+        self.silent = silent
+        self._zobrist = None
+
+    def checkpoint_params(self) -> dict:
+        return {**super().checkpoint_params(), "n": self.n}
 
     def generate_population(self) -> list[list[int]]:
         return [
@@ -48,12 +68,41 @@ class NQueen(GeneticAlgo[list[int]]):
     def __swap(self, individual: list[int], i: int, j: int) -> None:
         individual[i], individual[j] = individual[j], individual[i]
 
-    def mutate(self, individual: list[int]) -> list[int]:
+    def __swap_mutation(self, individual: list[int]) -> tuple[list[int], int, int]:
+        """Copia de `individual` con dos columnas al azar intercambiadas."""
         individual = individual.copy()
         i = random.randint(0, self.n - 1)
         j = random.randint(0, self.n - 1)
         self.__swap(individual, i, j)
-        return individual
+        return individual, i, j
+
+    def mutate(self, individual: list[int]) -> list[int]:
+        return self.__swap_mutation(individual)[0]
+
+    def __zobrist_table(self) -> list[list[int]]:
+        """Número aleatorio de 64 bits por (columna, fila); se genera con su
+        propio generador para no alterar la secuencia del algoritmo."""
+        if self._zobrist is None:
+            rng = random.Random(self.seed)
+            self._zobrist = [[rng.getrandbits(64) for _ in range(self.n)] for _ in range(self.n)]
+        return self._zobrist
+
+    def individual_hash(self, individual: list[int]) -> int:
+        """Hash de Zobrist: XOR de los números de cada (columna, fila) ocupada."""
+        table = self.__zobrist_table()
+        h = 0
+        for i, row in enumerate(individual):
+            h ^= table[i][row]
+        return h
+
+    def mutate_hashed(self, individual: list[int], individual_hash: int) -> tuple[list[int], int]:
+        """Igual que `mutate`, pero actualiza el hash en O(1): el intercambio
+        solo cambia las entradas de las columnas i y j."""
+        table = self.__zobrist_table()
+        child, i, j = self.__swap_mutation(individual)
+        individual_hash ^= table[i][individual[i]] ^ table[j][individual[j]]
+        individual_hash ^= table[i][child[i]] ^ table[j][child[j]]
+        return child, individual_hash
 
     # @on('new_individual')
     def new_individual(
@@ -97,14 +146,19 @@ class NQueen(GeneticAlgo[list[int]]):
         return current
 
     def end_condition(self) -> bool:
-        has_solution = any(fit == 0 for fit in
-                           self.pop_fitness)
+        # Los criterios de término se consultan siempre (p. ej. para registrar el tiempo al objetivo)
+        terminated = self.terminated()
+        has_solution = self.best_fitness == 0
         max_generations_reached = self.gen >= self.iterations
-        return has_solution or max_generations_reached
+        return has_solution or max_generations_reached or terminated
 
     @on('end')
     def on_end(self):
         """Imprime el mejor resultado al final del algoritmo"""
+        if self.silent:
+            return
+        # rich solo se importa si realmente se imprime el tablero
+        from src.utils.print_chessboard import print_chessboard
         best_fitness = min(self.pop_fitness)
         best_index = self.pop_fitness.index(best_fitness)
         best_individual = self.population[best_index]
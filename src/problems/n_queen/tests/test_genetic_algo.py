@@ -0,0 +1,205 @@
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.core.PopulationHeap import PopulationHeap
+from src.core.algorithms.GeneticAlgo import GeneticAlgo
+from src.core.checkpoint import Checkpointer
+from src.problems.n_queen.NQueen import NQueen
+
+
+class TestPopulationHeap(unittest.TestCase):
+    def test_best_and_worst_after_replacements(self):
+        rng = random.Random(1)
+        fitness = [rng.randint(0, 50) for _ in range(20)]
+        index = PopulationHeap(fitness)
+        for _ in range(500):
+            index.replace(rng.randrange(len(fitness)), rng.randint(0, 50))
+            self.assertEqual(fitness[index.best()], min(fitness))
+            self.assertEqual(fitness[index.worst()], max(fitness))
+
+    def test_stale_entries_are_skipped(self):
+        fitness = [5, 3, 8, 1]
+        index = PopulationHeap(fitness)
+        # La entrada vieja (1, 3) queda obsoleta pero sigue en el montículo
+        index.replace(3, 9)
+        self.assertEqual(index.best(), 1)
+        self.assertEqual(index.worst(), 3)
+        index.replace(3, 0)
+        self.assertEqual(index.best(), 3)
+        self.assertEqual(index.worst(), 2)
+
+    def test_rebuild_bounds_stale_entries(self):
+        fitness = list(range(10))
+        index = PopulationHeap(fitness)
+        for k in range(1000):
+            # Sin consultar best()/worst() nada se descarta: solo la reconstrucción lo limita
+            index.replace(k % len(fitness), k)
+            self.assertLessEqual(len(index._min), 2 * len(fitness) + 1)
+            self.assertLessEqual(len(index._max), 2 * len(fitness) + 1)
+        self.assertEqual(fitness[index.best()], min(fitness))
+        self.assertEqual(fitness[index.worst()], max(fitness))
+
+    def test_rebuild_drops_all_stale_entries(self):
+        fitness = [0] * 4
+        index = PopulationHeap(fitness)
+        # Con P + 1 reemplazos hay 2P + 1 entradas; el siguiente reconstruye
+        for k in range(len(fitness) + 2):
+            index.replace(0, k + 1)
+        # La reconstrucción deja exactamente una entrada vigente por individuo
+        self.assertEqual(len(index._min), len(fitness))
+        self.assertEqual(len(index._max), len(fitness))
+
+
+class TestSteadyState(unittest.TestCase):
+    def run_nqueen(self, seed=3, **start):
+        queen = NQueen(seed, 12, 30, 0.8, 0.2, 40, silent=True)
+        bests = []
+        queen.on("new_generation", lambda gen, population: bests.append(
+            min(fitness for fitness, _ in population)))
+        result = queen.start(**start)
+        return queen, result, bests
+
+    def test_worst_replacement_never_loses_the_best(self):
+        queen, result, bests = self.run_nqueen(steady_state="worst")
+        self.assertTrue(bests)
+        self.assertEqual(bests, sorted(bests, reverse=True))
+        self.assertEqual(result[0][0], queen.best_fitness)
+
+    def test_worst_replacement_keeps_fitness_in_sync(self):
+        queen, _, _ = self.run_nqueen(steady_state="worst")
+        self.assertEqual(len(queen.population), queen.population_size)
+        self.assertEqual(queen.pop_fitness, [queen.fitness(ind) for ind in queen.population])
+
+    def test_worst_replacement_is_reproducible(self):
+        _, first, _ = self.run_nqueen(steady_state="worst")
+        _, second, _ = self.run_nqueen(steady_state="worst")
+        self.assertEqual(first, second)
+
+    def test_elitism_cannot_be_combined(self):
+        queen = NQueen(1, 8, 10, 0.8, 0.2, 5, silent=True)
+        with self.assertRaises(ValueError):
+            queen.start(elitism=True, steady_state="worst")
+
+
+class TestBreeding(unittest.TestCase):
+    def test_generational_and_elitist_populations_keep_their_size(self):
+        for elitism in (False, True):
+            for duplicates in (None, "reject", "remutate"):
+                queen = NQueen(2, 10, 25, 0.6, 0.3, 15, silent=True)
+                queen.start(elitism=elitism, duplicates=duplicates)
+                self.assertEqual(len(queen.population), 25)
+                self.assertEqual(queen.pop_fitness, [queen.fitness(ind) for ind in queen.population])
+
+    def test_elitism_never_loses_the_best(self):
+        queen = NQueen(4, 12, 30, 0.8, 0.2, 30, silent=True)
+        bests = []
+        queen.on("new_generation", lambda gen, population: bests.append(population[0][0]))
+        queen.start(elitism=True)
+        self.assertEqual(bests, sorted(bests, reverse=True))
+
+
+class Repeating(GeneticAlgo[list[int]]):
+    """Individuos [k] distintos; uno de cada dos cruces repite a parent1."""
+
+    def __init__(self, seed, population_size, generations):
+        super().__init__(seed, population_size, 0.0, 1.0)
+        self.generations = generations
+        self.crossovers = 0
+        self.next_value = population_size
+
+    def generate_population(self):
+        return [[k] for k in range(self.population_size)]
+
+    def fitness(self, individual):
+        return individual[0] % 7
+
+    def crossover(self, parent1, parent2):
+        self.crossovers += 1
+        if self.crossovers % 2:
+            return parent1.copy()
+        self.next_value += 1
+        return [self.next_value]
+
+    def mutate(self, individual):
+        return individual.copy()
+
+    def end_condition(self):
+        return self.gen >= self.generations
+
+
+class TestDuplicates(unittest.TestCase):
+    def test_rejected_children_are_not_replaced_by_parents(self):
+        for elitism in (False, True):
+            ga = Repeating(1, 20, 5)
+            generations = []
+            ga.on("new_generation", lambda gen, population: generations.append(
+                [individual[0] for _, individual in population]))
+            ga.start(elitism=elitism, selection_method="deterministic_tournament",
+                     duplicates="reject")
+            self.assertEqual(len(generations), 5)
+            for values in generations:
+                self.assertEqual(len(values), 20)
+                self.assertEqual(len(set(values)), 20)
+
+    def test_only_duplicates_falls_back_to_parents(self):
+        ga = Repeating(1, 10, 3)
+        ga.crossover = lambda parent1, parent2: parent1.copy()
+        ga.start(selection_method="deterministic_tournament", duplicates="reject")
+        self.assertEqual(ga.gen, 3)
+        self.assertEqual(len(ga.population), 10)
+
+
+class TestZobrist(unittest.TestCase):
+    def test_mutate_hashed_matches_full_recompute(self):
+        queen = NQueen(5, 16, 10, 0.8, 0.2, 10, silent=True)
+        individual = random.sample(range(16), 16)
+        h = queen.individual_hash(individual)
+        for _ in range(500):
+            child, h = queen.mutate_hashed(individual, h)
+            self.assertEqual(h, queen.individual_hash(child))
+            self.assertEqual(sorted(child), list(range(16)))
+            individual = child
+
+    def test_mutate_hashed_draws_like_mutate(self):
+        queen = NQueen(5, 16, 10, 0.8, 0.2, 10, silent=True)
+        individual = random.sample(range(16), 16)
+        state = random.getstate()
+        expected = queen.mutate(individual)
+        random.setstate(state)
+        child, _ = queen.mutate_hashed(individual, queen.individual_hash(individual))
+        self.assertEqual(child, expected)
+
+    def test_equal_boards_share_the_hash(self):
+        queen = NQueen(5, 8, 10, 0.8, 0.2, 10, silent=True)
+        board = [1, 3, 5, 7, 2, 0, 6, 4]
+        self.assertEqual(queen.individual_hash(board), queen.individual_hash(list(board)))
+        self.assertNotEqual(queen.individual_hash(board), queen.individual_hash(board[::-1]))
+
+
+class TestCheckpointParams(unittest.TestCase):
+    def test_resume_with_another_mode_is_rejected(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "nqueen.npz"
+            first = NQueen(1, 30, 20, 0.8, 0.2, 5, checkpoint=Checkpointer(path, every=1),
+                           silent=True)
+            first.start(steady_state="worst")
+            for start in ({}, {"steady_state": "tournament"}, {"elitism": True},
+                          {"steady_state": "worst", "duplicates": "reject"},
+                          {"steady_state": "worst", "selection_method": "deterministic_tournament"}):
+                queen = NQueen(1, 30, 20, 0.8, 0.2, 10, checkpoint=Checkpointer(path, resume=True),
+                               silent=True)
+                with self.assertRaises(ValueError):
+                    queen.start(**start)
+            # Con el mismo modo se reanuda (el máximo de generaciones sí puede cambiar)
+            queen = NQueen(1, 30, 20, 0.8, 0.2, 10, checkpoint=Checkpointer(path, resume=True),
+                           silent=True)
+            generations = []
+            queen.on("new_generation", lambda gen, population: generations.append(gen))
+            queen.start(steady_state="worst")
+            self.assertEqual(generations[0], first.gen + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
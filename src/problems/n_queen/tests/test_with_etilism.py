@@ -1,14 +1,15 @@
 import unittest
 import sqlite3
 import numpy as np
-import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 import sys
 import os
-import itertools
 
 from src.problems.n_queen.NQueen import NQueen
+from src.core.sweep import grid, run_sweep
+from src.core.sweep_tasks import nqueen_task
+from src.core.ExperimentStore import ExperimentStore
+from src.core.ResultSink import ResultSink, encode_individual
 
 
 class TestWithElitism(unittest.TestCase):
@@ -46,7 +47,7 @@ class TestWithElitism(unittest.TestCase):
             """CREATE TABLE IF NOT EXISTS populations (
                 ID INTEGER PRIMARY KEY AUTOINCREMENT,
                 RESULT_ID INTEGER,
-                INDIVIDUAL TEXT,
+                INDIVIDUAL BLOB,
                 FITNESS INTEGER,
                 RANK_IN_POPULATION INTEGER,
                 FOREIGN KEY (RESULT_ID) REFERENCES results(ID)
@@ -54,6 +55,7 @@ class TestWithElitism(unittest.TestCase):
         )
         
         self.db_lock = threading.Lock()
+        self.store = ExperimentStore("db.sqlite")
         self._initialize_seeds()
     
     def _initialize_seeds(self):
@@ -80,99 +82,110 @@ class TestWithElitism(unittest.TestCase):
             iterations,
         )
         sorted_population = nqueen.start(elitismo)
-        fitness_value, _ = sorted_population[0]
+        return self.store_result(
+            dict(seed=seed, n=n, population_size=population_size, iterations=iterations,
+                 crossover_rate=crossover_rate, mutation_rate=mutation_rate, elitism=elitismo),
+            sorted_population[0][0], nqueen.gen, sorted_population[:10])
 
-        # Guardar resultado inmediatamente para evitar acumulación en memoria
+    def store_result(self, params, fitness_value, generations, top_individuals):
+        """Guarda el resultado de una combinación y sus 10 mejores individuos"""
         with self.db_lock:
-            self.cur.execute(
-                "INSERT INTO results (SEED_ID, BOARDSIZE, POPULATIONSIZE, CROSSOVERRATE, MUTATIONRATE, ITERATIONS, FITNESS, GENERATIONS_EXECUTED, ELITISMO) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                (seed, n, population_size, crossover_rate, mutation_rate, iterations, fitness_value, nqueen.gen, int(elitismo))
-            )
-            result_id = self.cur.lastrowid
-            
-            # Guardar solo los mejores 10 individuos de la población para ahorrar memoria
-            top_individuals = sorted_population[:10]
-            population_data = [
-                (result_id, json.dumps(individual), fitness, rank)
-                for rank, (fitness, individual) in enumerate(top_individuals, 1)
-            ]
-            
-            self.cur.executemany(
-                "INSERT INTO populations (RESULT_ID, INDIVIDUAL, FITNESS, RANK_IN_POPULATION) VALUES (?, ?, ?, ?)",
-                population_data
-            )
+            result_id = self._write_result(self.cur, params, fitness_value, generations,
+                                           top_individuals)
             self.con.commit()
 
         # Retornar solo información básica (no la población completa)
         return result_id
 
+    @staticmethod
+    def _write_result(cur, params, fitness_value, generations, top_individuals):
+        """Inserta el resultado sin hacer commit (lo usa también el ResultSink)"""
+        cur.execute(
+            "INSERT INTO results (SEED_ID, BOARDSIZE, POPULATIONSIZE, CROSSOVERRATE, MUTATIONRATE, "
+            "ITERATIONS, FITNESS, GENERATIONS_EXECUTED, ELITISMO) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (params["seed"], params["n"], params["population_size"], params["crossover_rate"],
+             params["mutation_rate"], params["iterations"], fitness_value, generations,
+             int(params["elitism"]))
+        )
+        result_id = cur.lastrowid
+
+        # Guardar solo los mejores 10 individuos de la población para ahorrar memoria.
+        # Los individuos se guardan en binario (ver decode_individual)
+        population_data = [
+            (result_id, encode_individual(individual), fitness, rank)
+            for rank, (fitness, individual) in enumerate(top_individuals, 1)
+        ]
+
+        cur.executemany(
+            "INSERT INTO populations (RESULT_ID, INDIVIDUAL, FITNESS, RANK_IN_POPULATION) "
+            "VALUES (?, ?, ?, ?)",
+            population_data
+        )
+        return result_id
+
+    @classmethod
+    def _sink_write(cls, cur, item):
+        """Escribe en el hilo del ResultSink: marca la celda y guarda el resultado"""
+        params, result = item
+        summary = {"fitness": result["fitness"], "generations": result["generations"]}
+        if ExperimentStore.mark_done(cur, params["experiment_key"], summary):
+            cls._write_result(cur, params, result["fitness"], result["generations"], result["top"])
+
     def test_n_queen(self):
         # Rangos reducidos para evitar exceso de memoria
-        ranges = [
-            range(1, 11),              # seeds (10 semillas)
-            range(4, 16),              # ns (tableros 4x4 a 15x15)
-            range(50, 151, 50),        # population_sizes (50, 100, 150)
-            range(100, 501, 200),      # iterations (100, 300, 500)
-            np.arange(0.6, 0.91, 0.1), # crossover_rates (reducido)
-            np.arange(0.01, 0.06, 0.02), # mutation_rates (reducido)
-            [False]                    # elitismo (solo SIN elitismo, ya que los tests CON elitismo ya están hechos)
-        ]
+        ranges = dict(
+            seed=range(1, 11),                          # seeds (10 semillas)
+            n=range(4, 16),                             # ns (tableros 4x4 a 15x15)
+            population_size=range(50, 151, 50),         # population_sizes (50, 100, 150)
+            iterations=range(100, 501, 200),            # iterations (100, 300, 500)
+            crossover_rate=np.arange(0.6, 0.91, 0.1),   # crossover_rates (reducido)
+            mutation_rate=np.arange(0.01, 0.06, 0.02),  # mutation_rates (reducido)
+            # elitismo (solo SIN elitismo, ya que los tests CON elitismo ya están hechos)
+            elitism=[False]
+        )
         
         # Calcular total sin generar todas las combinaciones
         total_combinations = 1
-        for r in ranges:
+        for r in ranges.values():
             total_combinations *= len(r)
         
         print(f"Total de combinaciones a probar: {total_combinations}")
         
-        # Usar itertools.product como generador (no convertir a lista)
-        parameter_combinations = itertools.product(*ranges)
-        
-        max_workers = min(os.cpu_count() or 1, 4)  # Reducido a 4 workers para menos memoria
-        
+        # Este barrido lo ejecuta un único proceso, así que los leases que
+        # quedaron de una ejecución interrumpida se pueden liberar
+        self.store.expire_leases()
+        cells = (("nqueen", str(params["n"]), params, params["seed"])
+                 for params in grid(**ranges))
+        # Solo se ejecutan las combinaciones que no terminaron en ejecuciones anteriores
+        pending = ({**params, "experiment_key": key}
+                   for key, params in self.store.pending(cells))
+
         completed_count = 0
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Procesar en lotes para evitar acumulación de memoria
-            batch_size = 20  # Procesar 20 combinaciones a la vez
-            batch = []
-            
-            for params in parameter_combinations:
-                batch.append(params)
-                
-                if len(batch) >= batch_size:
-                    # Procesar el lote actual
-                    futures = [executor.submit(self.run_single_test, p) for p in batch]
-                    
-                    for future in as_completed(futures):
-                        try:
-                            result_id = future.result()
-                            completed_count += 1
-                            
-                            # Mostrar progreso cada 10 completados
-                            if completed_count % 10 == 0:
-                                print(f"Completados: {completed_count}/{total_combinations}")
-                                
-                        except Exception as exc:
-                            print(f"Error en ejecución: {exc}")
-                    
-                    # Limpiar el lote
-                    batch = []
-            
-            # Procesar el último lote si queda algo
-            if batch:
-                futures = [executor.submit(self.run_single_test, p) for p in batch]
-                
-                for future in as_completed(futures):
-                    try:
-                        result_id = future.result()
-                        completed_count += 1
-                        
-                        if completed_count % 10 == 0:
-                            print(f"Completados: {completed_count}/{total_combinations}")
-                            
-                    except Exception as exc:
-                        print(f"Error en ejecución: {exc}")
+        # Único escritor: un hilo que agrupa los resultados en transacciones grandes
+        sink = ResultSink("db.sqlite", self._sink_write)
+
+        def on_result(index, params, result):
+            nonlocal completed_count
+            sink.put((params, result))
+            completed_count += 1
+
+            # Mostrar progreso cada 10 completados
+            if completed_count % 10 == 0:
+                print(f"Completados: {completed_count}/{total_combinations}")
+
+        def on_error(index, params, exc):
+            self.store.release(params["experiment_key"])
+            print(f"Error en ejecución {params}: {exc}")
+
+        # Los algoritmos son Python puro, por lo que se usan procesos en lugar
+        # de hilos para no quedar limitados por el GIL
+        try:
+            run_sweep(nqueen_task, pending, on_result, on_error,
+                      workers=os.cpu_count(), chunksize=20)
+        finally:
+            sink.close()
 
         print(f"Test completado. Se procesaron {completed_count} combinaciones en total.")
     
@@ -1,40 +1,46 @@
 import unittest
 import numpy as np
-import pandas as pd
 import time
-import json
+import uuid
+from pathlib import Path
 from datetime import datetime
 import src.core.algorithms.AntColonySystem as ACS
 import src.utils.tsp_parser as TSPParser
+from src.utils.columnar import ColumnarWriter, read_columns
+from src.core.trace import TraceRecorder
 
 
 class OptimalTargetACS(ACS.AntColonySystem):
     """Versión que busca alcanzar el óptimo conocido, como en tu test original"""
     
     def __init__(self, *args, **kwargs):
+        # La convergencia se registra en arreglos preasignados en lugar de una lista
+        kwargs.setdefault("trace", TraceRecorder())
         super().__init__(*args, **kwargs)
         self.optimal_target = 7544.3659  # Valor óptimo verificado
-        self.convergence_history = []
         self.execution_time = 0
         self.final_cost = float('inf')
         self.reached_optimal = False
         
+    @property
+    def convergence_history(self):
+        return self.trace.column("best")
+
     def start(self):
         start_time = time.time()
-        self.convergence_history = []
         
         result = super().start()
         
         self.execution_time = time.time() - start_time
-        self.final_cost = self.cost(self.best_solution)
+        self.final_cost = self.best_cost
         self.reached_optimal = round(self.final_cost, 4) <= self.optimal_target
         
         return result
     
     def end_condition(self):
         # Tu condición original: parar al alcanzar el óptimo O al llegar a max_iterations
-        current_cost = self.cost(self.best_solution)
-        self.convergence_history.append(current_cost)
+        # (se usa el costo en caché en lugar de recalcularlo en cada iteración)
+        current_cost = self.best_cost
         return round(current_cost, 4) <= self.optimal_target or self.it >= self.max_iterations
 
 
@@ -50,8 +56,13 @@ class StatisticalTSPTest(unittest.TestCase):
         self.default_iterations = 1000
         self.nodes = TSPParser.parse_tsp_file("./berlin52.tsp")
         self.optimal_cost = 7544.3659
-        self.results = []
         self.runs_per_config = 5  # Número de corridas por configuración
+        # Los resultados y las historias de convergencia se escriben por lotes
+        # en Parquet a medida que terminan las corridas; el nombre incluye el
+        # test y un sufijo aleatorio para que dos tests no compartan archivo
+        test_name = self.id().rsplit('.', 1)[-1]
+        self.results_file = f"statistical_tsp_results_{test_name}_{uuid.uuid4().hex[:8]}.parquet"
+        self.writer = ColumnarWriter(self.results_file)
         
     def run_multiple_times(self, params, test_name):
         """Ejecuta múltiples corridas de una configuración"""
@@ -89,12 +100,12 @@ class StatisticalTSPTest(unittest.TestCase):
                 'iterations_used': acs.it,
                 'reached_optimal': acs.reached_optimal,
                 'gap_percentage': gap_percentage,
-                'convergence_history': acs.convergence_history.copy(),
                 'timestamp': datetime.now().isoformat()
             }
             
+            # La historia de convergencia solo se guarda en el archivo, no en memoria
+            self.writer.write({**result, 'convergence_history': acs.convergence_history})
             results.append(result)
-            self.results.append(result)
             
             # Mensaje como en tu test original, pero con más info
             status = "ÓPTIMO ALCANZADO" if acs.reached_optimal else "MAX ITERACIONES"
@@ -225,20 +236,19 @@ class StatisticalTSPTest(unittest.TestCase):
 
     def tearDown(self):
         """Guarda los resultados al finalizar"""
-        if hasattr(self, 'results') and self.results:
-            filename = f"statistical_tsp_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(filename, 'w') as f:
-                json.dump(self.results, f, indent=2)
-            
+        self.writer.close()
+        filename = self.results_file
+        if Path(filename).exists():
+            # Resumen por parámetro (solo se leen las columnas necesarias)
+            df = read_columns(filename, ['colony_size', 'alpha', 'beta', 'q0',
+                                         'final_cost', 'iterations_used', 'reached_optimal'])
+
             print(f"\n" + "="*60)
             print("RESUMEN FINAL")
             print("="*60)
-            print(f"Total de experimentos: {len(self.results)}")
+            print(f"Total de experimentos: {len(df)}")
             print(f"Resultados guardados en: {filename}")
             
-            # Resumen por parámetro
-            df = pd.DataFrame(self.results)
-            
             for param in ['colony_size', 'alpha', 'beta', 'q0']:
                 if param in df.columns:
                     param_summary = df.groupby(param).agg({
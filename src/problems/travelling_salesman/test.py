@@ -6,7 +6,7 @@ import src.utils.tsp_parser as TSPParser
 
 class ModdifiedAntColonySystem(ACS.AntColonySystem):
     def end_condition(self):
-        return round(self.cost(self.best_solution), 4) <= 7544.3659 or self.it >= self.max_iterations
+        return round(self.best_cost, 4) <= 7544.3659 or self.it >= self.max_iterations
 
 
 class TravellingSalesmanTest(unittest.TestCase):
@@ -0,0 +1,158 @@
+import math
+import tempfile
+import unittest
+from pathlib import Path
+import numpy as np
+
+from src.utils.tsp_parser import parse_tsp_file, read_tsplib
+
+
+def tsp_text(dimension, edge_weight_type, section, body, extra=""):
+    return (f"NAME: test\nTYPE: TSP\nDIMENSION: {dimension}\n"
+            f"EDGE_WEIGHT_TYPE: {edge_weight_type}\n{extra}{section}\n{body}\nEOF\n")
+
+
+def geo_distance(a, b):
+    """Distancia GEO de TSPLIB escrita directamente a partir de su definición."""
+    def radians(x):
+        deg = int(x)
+        return 3.141592 * (deg + 5.0 * (x - deg) / 3.0) / 180.0
+
+    lat_a, lon_a = radians(a[0]), radians(a[1])
+    lat_b, lon_b = radians(b[0]), radians(b[1])
+    q1 = math.cos(lon_a - lon_b)
+    q2 = math.cos(lat_a - lat_b)
+    q3 = math.cos(lat_a + lat_b)
+    return int(6378.388 * math.acos(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3)) + 1.0)
+
+
+class TSPParserTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+
+    def write(self, text, name="test.tsp"):
+        path = self.dir / name
+        path.write_text(text)
+        return path
+
+    def distances(self, text):
+        return read_tsplib(self.write(text))["distances"].tolist()
+
+
+class TestEdgeWeightTypes(TSPParserTestCase):
+    # (0, 0), (3, 4), (6, 0.5): euclidiana 5, 6.0208, 4.6098
+    COORDS_2D = "1 0 0\n2 3 4\n3 6 0.5"
+
+    def test_euc_2d(self):
+        self.assertEqual(self.distances(tsp_text(3, "EUC_2D", "NODE_COORD_SECTION", self.COORDS_2D)),
+                         [[0, 5, 6], [5, 0, 5], [6, 5, 0]])
+
+    def test_ceil_2d(self):
+        self.assertEqual(self.distances(tsp_text(3, "CEIL_2D", "NODE_COORD_SECTION", self.COORDS_2D)),
+                         [[0, 5, 7], [5, 0, 5], [7, 5, 0]])
+
+    def test_man_2d(self):
+        # 3 + 4 = 7, 6 + 0.5 = 6.5 -> 7, 3 + 3.5 = 6.5 -> 7
+        self.assertEqual(self.distances(tsp_text(3, "MAN_2D", "NODE_COORD_SECTION", self.COORDS_2D)),
+                         [[0, 7, 7], [7, 0, 7], [7, 7, 0]])
+
+    def test_max_2d(self):
+        # max(3, 4) = 4, max(6, 0.5) = 6, max(3, 3.5) = 3.5 -> 4
+        self.assertEqual(self.distances(tsp_text(3, "MAX_2D", "NODE_COORD_SECTION", self.COORDS_2D)),
+                         [[0, 4, 6], [4, 0, 4], [6, 4, 0]])
+
+    def test_euc_3d(self):
+        # (0, 0, 0), (1, 2, 2), (2, 3, 6): 3, 7, sqrt(18) = 4.24 -> 4
+        text = tsp_text(3, "EUC_3D", "NODE_COORD_SECTION", "1 0 0 0\n2 1 2 2\n3 2 3 6",
+                        extra="NODE_COORD_TYPE: THREED_COORDS\n")
+        self.assertEqual(self.distances(text), [[0, 3, 7], [3, 0, 4], [7, 4, 0]])
+
+    def test_att(self):
+        # sqrt(2500 / 10) = 15.81 -> 16; sqrt(100 / 10) = 3.16 -> 3 < 3.16 -> 4;
+        # sqrt(2000 / 10) = 14.14 -> 14 < 14.14 -> 15
+        text = tsp_text(3, "ATT", "NODE_COORD_SECTION", "1 0 0\n2 30 40\n3 10 0")
+        self.assertEqual(self.distances(text), [[0, 16, 4], [16, 0, 15], [4, 15, 0]])
+
+    def test_geo(self):
+        coords = [(16.47, 96.10), (20.09, 94.55), (-12.30, -45.15)]
+        body = "\n".join(f"{i + 1} {x} {y}" for i, (x, y) in enumerate(coords))
+        expected = [[0 if i == j else geo_distance(a, b) for j, b in enumerate(coords)]
+                    for i, a in enumerate(coords)]
+        self.assertEqual(self.distances(tsp_text(3, "GEO", "NODE_COORD_SECTION", body)), expected)
+
+    def test_unsupported_type(self):
+        with self.assertRaises(ValueError):
+            read_tsplib(self.write(tsp_text(3, "XRAY1", "NODE_COORD_SECTION", self.COORDS_2D)))
+
+
+class TestExplicit(TSPParserTestCase):
+    MATRIX = [[0, 1, 2], [1, 0, 3], [2, 3, 0]]
+    FORMATS = {
+        "FULL_MATRIX": "0 1 2\n1 0 3\n2 3 0",
+        "UPPER_ROW": "1 2\n3",
+        "LOWER_ROW": "1\n2 3",
+        "UPPER_DIAG_ROW": "0 1 2\n0 3\n0",
+        "LOWER_DIAG_ROW": "0\n1 0\n2 3 0",
+        "UPPER_COL": "1\n2 3",
+        "LOWER_COL": "1 2\n3",
+        "UPPER_DIAG_COL": "0\n1 0\n2 3 0",
+        "LOWER_DIAG_COL": "0 1 2\n0 3\n0",
+    }
+
+    def explicit(self, edge_weight_format, body, trailer=""):
+        return tsp_text(3, "EXPLICIT", "EDGE_WEIGHT_SECTION", body + trailer,
+                        extra=f"EDGE_WEIGHT_FORMAT: {edge_weight_format}\n")
+
+    def test_formats(self):
+        for edge_weight_format, body in self.FORMATS.items():
+            with self.subTest(edge_weight_format=edge_weight_format):
+                self.assertEqual(self.distances(self.explicit(edge_weight_format, body)), self.MATRIX)
+
+    def test_extra_values_are_rejected(self):
+        for edge_weight_format, body in self.FORMATS.items():
+            with self.subTest(edge_weight_format=edge_weight_format):
+                with self.assertRaisesRegex(ValueError, "más valores"):
+                    read_tsplib(self.write(self.explicit(edge_weight_format, body + " 7")))
+
+    def test_missing_values_are_rejected(self):
+        with self.assertRaisesRegex(ValueError, "incompleta"):
+            read_tsplib(self.write(self.explicit("FULL_MATRIX", "0 1 2\n1 0 3\n2 3")))
+
+    def test_display_data_section_is_not_a_weight(self):
+        text = self.explicit("FULL_MATRIX", self.FORMATS["FULL_MATRIX"],
+                             "\nDISPLAY_DATA_SECTION\n1 0 0\n2 1 1\n3 2 2")
+        instance = read_tsplib(self.write(text))
+        self.assertEqual(instance["distances"].tolist(), self.MATRIX)
+        self.assertIsNone(instance["coordinates"])
+
+
+class TestSections(TSPParserTestCase):
+    def test_metadata_and_known_optimum(self):
+        text = ("NAME : berlin52\nCOMMENT : 52 locations in Berlin (Groetschel)\nTYPE : TSP\n"
+                "DIMENSION : 3\nEDGE_WEIGHT_TYPE : EUC_2D\nNODE_COORD_SECTION\n"
+                "  1 565.0 575.0\n  2 25.0 185.0\n\n  3 345.0 750.0\nEOF\n")
+        instance = read_tsplib(self.write(text))
+        self.assertEqual(instance["name"], "berlin52")
+        self.assertEqual(instance["optimal"], 7542)
+        np.testing.assert_array_equal(instance["coordinates"],
+                                      [[565, 575], [25, 185], [345, 750]])
+
+    def test_parse_tsp_file_without_eof(self):
+        path = self.write("NAME: x\nDIMENSION: 2\nNODE_COORD_SECTION\n1 1.5 2\n2 3 4\n")
+        np.testing.assert_array_equal(parse_tsp_file(path), [[1.5, 2], [3, 4]])
+
+    def test_coordinates_must_match_dimension(self):
+        with self.assertRaisesRegex(ValueError, "incompleta"):
+            read_tsplib(self.write(tsp_text(3, "EUC_2D", "NODE_COORD_SECTION", "1 0 0\n2 3 4")))
+        with self.assertRaisesRegex(ValueError, "más valores"):
+            read_tsplib(self.write(tsp_text(2, "EUC_2D", "NODE_COORD_SECTION", "1 0 0\n2 3 4\n3 1 1")))
+
+    def test_missing_dimension(self):
+        with self.assertRaises(ValueError):
+            read_tsplib(self.write("NAME: x\nNODE_COORD_SECTION\n1 0 0\nEOF\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+"""Exportación incremental de resultados a formato columnar (Parquet / Arrow IPC).
+
+Los resultados se acumulan en lotes pequeños y cada lote se escribe como
+un row group (Parquet) o record batch (Arrow IPC), por lo que nunca se
+mantiene el archivo completo en memoria. Las columnas indicadas en
+`array_columns` (p. ej. la historia de convergencia) se guardan como
+listas de float64 tipadas en lugar de JSON.
+
+Requiere `pyarrow` (dependencia opcional: `pip install .[dev]`).
+"""
+
+from pathlib import Path
+from typing import Any, Iterable
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - depende del entorno
+    pa = None
+
+
+# Lotes que se acumulan como máximo esperando el tipo de una columna que solo tiene None
+MAX_DEFERRED_BATCHES = 16
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "Se requiere pyarrow para exportar en formato columnar: pip install pyarrow")
+
+
+def _format_for(path: Path) -> str:
+    return "arrow" if path.suffix in (".arrow", ".feather", ".ipc") else "parquet"
+
+
+class ColumnarWriter:
+    """
+    Escritor incremental de filas (diccionarios) a Parquet o Arrow IPC.
+
+    El formato se elige por la extensión: `.arrow`, `.feather` o `.ipc`
+    para Arrow IPC y cualquier otra para Parquet. Si no se indica
+    `schema`, se infiere del primer lote (mientras alguna columna sea
+    solo None se siguen acumulando filas, hasta `MAX_DEFERRED_BATCHES`
+    lotes). Un lote posterior cuyo tipo no cabe en el esquema (p. ej. un
+    float en una columna entera) produce `TypeError` en lugar de
+    convertirse con pérdida.
+
+    Usage:
+        with ColumnarWriter("resultados.parquet") as writer:
+            writer.write({"run": 0, "cost": 7544.4, "convergence_history": history})
+    """
+
+    def __init__(self, path: Path | str, batch_size: int = 256,
+                 array_columns: Iterable[str] = ("convergence_history",),
+                 schema: "pa.Schema | None" = None):
+        _require_pyarrow()
+        self.path = Path(path)
+        self.format = _format_for(self.path)
+        self.batch_size = batch_size
+        self.array_columns = set(array_columns)
+        self.schema = schema
+        self._writer = None
+        self._rows: list[dict[str, Any]] = []
+
+    def _infer_schema(self, rows: list[dict[str, Any]]):
+        inferred = pa.Table.from_pylist(
+            [{k: v for k, v in row.items() if k not in self.array_columns} for row in rows]).schema
+        fields = list(inferred)
+        for name in rows[0]:
+            if name in self.array_columns:
+                fields.append(pa.field(name, pa.list_(pa.float64())))
+        # Mantener el orden de columnas de las filas
+        order = {name: i for i, name in enumerate(rows[0])}
+        return pa.schema(sorted(fields, key=lambda f: order.get(f.name, len(order))))
+
+    def _check_schema(self, rows: list[dict[str, Any]]) -> None:
+        inferred = self._infer_schema(rows)
+        extra = [name for name in inferred.names if name not in self.schema.names]
+        try:
+            unified = pa.unify_schemas([self.schema, inferred], promote_options="permissive")
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as exc:
+            raise TypeError(f"El lote no es compatible con el esquema de {self.path}: {exc}") from exc
+        changed = [field.name for field in self.schema if unified.field(field.name).type != field.type]
+        if extra or changed:
+            raise TypeError(
+                f"El lote no es compatible con el esquema de {self.path} "
+                f"(columnas nuevas: {extra}, tipos distintos: {changed}); "
+                "indica el esquema completo con `schema=`")
+
+    def write(self, row: dict[str, Any]) -> None:
+        """Agrega una fila; se escribe al disco al completar un lote."""
+        self._rows.append({
+            key: np.asarray(value, dtype=np.float64) if key in self.array_columns else value
+            for key, value in row.items()
+        })
+        if len(self._rows) % self.batch_size == 0:
+            self.flush()
+
+    def flush(self, final: bool = False) -> None:
+        if not self._rows:
+            return
+        if self._writer is None:
+            if self.schema is None:
+                schema = self._infer_schema(self._rows)
+                pending_nulls = any(pa.types.is_null(field.type) for field in schema)
+                if pending_nulls and not final and \
+                        len(self._rows) < MAX_DEFERRED_BATCHES * self.batch_size:
+                    return
+                self.schema = schema
+            else:
+                self._check_schema(self._rows)
+            if self.format == "arrow":
+                self._writer = ipc.new_file(str(self.path), self.schema)
+            else:
+                self._writer = pq.ParquetWriter(str(self.path), self.schema)
+        else:
+            self._check_schema(self._rows)
+
+        self._writer.write_table(
+            pa.Table.from_pylist(self._rows, schema=self.schema))
+        self._rows = []
+
+    def close(self) -> None:
+        self.flush(final=True)
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def read_columns(path: Path | str, columns: list[str] | None = None):
+    """
+    Lee solo las columnas indicadas de un archivo Parquet o Arrow IPC.
+
+    Args:
+        path: Ruta al archivo.
+        columns: Columnas a leer (todas si es None).
+
+    Returns:
+        pandas.DataFrame: Resultados leídos.
+    """
+    _require_pyarrow()
+    path = Path(path)
+    if _format_for(path) == "arrow":
+        with pa.memory_map(str(path), "r") as source:
+            table = ipc.open_file(source).read_all()
+        if columns is not None:
+            table = table.select(columns)
+    else:
+        table = pq.read_table(str(path), columns=columns)
+    return table.to_pandas()
@@ -0,0 +1,144 @@
+"""Generadores de instancias sintéticas reproducibles.
+
+Las instancias se escriben por bloques de `CHUNK` filas, por lo que
+generar 10⁵–10⁶ elementos toma segundos y no requiere mantener el texto
+en memoria. Con la misma semilla se obtiene siempre el mismo archivo.
+
+- TSP: coordenadas enteras `EUC_2D` en formato TSPLIB, uniformes en
+  [0, size) o agrupadas alrededor de n/100 centros (como en el DIMACS TSP
+  Challenge).
+- Mochila: clases de Pisinger no correlacionada (1), débilmente (2) y
+  fuertemente correlacionada (3), en el formato de `knapack_parser`.
+- N-Reinas: escalera de tamaños como trabajos JSONL para `batch`.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Iterator
+import numpy as np
+import numpy.typing as npt
+from src.problems.knapsack.bounds import knapsack_bounds
+
+CHUNK = 100_000
+
+TSP_KINDS = ("uniform", "clustered")
+# Clase de Pisinger -> número usado en el nombre `knapPI_<clase>_<n>_<R>_<i>`
+KNAPSACK_KINDS = {"uncorrelated": 1, "weakly_correlated": 2, "strongly_correlated": 3}
+
+
+def tsp_coordinates(n: int, seed: int, kind: str = "uniform", size: int = 1_000_000) -> Iterator[npt.NDArray[np.int64]]:
+    """Coordenadas enteras de `n` ciudades en bloques de a lo más `CHUNK` filas."""
+    if kind not in TSP_KINDS:
+        raise ValueError(f"kind debe ser uno de {TSP_KINDS}, se recibió {kind!r}")
+    rng = np.random.default_rng(seed)
+    if kind == "clustered":
+        centers = rng.uniform(0, size, (max(1, n // 100), 2))
+        sigma = size / np.sqrt(n)
+    for start in range(0, n, CHUNK):
+        m = min(CHUNK, n - start)
+        if kind == "uniform":
+            points = rng.uniform(0, size, (m, 2))
+        else:
+            points = centers[rng.integers(0, len(centers), m)] + rng.normal(0, sigma, (m, 2))
+        yield np.clip(np.rint(points), 0, size - 1).astype(np.int64)
+
+
+def write_tsp(path: Path | str, n: int, seed: int, kind: str = "uniform", size: int = 1_000_000) -> None:
+    """Escribe una instancia TSPLIB `EUC_2D` de `n` ciudades."""
+    path = Path(path)
+    with open(path, "w") as file:
+        file.write(f"NAME: {path.stem}\n")
+        file.write(f"COMMENT: {kind} n={n} seed={seed}\n")
+        file.write("TYPE: TSP\n")
+        file.write(f"DIMENSION: {n}\n")
+        file.write("EDGE_WEIGHT_TYPE: EUC_2D\n")
+        file.write("NODE_COORD_SECTION\n")
+        index = 1
+        for coords in tsp_coordinates(n, seed, kind, size):
+            ids = np.arange(index, index + len(coords), dtype=np.int64)
+            np.savetxt(file, np.column_stack([ids, coords]), fmt="%d")
+            index += len(coords)
+        file.write("EOF\n")
+
+
+def knapsack_items(n: int, seed: int, kind: str = "uncorrelated", r: int = 1000) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """Precios y pesos de una instancia de Pisinger con coeficientes en [1, r].
+
+    - uncorrelated: precio uniforme en [1, r].
+    - weakly_correlated: precio = peso ± r/10 (al menos 1).
+    - strongly_correlated: precio = peso + r/10.
+    """
+    if kind not in KNAPSACK_KINDS:
+        raise ValueError(f"kind debe ser uno de {tuple(KNAPSACK_KINDS)}, se recibió {kind!r}")
+    rng = np.random.default_rng(seed)
+    pesos = rng.integers(1, r + 1, n)
+    if kind == "uncorrelated":
+        precios = rng.integers(1, r + 1, n)
+    elif kind == "weakly_correlated":
+        precios = np.maximum(pesos + rng.integers(-(r // 10), r // 10 + 1, n), 1)
+    else:
+        precios = pesos + r // 10
+    return precios, pesos
+
+
+def write_knapsack(path: Path | str, n: int, seed: int, kind: str = "uncorrelated", r: int = 1000,
+                   count: int = 1, exact: bool = True) -> list[dict[str, Any]]:
+    """Escribe `count` instancias de la mochila en el formato de `knapack_parser`.
+
+    Como en Pisinger, la instancia i (de 1 a `count`) tiene capacidad
+    i / (count + 1) de la suma de los pesos. La línea `z` se escribe solo
+    si el óptimo se pudo demostrar (greedy = cota o programación dinámica
+    con `exact`); si no, se escribe `bound` con la cota de Dantzig, que
+    el parser ignora, y `z` queda desconocido. La columna de la solución
+    óptima se escribe en 0.
+
+    Returns:
+        Por instancia: title, n, c, z (None si no se demostró el óptimo)
+        y bound (la cota superior).
+    """
+    summary = []
+    with open(path, "w") as file:
+        for i in range(1, count + 1):
+            precios, pesos = knapsack_items(n, seed + i - 1, kind, r)
+            c = int(pesos.sum() * i // (count + 1))
+            bounds = knapsack_bounds(precios, pesos, c, exact=exact)
+            title = f"knapPI_{KNAPSACK_KINDS[kind]}_{n}_{r}_{i}"
+            z_line = f"z {bounds.upper}" if bounds.exact else f"bound {bounds.upper}"
+            file.write(f"{title}\nn {n}\nc {c}\n{z_line}\ntime 0.00\n")
+            for start in range(0, n, CHUNK):
+                stop = min(start + CHUNK, n)
+                rows = np.column_stack([np.arange(start + 1, stop + 1), precios[start:stop],
+                                        pesos[start:stop], np.zeros(stop - start, dtype=np.int64)])
+                np.savetxt(file, rows, fmt="%d,%d,%d,%d")
+            file.write("-----\n\n")
+            summary.append({"title": title, "n": n, "c": c,
+                            "z": bounds.upper if bounds.exact else None, "bound": bounds.upper})
+    return summary
+
+
+def nqueen_ladder(max_n: int, min_n: int = 8, factor: float = 2.0) -> list[int]:
+    """Tamaños min_n, min_n·factor, ... hasta max_n (incluido)."""
+    sizes = []
+    n = float(min_n)
+    while round(n) < max_n:
+        if not sizes or round(n) != sizes[-1]:
+            sizes.append(round(n))
+        n *= factor
+    sizes.append(max_n)
+    return sizes
+
+
+def write_nqueen_ladder(path: Path | str, sizes: list[int], seeds: int = 1, seed: int = 1,
+                        **params: Any) -> int:
+    """Escribe un trabajo JSONL de `batch` por cada (tamaño, semilla).
+
+    Returns:
+        Número de trabajos escritos.
+    """
+    jobs = 0
+    with open(path, "w") as file:
+        for n in sizes:
+            for k in range(seeds):
+                file.write(json.dumps({"solver": "n-queen", "seed": seed + k, "n": n, **params}) + "\n")
+                jobs += 1
+    return jobs
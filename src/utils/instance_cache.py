@@ -0,0 +1,141 @@
+"""Caché binaria en disco para instancias TSP y de la mochila.
+
+Las instancias parseadas se guardan como archivos `.npy` en un directorio
+identificado por el hash del contenido del archivo original, de modo que
+cualquier cambio en el archivo invalida la caché automáticamente. En las
+siguientes ejecuciones los arreglos se cargan con memory-mapping, sin
+volver a parsear el texto.
+
+El directorio raíz se puede cambiar con la variable de entorno
+`ALGOMETA_CACHE_DIR` (por defecto `~/.cache/algometa`).
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import numpy as np
+from pathlib import Path
+from src.utils.knapack_parser import KnapdackData, iter_knapack_instances
+from src.utils.tsp_parser import read_tsplib
+
+# Se incrementa si cambia el formato de los archivos guardados
+CACHE_VERSION = 2
+
+
+def default_cache_dir() -> Path:
+    """Retorna el directorio raíz de la caché."""
+    return Path(os.getenv("ALGOMETA_CACHE_DIR", Path.home() / ".cache" / "algometa"))
+
+
+def file_digest(path: Path) -> str:
+    """Calcula el hash BLAKE2b del contenido de un archivo."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as file:
+        while chunk := file.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def entry_dir(path: Path, kind: str, cache_dir: Path | None = None) -> Path:
+    """Directorio de la entrada de caché para un archivo y tipo de instancia."""
+    root = cache_dir if cache_dir is not None else default_cache_dir()
+    return root / f"{kind}-v{CACHE_VERSION}-{file_digest(path)}"
+
+
+def _store(entry: Path, arrays: dict[str, np.ndarray], meta: dict | None = None) -> None:
+    """Escribe los arreglos en un directorio temporal y lo renombra de forma atómica."""
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(dir=entry.parent, prefix=".tmp-"))
+    try:
+        for name, array in arrays.items():
+            np.save(tmp / f"{name}.npy", array)
+        if meta is not None:
+            with open(tmp / "meta.json", "w") as file:
+                json.dump(meta, file)
+        os.replace(tmp, entry)
+    except OSError:
+        # Otro proceso guardó la misma entrada primero
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def _load(entry: Path, name: str) -> np.ndarray:
+    return np.load(entry / f"{name}.npy", mmap_mode="r")
+
+
+def load_tsp(path: Path, cache_dir: Path | None = None) -> tuple[np.ndarray | None, np.ndarray]:
+    """
+    Carga las coordenadas y la matriz de distancias de un archivo TSP.
+
+    Args:
+        path: Ruta al archivo TSP.
+        cache_dir: Directorio raíz de la caché (opcional).
+
+    Returns:
+        tuple: (coordenadas, matriz de distancias), ambos memory-mapped si
+        provienen de la caché. Las coordenadas son None en instancias con
+        EDGE_WEIGHT_TYPE EXPLICIT.
+    """
+    entry = entry_dir(path, "tsp", cache_dir)
+    if not (entry / "distances.npy").exists():
+        instance = read_tsplib(path)
+        arrays = {"distances": instance["distances"]}
+        if instance["coordinates"] is not None:
+            arrays["coordinates"] = instance["coordinates"]
+        _store(entry, arrays)
+        if not (entry / "distances.npy").exists():
+            return instance["coordinates"], instance["distances"]
+
+    coordinates = _load(entry, "coordinates") if (entry / "coordinates.npy").exists() else None
+    return coordinates, _load(entry, "distances")
+
+
+def load_knapsack(path: Path, cache_dir: Path | None = None) -> list[KnapdackData]:
+    """
+    Carga todas las instancias de la mochila de un archivo.
+
+    Los ítems de todas las instancias se guardan concatenados en un único
+    arreglo por columna junto a los desplazamientos de cada instancia; cada
+    instancia retornada es una vista (memory-mapped) de esos arreglos.
+
+    Args:
+        path: Ruta al archivo de instancias.
+        cache_dir: Directorio raíz de la caché (opcional).
+
+    Returns:
+        list[KnapdackData]: Instancias del archivo.
+    """
+    entry = entry_dir(path, "knapsack", cache_dir)
+    if not (entry / "meta.json").exists():
+        instances = list(iter_knapack_instances(path))
+        columns = ("precios", "pesos", "solucion_optima")
+        arrays = {
+            column: np.concatenate([instance[column] for instance in instances])
+            if instances else np.empty(0, dtype=np.int64)
+            for column in columns
+        }
+        arrays["offsets"] = np.cumsum(
+            [0] + [len(instance["precios"]) for instance in instances])
+        meta = [{key: instance[key] for key in ("title", "n", "c", "z", "time")}
+                for instance in instances]
+        _store(entry, arrays, meta)
+        if not (entry / "meta.json").exists():
+            return instances
+
+    with open(entry / "meta.json", "r") as file:
+        meta = json.load(file)
+    offsets = np.load(entry / "offsets.npy")
+    precios = _load(entry, "precios")
+    pesos = _load(entry, "pesos")
+    solucion_optima = _load(entry, "solucion_optima")
+
+    return [
+        {
+            **info,
+            "precios": precios[offsets[k]:offsets[k + 1]],
+            "pesos": pesos[offsets[k]:offsets[k + 1]],
+            "solucion_optima": solucion_optima[offsets[k]:offsets[k + 1]],
+        }
+        for k, info in enumerate(meta)
+    ]
@@ -1,16 +1,19 @@
+from itertools import islice
 from pathlib import Path
-from typing import TypedDict, Any
+from typing import Iterator, TypedDict, Any
+import numpy as np
+import numpy.typing as npt
 
 
 class KnapdackData(TypedDict):
     title: str
     n: int
     c: int
-    z: int
+    z: int | None
     time: float
-    precios: list[int]
-    pesos: list[int]
-    solucion_optima: list[int]
+    precios: npt.NDArray[np.int64]
+    pesos: npt.NDArray[np.int64]
+    solucion_optima: npt.NDArray[np.int64]
 
 
 def default_knapack_data() -> KnapdackData:
@@ -18,20 +21,47 @@ def default_knapack_data() -> KnapdackData:
         "title": "",
         "n": 0,
         "c": 0,
-        "z": 0,
+        "z": None,
         "time": 0.0,
-        "precios": [],
-        "pesos": [],
-        "solucion_optima": []
+        "precios": np.empty(0, dtype=np.int64),
+        "pesos": np.empty(0, dtype=np.int64),
+        "solucion_optima": np.empty(0, dtype=np.int64)
     }
 
 
-def knapack_parser(path: Path) -> list[KnapdackData]:
-    meta_values: list[KnapdackData] = []
+def parse_items(lines: list[str]) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """Parsea en bloque las líneas `indice,precio,peso,x` de una instancia.
+
+    Returns:
+        Arreglos contiguos (precios, pesos, solucion_optima).
+    """
+    if not lines:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty.copy(), empty.copy()
+    items = np.loadtxt(lines, delimiter=",", dtype=np.int64,
+                       usecols=(1, 2, 3), ndmin=2)
+    return (np.ascontiguousarray(items[:, 0]),
+            np.ascontiguousarray(items[:, 1]),
+            np.ascontiguousarray(items[:, 2]))
+
+
+def iter_knapack_instances(path: Path) -> Iterator[KnapdackData]:
+    """Lee las instancias del archivo una a una.
+
+    A diferencia de `knapack_parser`, solo mantiene en memoria la instancia
+    actual, por lo que se puede empezar a resolver la primera instancia sin
+    leer el resto del archivo. La última instancia puede no terminar en
+    `-----`.
+
+    Raises:
+        ValueError: Si una instancia tiene ítems mal formados o menos de
+            `n`, o si el archivo termina antes de sus ítems.
+    """
     meta: KnapdackData = default_knapack_data()
+    has_items = False
 
     with open(path, "r") as file:
-        while (line := file.readline()):
+        for line in file:
             data = line.strip().split(" ")
             tag = data[0]
             value = data[1] if len(data) > 1 else ""
@@ -46,21 +76,29 @@ def knapack_parser(path: Path) -> list[KnapdackData]:
                 meta["z"] = int(value)
             if tag == "time":
                 meta["time"] = float(value)
-                pesos: list[int] = []
-                precios: list[int] = []
-                solucion_optima: list[int] = []
-
-                for _ in range(meta["n"]):
-                    line = file.readline()
-                    item_data = [int(x) for x in line.strip().split(",")]
-                    precios.append(item_data[1])
-                    pesos.append(item_data[2])
-                    solucion_optima.append(item_data[3])
+                block = list(islice(file, meta["n"]))
+                try:
+                    precios, pesos, solucion_optima = parse_items(block)
+                except ValueError as exc:
+                    raise ValueError(f"Ítems mal formados en la instancia {meta['title']}: {exc}") from exc
+                if len(precios) != meta["n"]:
+                    raise ValueError(
+                        f"La instancia {meta['title']} tiene {len(precios)} ítems, se esperaban {meta['n']}")
 
                 meta["pesos"] = pesos
                 meta["precios"] = precios
                 meta["solucion_optima"] = solucion_optima
+                has_items = True
             if tag == "-----":
-                meta_values.append(meta.copy())
+                yield meta
                 meta = default_knapack_data()
-    return meta_values
+                has_items = False
+
+    if has_items:
+        yield meta
+    elif meta["title"]:
+        raise ValueError(f"El archivo termina antes de los ítems de la instancia {meta['title']}")
+
+
+def knapack_parser(path: Path) -> list[KnapdackData]:
+    return list(iter_knapack_instances(path))
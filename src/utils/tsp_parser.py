@@ -1,7 +1,301 @@
 """Utilidades para parsear archivos TSP (Travelling Salesman Problem)."""
 
+import re
 import numpy as np
 from pathlib import Path
+from typing import TypedDict
+
+
+# Longitud del tour óptimo de algunas instancias de TSPLIB (con las
+# distancias enteras definidas por su EDGE_WEIGHT_TYPE)
+KNOWN_OPTIMA: dict[str, int] = {
+    "a280": 2579,
+    "att48": 10628,
+    "att532": 27686,
+    "bayg29": 1610,
+    "bays29": 2020,
+    "berlin52": 7542,
+    "burma14": 3323,
+    "ch130": 6110,
+    "ch150": 6528,
+    "d198": 15780,
+    "dantzig42": 699,
+    "eil51": 426,
+    "eil76": 538,
+    "eil101": 629,
+    "fri26": 937,
+    "gil262": 2378,
+    "gr17": 2085,
+    "gr24": 1272,
+    "kroA100": 21282,
+    "kroB100": 22141,
+    "kroC100": 20749,
+    "kroD100": 21294,
+    "kroE100": 22068,
+    "lin105": 14379,
+    "lin318": 42029,
+    "pcb442": 50778,
+    "pr76": 108159,
+    "pr1002": 259045,
+    "rat99": 1211,
+    "rat783": 8806,
+    "rd100": 7910,
+    "st70": 675,
+    "tsp225": 3916,
+    "ulysses16": 6859,
+    "ulysses22": 7013,
+}
+
+# Secciones de datos de TSPLIB; cualquier otra línea que comience con una
+# letra (metadatos, EOF) también termina la sección actual
+SECTIONS = {
+    "NODE_COORD_SECTION",
+    "EDGE_WEIGHT_SECTION",
+    "DISPLAY_DATA_SECTION",
+    "DEMAND_SECTION",
+    "DEPOT_SECTION",
+    "FIXED_EDGES_SECTION",
+    "TOUR_SECTION",
+}
+
+
+# Líneas que no son datos numéricos: encabezados de sección, `CLAVE: valor` y EOF
+_KEYWORD_LINE = re.compile(r"^[ \t]*[A-Za-z_][^\n]*", re.MULTILINE)
+
+
+class TSPInstance(TypedDict):
+    name: str
+    dimension: int
+    edge_weight_type: str
+    edge_weight_format: str | None
+    coordinates: np.ndarray | None
+    distances: np.ndarray
+    optimal: int | None
+
+
+def _read_sections(filename: Path) -> tuple[dict[str, str], dict[str, str]]:
+    """Separa el archivo en metadatos `CLAVE: valor` y el texto de cada sección.
+
+    El archivo se lee de una vez y solo se recorren en Python las líneas
+    de palabras clave (unas pocas); el texto de cada sección es el
+    fragmento entre su encabezado y la siguiente palabra clave, sin
+    dividirlo en líneas.
+    """
+    with open(filename, "r") as file:
+        text = file.read()
+
+    meta_data: dict[str, str] = {}
+    sections: dict[str, str] = {}
+    current: tuple[str, int] | None = None
+    for match in _KEYWORD_LINE.finditer(text):
+        if current is not None:
+            name, start = current
+            sections[name] = sections.get(name, "") + text[start:match.start()]
+            current = None
+        line = match.group().strip()
+        head, sep, value = line.partition(":")
+        head = head.strip()
+        if head in SECTIONS:
+            current = (head, match.end())
+        elif sep:
+            meta_data[head] = value.strip()
+    if current is not None:
+        name, start = current
+        sections[name] = sections.get(name, "") + text[start:]
+
+    return meta_data, sections
+
+
+def _nint(x: np.ndarray) -> np.ndarray:
+    """Redondeo al entero más cercano como lo define TSPLIB: (int)(x + 0.5)."""
+    return np.floor(x + 0.5)
+
+
+def _geo_radians(x: np.ndarray) -> np.ndarray:
+    """Convierte coordenadas GEO (DDD.MM) a radianes."""
+    pi = 3.141592
+    deg = np.trunc(x)
+    minutes = x - deg
+    return pi * (deg + 5.0 * minutes / 3.0) / 180.0
+
+
+def euclidean_distance_matrix(coordinates: np.ndarray) -> np.ndarray:
+    """
+    Calcula la matriz de distancias euclidianas entre todas las ciudades.
+
+    Args:
+        coordinates: Array de coordenadas (x, y) de las ciudades.
+
+    Returns:
+        np.ndarray: Matriz simétrica (n, n) de distancias.
+    """
+    diff = coordinates[:, np.newaxis, :] - coordinates[np.newaxis, :, :]
+    return np.sqrt(np.einsum("ijk,ijk->ij", diff, diff))
+
+
+def distance_matrix(coordinates: np.ndarray, edge_weight_type: str) -> np.ndarray:
+    """
+    Calcula la matriz de distancias según el EDGE_WEIGHT_TYPE de TSPLIB.
+
+    Args:
+        coordinates: Array de coordenadas de las ciudades.
+        edge_weight_type: EUC_2D, EUC_3D, CEIL_2D, MAN_2D, MAX_2D, ATT o GEO.
+
+    Returns:
+        np.ndarray: Matriz (n, n) de distancias.
+
+    Raises:
+        ValueError: Si el tipo de distancia no está soportado.
+    """
+    if edge_weight_type == "GEO":
+        latitude = _geo_radians(coordinates[:, 0])
+        longitude = _geo_radians(coordinates[:, 1])
+        q1 = np.cos(longitude[:, np.newaxis] - longitude[np.newaxis, :])
+        q2 = np.cos(latitude[:, np.newaxis] - latitude[np.newaxis, :])
+        q3 = np.cos(latitude[:, np.newaxis] + latitude[np.newaxis, :])
+        cosine = np.clip(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3), -1.0, 1.0)
+        distances = np.trunc(6378.388 * np.arccos(cosine) + 1.0)
+        np.fill_diagonal(distances, 0)
+        return distances
+
+    diff = np.abs(coordinates[:, np.newaxis, :] - coordinates[np.newaxis, :, :])
+    if edge_weight_type == "MAN_2D":
+        return _nint(diff[..., :2].sum(axis=-1))
+    if edge_weight_type == "MAX_2D":
+        return _nint(diff[..., :2].max(axis=-1))
+
+    squared = np.einsum("ijk,ijk->ij", diff, diff)
+    if edge_weight_type in ("EUC_2D", "EUC_3D"):
+        return _nint(np.sqrt(squared))
+    if edge_weight_type == "CEIL_2D":
+        return np.ceil(np.sqrt(squared))
+    if edge_weight_type == "ATT":
+        r = np.sqrt(squared / 10.0)
+        t = _nint(r)
+        return np.where(t < r, t + 1, t)
+
+    raise ValueError(f"EDGE_WEIGHT_TYPE no soportado: {edge_weight_type}")
+
+
+def explicit_distance_matrix(values: np.ndarray, dimension: int, edge_weight_format: str) -> np.ndarray:
+    """
+    Construye la matriz de distancias a partir de un EDGE_WEIGHT_SECTION.
+
+    Los formatos por columna (`*_COL`) recorren el triángulo opuesto en el
+    mismo orden que su equivalente por fila, por lo que en una matriz
+    simétrica son intercambiables.
+
+    Args:
+        values: Valores de la sección en el orden del archivo.
+        dimension: Número de ciudades.
+        edge_weight_format: FULL_MATRIX, UPPER_ROW, LOWER_ROW, UPPER_DIAG_ROW,
+            LOWER_DIAG_ROW, UPPER_COL, LOWER_COL, UPPER_DIAG_COL o LOWER_DIAG_COL.
+
+    Returns:
+        np.ndarray: Matriz (n, n) de distancias.
+
+    Raises:
+        ValueError: Si el formato no está soportado o la sección no tiene
+            exactamente los valores que corresponden a `dimension`.
+    """
+    n = dimension
+    if edge_weight_format == "FULL_MATRIX":
+        _check_size(values, n * n)
+        return values.reshape(n, n).astype(np.float64)
+
+    triangles = {
+        "UPPER_ROW": lambda: np.triu_indices(n, 1),
+        "LOWER_COL": lambda: np.triu_indices(n, 1),
+        "LOWER_ROW": lambda: np.tril_indices(n, -1),
+        "UPPER_COL": lambda: np.tril_indices(n, -1),
+        "UPPER_DIAG_ROW": lambda: np.triu_indices(n, 0),
+        "LOWER_DIAG_COL": lambda: np.triu_indices(n, 0),
+        "LOWER_DIAG_ROW": lambda: np.tril_indices(n, 0),
+        "UPPER_DIAG_COL": lambda: np.tril_indices(n, 0),
+    }
+    if edge_weight_format not in triangles:
+        raise ValueError(f"EDGE_WEIGHT_FORMAT no soportado: {edge_weight_format}")
+
+    rows, cols = triangles[edge_weight_format]()
+    _check_size(values, rows.size)
+    distances = np.zeros((n, n), dtype=np.float64)
+    distances[rows, cols] = values
+    distances[cols, rows] = values
+    return distances
+
+
+def _check_size(values: np.ndarray, expected: int) -> None:
+    if values.size < expected:
+        raise ValueError("EDGE_WEIGHT_SECTION incompleta")
+    if values.size > expected:
+        raise ValueError("EDGE_WEIGHT_SECTION tiene más valores que DIMENSION")
+
+
+def node_coordinates(values: np.ndarray, dimension: int, columns: int) -> np.ndarray:
+    """Coordenadas de las filas `indice x y [z]` de NODE_COORD_SECTION.
+
+    Raises:
+        ValueError: Si la sección no tiene exactamente `dimension` filas de `columns` valores.
+    """
+    if values.size < dimension * columns:
+        raise ValueError("NODE_COORD_SECTION incompleta")
+    if values.size > dimension * columns:
+        raise ValueError("NODE_COORD_SECTION tiene más valores que DIMENSION")
+    return np.ascontiguousarray(values.reshape(-1, columns)[:, 1:])
+
+
+def read_tsplib(filename: Path) -> TSPInstance:
+    """
+    Lee una instancia TSPLIB completa y calcula su matriz de distancias.
+
+    Cada sección numérica se convierte en un arreglo con una sola llamada
+    vectorizada, en lugar de procesar línea por línea.
+
+    Args:
+        filename: Ruta al archivo TSP.
+
+    Returns:
+        TSPInstance: Metadatos, coordenadas (si existen) y matriz de distancias.
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe.
+        ValueError: Si el formato del archivo no es válido.
+    """
+    meta_data, sections = _read_sections(filename)
+    if "DIMENSION" not in meta_data:
+        raise ValueError("El archivo TSP no define DIMENSION")
+
+    dimension = int(meta_data["DIMENSION"])
+    edge_weight_type = meta_data.get("EDGE_WEIGHT_TYPE", "EUC_2D")
+    edge_weight_format = meta_data.get("EDGE_WEIGHT_FORMAT")
+
+    coordinates = None
+    if "NODE_COORD_SECTION" in sections:
+        values = np.fromstring(sections["NODE_COORD_SECTION"], sep=" ")
+        columns = 4 if meta_data.get("NODE_COORD_TYPE") == "THREED_COORDS" else 3
+        coordinates = node_coordinates(values, dimension, columns)
+
+    if edge_weight_type == "EXPLICIT":
+        if "EDGE_WEIGHT_SECTION" not in sections:
+            raise ValueError("El archivo TSP no tiene EDGE_WEIGHT_SECTION")
+        values = np.fromstring(sections["EDGE_WEIGHT_SECTION"], sep=" ")
+        distances = explicit_distance_matrix(
+            values, dimension, edge_weight_format or "FULL_MATRIX")
+    elif coordinates is not None:
+        distances = distance_matrix(coordinates, edge_weight_type)
+    else:
+        raise ValueError("El archivo TSP no tiene NODE_COORD_SECTION")
+
+    name = meta_data.get("NAME", Path(filename).stem)
+    return {
+        "name": name,
+        "dimension": dimension,
+        "edge_weight_type": edge_weight_type,
+        "edge_weight_format": edge_weight_format,
+        "coordinates": coordinates,
+        "distances": distances,
+        "optimal": KNOWN_OPTIMA.get(name),
+    }
 
 
 def parse_tsp_file(filename: Path) -> np.ndarray:
@@ -18,30 +312,10 @@ def parse_tsp_file(filename: Path) -> np.ndarray:
         FileNotFoundError: Si el archivo no existe.
         ValueError: Si el formato del archivo no es válido.
     """
-    coordinates = []
-    meta_data = {}
-
-    def get_meta(line: str) -> str:
-        """Extrae el valor de una línea de metadatos del formato 'CLAVE: valor'."""
-        data = line.strip().split(": ")
-        return (data[0], data[1]) if len(data) == 2 else (line.strip(), None)
-
-    with open(filename, 'r') as file:
-        while (line := file.readline()):
-            tag, value = get_meta(line)
-            
-            if value:
-                meta_data[tag] = value
-                
-            if tag == "NODE_COORD_SECTION":
-                dimension = meta_data.get("DIMENSION", None)
-                for _ in range(int(dimension)):
-                    line = file.readline().strip()
-                    if not line:
-                        break
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        # Formato: índice x y
-                        _, x, y = parts[0], parts[1], parts[2]
-                        coordinates.append([float(x), float(y)])
-        return np.array([np.array(coord) for coord in coordinates])
+    meta_data, sections = _read_sections(filename)
+    if "NODE_COORD_SECTION" not in sections:
+        raise ValueError("El archivo TSP no tiene NODE_COORD_SECTION")
+
+    values = np.fromstring(sections["NODE_COORD_SECTION"], sep=" ")
+    dimension = int(meta_data.get("DIMENSION", values.size // 3))
+    return node_coordinates(values, dimension, 3)